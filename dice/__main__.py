@@ -0,0 +1,138 @@
+"""
+Command-line entry point for the dice package.
+
+- ``python -m dice`` (or ``python -m dice play``) starts the interactive
+  game from `dice.main`
+- ``python -m dice simulate`` plays computer-vs-computer games with no
+  terminal I/O and prints win rates, game length, score distributions and
+  throughput, for example::
+
+    python -m dice simulate --p1 hard --p2 mid --games 1000000 --workers 8
+
+- ``python -m dice tournament`` runs a round-robin or Swiss tournament
+  between AI levels, printing each match as it finishes and the final
+  table, for example::
+
+    python -m dice tournament easy mid hard optimal --format swiss
+
+- ``python -m dice migrate-stats`` copies the pickled player stats and
+  IDs into a SQLite database that ``play --stats-db`` then uses
+"""
+
+import argparse
+import sys
+from dice import stats_cache
+from dice.simulation import CHUNK_SIZE, LEVELS, simulate
+from dice.stats_db import STATS_DB_PATH, migrate
+from dice.tournament import FORMATS, GAMES_PER_MATCH, Entrant, Tournament
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the argument parser for the package entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m dice", description="Two-Dice Pig"
+    )
+    commands = parser.add_subparsers(dest="command")
+    play = commands.add_parser(
+        "play", help="play the interactive game (default)"
+    )
+    play.add_argument("--stats-db", metavar="PATH",
+                      help="keep player stats in this SQLite database")
+    sim = commands.add_parser(
+        "simulate", help="play AI-vs-AI games headlessly"
+    )
+    sim.add_argument("--p1", choices=LEVELS, default="hard",
+                     help="AI level of seat 1")
+    sim.add_argument("--p2", choices=LEVELS, default="mid",
+                     help="AI level of seat 2")
+    sim.add_argument("--games", type=int, default=10000,
+                     help="number of games to play")
+    sim.add_argument("--workers", type=int, default=1,
+                     help="worker processes")
+    sim.add_argument("--seed", type=int, help="root seed for reproducibility")
+    sim.add_argument("--chunk-size", type=int, default=CHUNK_SIZE,
+                     help="games per independently seeded chunk")
+    cup = commands.add_parser(
+        "tournament", help="run a tournament between AI levels"
+    )
+    cup.add_argument("levels", nargs="+", choices=LEVELS,
+                     help="AI level of each entrant; repeats are allowed")
+    cup.add_argument("--format", choices=FORMATS, default=FORMATS[0],
+                     help="pairing system")
+    cup.add_argument("--rounds", type=int,
+                     help="Swiss rounds, log2 of the field by default")
+    cup.add_argument("--games", type=int, default=GAMES_PER_MATCH,
+                     help="games per match")
+    cup.add_argument("--workers", type=int, default=1,
+                     help="worker processes")
+    cup.add_argument("--seed", type=int, help="root seed for reproducibility")
+    cup.add_argument("--save", action="store_true",
+                     help="add the results to the player statistics")
+    move = commands.add_parser(
+        "migrate-stats", help="copy the pickled stats into SQLite"
+    )
+    move.add_argument("--db", default=STATS_DB_PATH,
+                      help="database file to create or update")
+    return parser
+
+
+def run_tournament(args: argparse.Namespace) -> None:
+    """
+    Play a tournament and print its progress and final table.
+
+    Args:
+        args (Namespace): Parsed ``tournament`` arguments.
+    """
+    entrants = [
+        Entrant(f"{level}-{number}", level, f"ai-{level}-{number}")
+        for number, level in enumerate(args.levels, 1)
+    ]
+    tournament = Tournament(
+        entrants, args.format, args.games, args.rounds, args.seed
+    )
+    for report in tournament.play(args.workers):
+        first, second = (entrants[seat].name for seat in report.seats)
+        print(f"Round {report.round}: {first} {report.result.wins[0]}"
+              f"-{report.result.wins[1]} {second}")
+    print(tournament.table())
+    if args.save:
+        tournament.save(stats_cache.histogram())
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the command given on the command line.
+
+    Args:
+        argv (list): Arguments without the program name, defaults to
+        ``sys.argv[1:]``.
+
+    Returns:
+        int: Process exit status.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "simulate":
+        if args.games < 1 or args.workers < 1 or args.chunk_size < 1:
+            parser.error("--games, --workers and --chunk-size must be >= 1")
+        result = simulate(
+            (args.p1, args.p2), args.games, args.workers, args.seed,
+            args.chunk_size
+        )
+        print(result.report())
+        return 0
+    if args.command == "tournament":
+        if args.games < 1 or args.workers < 1 or (args.rounds or 1) < 1:
+            parser.error("--games, --workers and --rounds must be >= 1")
+        run_tournament(args)
+        return 0
+    if args.command == "migrate-stats":
+        print(f"Copied {migrate(args.db)} players into {args.db}")
+        return 0
+    from dice.main import Main  # pylint: disable=import-outside-toplevel
+    Main(getattr(args, "stats_db", None)).play()  # pragma: no cover
+    return 0  # pragma: no cover
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
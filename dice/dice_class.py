@@ -15,14 +15,22 @@ class Dice:
         6: "\u2685",  # ⚅
     }
 
-    def __init__(self, sides: int = 6) -> None:
-        """Initialize the die with a given number of sides (default is 6)."""
+    def __init__(self, sides: int = 6, rng: random.Random | None = None) -> None:
+        """
+        Initialize the die with a given number of sides (default is 6).
+
+        Args:
+            sides (int): Number of faces on the die.
+            rng (random.Random): Random stream to roll with, the global
+            `random` module is used when omitted.
+        """
         self.sides = sides
+        self.rng = rng if rng is not None else random
         self.value: int | None = None
 
     def roll(self) -> int:
         """Roll the die and return the result."""
-        self.value = random.randint(1, self.sides)
+        self.value = self.rng.randint(1, self.sides)
         return self.value
 
     def get_unicode(self) -> str:
@@ -1,37 +1,214 @@
 """Module for managing a pair of dice in the Two-Dice Pig game."""
 import sys
+from enum import IntEnum
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+import numpy as np
 from dice.dice_class import Dice
+from dice.rng import RngStream
 sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 
+class Outcome(IntEnum):
+    """Compact code for what a roll of two dice means for the turn."""
+
+    NORMAL = 0
+    REROLL = 1
+    BUST = 2
+    SNAKE_EYES = 3
+
+
+def _build_outcome_table() -> tuple[Mapping[str, object], ...]:
+    """
+    Build the read-only evaluation of all 36 (left, right) outcomes.
+
+    Returns:
+        tuple: Entries indexed by ``(left - 1) * 6 + (right - 1)``.
+    """
+    table = []
+    for left_value in range(1, 7):
+        for right_value in range(1, 7):
+            is_pair = left_value == right_value
+            is_single_one = (
+                1 in (left_value, right_value) and left_value != right_value
+            )
+            is_double_one = left_value == right_value == 1
+            must_reroll = is_pair and left_value != 1
+            if is_double_one:
+                outcome = Outcome.SNAKE_EYES
+            elif is_single_one:
+                outcome = Outcome.BUST
+            elif must_reroll:
+                outcome = Outcome.REROLL
+            else:
+                outcome = Outcome.NORMAL
+            table.append(MappingProxyType({
+                "face_values": (left_value, right_value),
+                "total": left_value + right_value,
+                "is_pair": is_pair,
+                "is_single_one": is_single_one,
+                "is_double_one": is_double_one,
+                "must_reroll": must_reroll,
+                "outcome": outcome,
+            }))
+    return tuple(table)
+
+
+OUTCOME_TABLE = _build_outcome_table()
+OUTCOMES = tuple(entry["outcome"] for entry in OUTCOME_TABLE)
+TOTALS = tuple(entry["total"] for entry in OUTCOME_TABLE)
+OUTCOME_CODES = np.array(
+    [entry["outcome"] for entry in OUTCOME_TABLE], dtype=np.uint8
+)
+
+
+class RollTape:
+    """
+    Buffer of pre-generated die faces served two at a time.
+
+    The faces are drawn in one bulk NumPy call into a `bytes` object and
+    the buffer is refilled lazily once every face has been used.
+    """
+
+    __slots__ = ("generator", "size", "sides", "faces", "position")
+
+    def __init__(
+            self, generator: np.random.Generator,
+            size: int = 65536,
+            sides: int = 6
+            ) -> None:
+        """
+        Initialize an empty tape; it is filled on the first roll.
+
+        Args:
+            generator (np.random.Generator): Generator to draw faces from.
+            size (int): Number of faces per fill, rounded up to an even number.
+            sides (int): Number of faces on each die.
+        """
+        self.generator = generator
+        self.size = size + size % 2
+        self.sides = sides
+        self.faces = b""
+        self.position = 0
+
+    def refill(self) -> None:
+        """Draw a fresh buffer of faces and rewind to its start."""
+        self.faces = self.generator.integers(
+            1, self.sides + 1, size=self.size, dtype=np.uint8
+        ).tobytes()
+        self.position = 0
+
+    def next_pair(self) -> tuple[int, int]:
+        """Return the next (left, right) faces, refilling when exhausted."""
+        position = self.position
+        if position >= len(self.faces):
+            self.refill()
+            position = 0
+        self.position = position + 2
+        faces = self.faces
+        return faces[position], faces[position + 1]
+
+
 class DiceHand:
     """Manages two dice and evaluates roll outcomes for Two-Dice Pig."""
 
-    def __init__(self) -> None:
-        """Initialize the DiceHand with two dice."""
-        self.left_die = Dice()
-        self.right_die = Dice()
+    def __init__(
+            self, rng: RngStream | None = None,
+            tape_size: int = 0
+            ) -> None:
+        """
+        Initialize the DiceHand with two dice.
+
+        Args:
+            rng (RngStream): Random stream shared by both dice, the global
+            `random` module is used when omitted.
+            tape_size (int): When positive, serve rolls from a `RollTape`
+            holding this many pre-generated faces.
+        """
+        self.rng = rng
+        self.left_die = Dice(rng=rng)
+        self.right_die = Dice(rng=rng)
+        self.tape: RollTape | None = None
+        if tape_size > 0:
+            self.use_tape(tape_size)
+
+    def use_tape(self, size: int = 65536) -> None:
+        """
+        Switch the hand to roll tape mode.
+
+        Args:
+            size (int): Number of faces generated per bulk refill.
+        """
+        if self.rng is not None:
+            generator = self.rng.generator
+        else:
+            generator = np.random.default_rng()
+        self.tape = RollTape(generator, size, self.left_die.sides)
 
     def roll(self) -> tuple[int, int]:
         """Roll both dice and return their values."""
+        if self.tape is not None:
+            left_value, right_value = self.tape.next_pair()
+            self.left_die.value = left_value
+            self.right_die.value = right_value
+            return left_value, right_value
         left_value = self.left_die.roll()
         right_value = self.right_die.roll()
         return left_value, right_value
 
-    def evaluate_roll(self) -> dict[str, object]:
-        """Evaluate the result of the roll according to game rules."""
+    def evaluate_roll(self) -> Mapping[str, object]:
+        """
+        Evaluate the result of the roll according to game rules.
+
+        The result is the shared, read-only entry of `OUTCOME_TABLE`
+        for the rolled pair, so no dictionary is built per roll.
+        """
         left_value, right_value = self.roll()
-        is_pair = left_value == right_value
+        return OUTCOME_TABLE[left_value * 6 + right_value - 7]
+
+    def roll_batch(
+            self, n: int,
+            generator: np.random.Generator | None = None
+            ) -> dict[str, np.ndarray]:
+        """
+        Roll both dice ``n`` times at once and evaluate every roll.
+
+        The returned arrays mirror the keys of `evaluate_roll`, so a
+        simulation can work on millions of rolls without a Python call
+        per roll. The interactive dice are left untouched.
+
+        Args:
+            n (int): Number of rolls to generate.
+            generator (np.random.Generator): Optional NumPy generator,
+            defaults to the generator of the hand's `RngStream`, or a
+            fresh unseeded one when the hand has no stream.
+
+        Returns:
+            dict: ``face_values`` (n x 2, uint8), ``total`` (int16), the
+            boolean arrays ``is_pair``, ``is_single_one``, ``is_double_one``
+            and ``must_reroll``, and ``outcome`` holding `Outcome` codes.
+        """
+        if generator is None:
+            if self.rng is not None:
+                generator = self.rng.generator
+            else:
+                generator = np.random.default_rng()
+        sides = self.left_die.sides
+        faces = generator.integers(1, sides + 1, size=(n, 2), dtype=np.uint8)
+        left = faces[:, 0]
+        right = faces[:, 1]
+        is_pair = left == right
+        left_one = left == 1
+        right_one = right == 1
         return {
-            "face_values": (left_value, right_value),
-            "total": left_value + right_value,
+            "face_values": faces,
+            "total": left.astype(np.int16) + right,
             "is_pair": is_pair,
-            "is_single_one": (
-                1 in (left_value, right_value) and left_value != right_value
-            ),
-            "is_double_one": left_value == right_value == 1,
-            "must_reroll": is_pair and left_value != 1,
+            "is_single_one": left_one ^ right_one,
+            "is_double_one": left_one & right_one,
+            "must_reroll": is_pair & ~left_one,
+            "outcome": OUTCOME_CODES[left * 6 + right - 7],
         }
 
     def display_dice(self) -> str:
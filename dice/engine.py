@@ -0,0 +1,289 @@
+"""
+Headless rules engine for Two-Dice Pig.
+
+This module provides the `GameEngine` class, a pure state machine for the
+game rules with no terminal I/O:
+
+- The state is the seat names, their scores, the seat to move, the turn
+  total and the turn phase, for any number of seats
+- Scores live in a compact ``array('i')`` indexed by seat; passing the
+  dice and checking for a winner only touch the seat that just played
+- Actions (`Action.ROLL`, `Action.HOLD`) and `next_turn` drive transitions
+- `roll_rules` holds the effect of one roll, so code that plays turns
+  without an engine, such as `dice.simulation`, follows the same rules
+- Every transition returns the `Event` records it produced and passes
+  them to any registered listeners
+
+The interactive `Game` is a front-end that reads input, feeds the engine
+and prints its events; simulations and servers drive the same engine at
+full speed.
+"""
+
+from array import array
+from enum import IntEnum
+from typing import Callable, Mapping, NamedTuple
+from dice.dice_hand import DiceHand, Outcome
+
+TARGET = 100
+
+
+class Action(IntEnum):
+    """A move the player to act can make."""
+
+    ROLL = 0
+    HOLD = 1
+
+
+class Phase(IntEnum):
+    """Where the current turn stands."""
+
+    MUST_ROLL = 0
+    MAY_HOLD = 1
+    TURN_OVER = 2
+    GAME_OVER = 3
+
+
+class EventKind(IntEnum):
+    """What an `Event` reports."""
+
+    TURN_START = 0
+    ROLL = 1
+    REROLL = 2
+    BUST = 3
+    SNAKE_EYES = 4
+    HOLD = 5
+    WIN = 6
+    RESTART = 7
+    RESUME = 8
+
+
+class Event(NamedTuple):
+    """One state change emitted by the engine."""
+
+    kind: EventKind
+    seat: int
+    turn_total: int
+    score: int
+    faces: tuple[int, int] | None = None
+
+
+Listener = Callable[[Event], None]
+ROLL_EVENTS = {
+    Outcome.NORMAL: EventKind.ROLL,
+    Outcome.REROLL: EventKind.REROLL,
+    Outcome.BUST: EventKind.BUST,
+    Outcome.SNAKE_EYES: EventKind.SNAKE_EYES,
+}
+
+
+def roll_rules(
+        outcome: Outcome,
+        total: int,
+        turn_total: int,
+        score: int
+        ) -> tuple[int, int, Phase]:
+    """
+    Apply one roll to a turn.
+
+    Args:
+        outcome (Outcome): The roll's outcome.
+        total (int): The sum of its faces.
+        turn_total (int): Points of the turn before the roll.
+        score (int): The roller's banked score.
+
+    Returns:
+        tuple: The turn total, banked score and phase after the roll.
+    """
+    if outcome == Outcome.NORMAL:
+        return turn_total + total, score, Phase.MAY_HOLD
+    if outcome == Outcome.REROLL:
+        return turn_total + total, score, Phase.MUST_ROLL
+    if outcome == Outcome.BUST:
+        return 0, score, Phase.TURN_OVER
+    return 0, 0, Phase.TURN_OVER
+
+
+class GameEngine:  # pylint: disable=too-many-instance-attributes
+    """State machine for one match of Two-Dice Pig."""
+
+    def __init__(
+            self, players: list[str],
+            dice_hand: DiceHand | None = None,
+            target: int = TARGET
+            ) -> None:
+        """
+        Initialize a match that has not started yet.
+
+        Args:
+            players (list): Seat names in turn order, at least two.
+            dice_hand (DiceHand): Dice used by `step`, a new hand when omitted.
+            target (int): Score needed to win.
+        """
+        if len(players) < 2:
+            raise ValueError("A match needs at least two seats")
+        self.players = players
+        self.dice_hand = dice_hand if dice_hand is not None else DiceHand()
+        self.target = target
+        self.scores = array("i", [0]) * len(players)
+        self.current = 0
+        self.turn_total = 0
+        self.phase = Phase.MUST_ROLL
+        self.winner: int | None = None
+        self.listeners: list[Listener] = []
+
+    @property
+    def current_name(self) -> str:
+        """Return the name of the seat to move."""
+        return self.players[self.current]
+
+    def leading_opponent(self, seat: int) -> int:
+        """Return the highest score among the seats other than ``seat``."""
+        return max(
+            score for other, score in enumerate(self.scores) if other != seat
+        )
+
+    def legal_actions(self) -> tuple[Action, ...]:
+        """Return the actions allowed in the current phase."""
+        if self.phase == Phase.MUST_ROLL:
+            return (Action.ROLL,)
+        if self.phase == Phase.MAY_HOLD:
+            return (Action.ROLL, Action.HOLD)
+        return ()
+
+    def _emit(self, events: list[Event], kind: EventKind,
+              faces: tuple[int, int] | None = None) -> None:
+        """Record an event for the current seat and notify listeners."""
+        event = Event(
+            kind, self.current, self.turn_total,
+            self.scores[self.current], faces
+        )
+        events.append(event)
+        for listener in self.listeners:
+            listener(event)
+
+    def reset(self, first: int = 0) -> list[Event]:
+        """
+        Start the match over with every score at zero.
+
+        Args:
+            first (int): Seat that takes the first turn.
+
+        Returns:
+            list: The emitted events.
+        """
+        self.scores = array("i", [0]) * len(self.players)
+        self.current = first
+        self.turn_total = 0
+        self.phase = Phase.MUST_ROLL
+        self.winner = None
+        events: list[Event] = []
+        self._emit(events, EventKind.RESTART)
+        self._emit(events, EventKind.TURN_START)
+        return events
+
+    def resume(
+            self, scores: list[int],
+            current: int,
+            turn_total: int,
+            phase: Phase,
+            winner: int | None = None
+            ) -> list[Event]:
+        """
+        Continue a saved match from the middle of a turn.
+
+        Args:
+            scores (list): Score of each seat.
+            current (int): Seat to move.
+            turn_total (int): Points of the turn in progress.
+            phase (Phase): Where that turn stands.
+            winner (int): Winning seat of a finished match.
+
+        Returns:
+            list: The emitted events.
+        """
+        if len(scores) != len(self.players):
+            raise ValueError("A score is needed for every seat")
+        self.scores = array("i", scores)
+        self.current = current
+        self.turn_total = turn_total
+        self.phase = phase
+        self.winner = winner
+        events: list[Event] = []
+        self._emit(events, EventKind.RESUME)
+        return events
+
+    def step(self, action: Action) -> list[Event]:
+        """
+        Apply an action, rolling the engine's own dice for `Action.ROLL`.
+
+        Args:
+            action (Action): The move to make.
+
+        Returns:
+            list: The emitted events.
+        """
+        if action == Action.HOLD:
+            return self.hold()
+        if Action.ROLL not in self.legal_actions():
+            raise ValueError(f"Cannot roll during {self.phase.name}")
+        return self.apply_roll(self.dice_hand.evaluate_roll())
+
+    def apply_roll(self, result: Mapping[str, object]) -> list[Event]:
+        """
+        Apply an already evaluated roll to the current turn.
+
+        Args:
+            result (Mapping): Roll evaluation with at least ``outcome`` and
+            ``total``, as returned by `DiceHand.evaluate_roll`.
+
+        Returns:
+            list: The emitted events.
+        """
+        events: list[Event] = []
+        outcome = result["outcome"]
+        self.turn_total, self.scores[self.current], self.phase = roll_rules(
+            outcome, result["total"], self.turn_total,
+            self.scores[self.current]
+        )
+        self._emit(events, ROLL_EVENTS[outcome], result.get("face_values"))
+        return events
+
+    def hold(self) -> list[Event]:
+        """
+        Bank the turn total for the current seat.
+
+        Returns:
+            list: The emitted events, ending with `EventKind.WIN` when the
+            banked score reaches the target.
+        """
+        if self.phase != Phase.MAY_HOLD:
+            raise ValueError(f"Cannot hold during {self.phase.name}")
+        events: list[Event] = []
+        self.scores[self.current] += self.turn_total
+        self.turn_total = 0
+        self._emit(events, EventKind.HOLD)
+        if self.scores[self.current] >= self.target:
+            self.winner = self.current
+            self.phase = Phase.GAME_OVER
+            self._emit(events, EventKind.WIN)
+        else:
+            self.phase = Phase.TURN_OVER
+        return events
+
+    def next_turn(self) -> list[Event]:
+        """
+        Pass the dice to the next seat and reset the turn total.
+
+        Returns:
+            list: The emitted events.
+        """
+        events: list[Event] = []
+        self.current = (self.current + 1) % len(self.players)
+        self.turn_total = 0
+        self.phase = Phase.MUST_ROLL
+        self._emit(events, EventKind.TURN_START)
+        return events
+
+    def rename(self, seat: int, name: str) -> None:
+        """Change the name shown for ``seat``."""
+        self.players[seat] = name
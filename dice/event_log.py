@@ -0,0 +1,324 @@
+"""
+Compact binary log of game events, with a replayer.
+
+This module provides the `EventLog` writer and the functions that read a
+log back:
+
+- Every record is one byte: a face pair (0-35, indexed like
+  `OUTCOME_TABLE`), a hold, a hand-over, or the seat count and first seat
+  that open a game; busts, snake eyes and wins follow from the rules
+- A resumed game opens like a new one, followed by a `RESUME` record
+  carrying the turn phase, every score and the turn total in 7-bit
+  pairs, so it never looks like the start of another game
+- Records are buffered in memory, written in large blocks and fsynced at
+  most every few seconds
+- `replay` rebuilds the `GameEngine` state of one game at any record,
+  `replay_results` re-runs whole logs without building engines
+
+A typical game costs around a hundred bytes.
+"""
+
+import os
+import re
+import struct
+import time
+from typing import Iterator
+from dice.dice_hand import OUTCOME_TABLE, OUTCOMES, TOTALS, Outcome
+from dice.engine import Event, EventKind, GameEngine, Phase, TARGET
+
+EVENT_LOG_PATH = "dice/events.log"
+MAGIC = b"PIGL"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")
+HOLD = 36
+NEXT_TURN = 37
+RESUME = 38
+START = 64
+SEATS = 128
+BUFFER_SIZE = 1 << 16
+FSYNC_SECONDS = 5.0
+READ_SIZE = 1 << 20
+GAME_START = re.compile(rb"[\x80-\xff]")
+
+
+def _pack_value(value: int) -> bytes:
+    """Return a score or turn total as two 7-bit bytes."""
+    if not 0 <= value < 1 << 14:
+        raise ValueError(f"Cannot log the value {value}")
+    return bytes((value & 0x7f, value >> 7))
+
+
+def _read_resume(
+        records: bytes,
+        position: int,
+        seats: int
+        ) -> tuple[Phase, list[int], int, int]:
+    """
+    Read the payload of a `RESUME` record.
+
+    Args:
+        records (bytes): One game's records.
+        position (int): Index of the byte after the `RESUME` code.
+        seats (int): Seats in the game.
+
+    Returns:
+        tuple: The phase, scores, turn total and the index after the
+        payload.
+    """
+    end = position + 1 + 2 * (seats + 1)
+    if end > len(records):
+        raise ValueError("Truncated resume record")
+    values = [records[index] | records[index + 1] << 7
+              for index in range(position + 1, end, 2)]
+    return Phase(records[position]), values[:-1], values[-1], end
+
+
+class EventLog:
+    """Append-only writer turning engine events into one-byte records."""
+
+    def __init__(
+            self, path: str,
+            target: int = TARGET,
+            fsync_seconds: float = FSYNC_SECONDS
+            ) -> None:
+        """
+        Initialize a log; the file is opened on the first flush.
+
+        Args:
+            path (str): Log file, created with a header when missing.
+            target (int): Winning score of the logged games.
+            fsync_seconds (float): Least time between two fsyncs.
+        """
+        self.path = path
+        self.target = target
+        self.fsync_seconds = fsync_seconds
+        self.buffer = bytearray()
+        self.file = None
+        self.last_sync = time.monotonic()
+        self.last_kind: EventKind | None = None
+
+    def attach(self, engine: GameEngine) -> None:
+        """Record every event ``engine`` emits from now on."""
+        engine.listeners.append(
+            lambda event: self.record(event, len(engine.players), engine)
+        )
+
+    def record(
+            self, event: Event,
+            seats: int,
+            engine: GameEngine | None = None
+            ) -> None:
+        """
+        Append the records for one engine event.
+
+        Args:
+            event (Event): The event to log.
+            seats (int): Seats in the event's match.
+            engine (GameEngine): The engine that emitted the event, needed
+            for `EventKind.RESUME`.
+        """
+        kind = event.kind
+        buffer = self.buffer
+        if kind in (EventKind.ROLL, EventKind.REROLL, EventKind.BUST,
+                    EventKind.SNAKE_EYES):
+            if event.faces is None:
+                raise ValueError("Cannot log a roll without its faces")
+            left, right = event.faces
+            buffer.append(left * 6 + right - 7)
+        elif kind == EventKind.HOLD:
+            buffer.append(HOLD)
+        elif kind == EventKind.TURN_START:
+            if self.last_kind != EventKind.RESTART:
+                buffer.append(NEXT_TURN)
+        elif kind == EventKind.RESTART:
+            buffer.append(SEATS + seats)
+            buffer.append(START + event.seat)
+        elif kind == EventKind.RESUME:
+            if engine is None:
+                raise ValueError("Cannot log a resumed game without its engine")
+            buffer.append(SEATS + seats)
+            buffer.append(START + event.seat)
+            buffer.append(RESUME)
+            buffer.append(engine.phase)
+            for value in (*engine.scores, engine.turn_total):
+                buffer += _pack_value(value)
+        self.last_kind = kind
+        if len(buffer) >= BUFFER_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered records, fsyncing if the interval has passed."""
+        if self.file is None:
+            self.file = open(self.path, "ab")  # pylint: disable=consider-using-with
+            if self.file.tell() == 0:
+                self.file.write(HEADER.pack(MAGIC, VERSION, self.target))
+        if self.buffer:
+            self.file.write(self.buffer)
+            self.buffer.clear()
+        if time.monotonic() - self.last_sync >= self.fsync_seconds:
+            self.sync()
+
+    def sync(self) -> None:
+        """Write buffered records and force them to disk."""
+        if self.file is None or self.buffer:
+            self.flush()
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Sync and close the file."""
+        if self.file is None and not self.buffer:
+            return
+        self.sync()
+        self.file.close()
+        self.file = None
+
+    def __enter__(self) -> "EventLog":
+        """Return the log for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the log when the ``with`` block ends."""
+        self.close()
+
+
+def read_header(path: str) -> int:
+    """
+    Check a log's header.
+
+    Args:
+        path (str): Log file.
+
+    Returns:
+        int: The target score of the logged games.
+    """
+    with open(path, "rb") as log:
+        magic, version, target = HEADER.unpack(log.read(HEADER.size))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} event log")
+    return target
+
+
+def iter_games(path: str) -> Iterator[bytes]:
+    """
+    Yield the records of each game in a log, reading in large blocks.
+
+    Args:
+        path (str): Log file.
+
+    Yields:
+        bytes: The records of one game, starting with its seat count.
+    """
+    read_header(path)
+    pending = b""
+    with open(path, "rb") as log:
+        log.seek(HEADER.size)
+        while True:
+            block = log.read(READ_SIZE)
+            if not block:
+                break
+            data = pending + block
+            start = 0
+            for match in GAME_START.finditer(data, 1):
+                yield data[start:match.start()]
+                start = match.start()
+            pending = data[start:]
+    if pending:
+        yield pending
+
+
+def replay(
+        records: bytes,
+        upto: int | None = None,
+        target: int = TARGET
+        ) -> GameEngine:
+    """
+    Rebuild the state of one logged game.
+
+    Args:
+        records (bytes): One game's records, as yielded by `iter_games`.
+        upto (int): Number of records to apply after the seat count, all
+        when omitted; a `RESUME` record and its payload count as one.
+        target (int): Winning score of the game.
+
+    Returns:
+        GameEngine: An engine in the state after the applied records.
+    """
+    if not records or records[0] < SEATS:
+        raise ValueError("A game must start with its seat count")
+    seats = records[0] - SEATS
+    engine = GameEngine([f"Seat {seat + 1}" for seat in range(seats)],
+                        target=target)
+    position = applied = 1
+    while position < len(records) and (upto is None or applied <= upto):
+        code = records[position]
+        position += 1
+        applied += 1
+        if code < HOLD:
+            engine.apply_roll(OUTCOME_TABLE[code])
+        elif code == HOLD:
+            engine.hold()
+        elif code == NEXT_TURN:
+            engine.next_turn()
+        elif code == RESUME:
+            phase, scores, turn_total, position = _read_resume(
+                records, position, seats
+            )
+            engine.resume(scores, engine.current, turn_total, phase,
+                          engine.current if phase == Phase.GAME_OVER else None)
+        elif START <= code < SEATS:
+            engine.reset(code - START)
+        else:
+            raise ValueError(f"Unknown record {code}")
+    return engine
+
+
+def replay_results(path: str) -> Iterator[tuple[int | None, int, list]]:
+    """
+    Re-run every game in a log with the rules inlined.
+
+    Args:
+        path (str): Log file.
+
+    Yields:
+        tuple: Winning seat (None if unfinished), turns played and final
+        scores of each game.
+    """
+    target = read_header(path)
+    outcomes, totals = OUTCOMES, TOTALS
+    for records in iter_games(path):
+        scores = [0] * (records[0] - SEATS)
+        seat = turn_total = 0
+        turns = 1
+        winner = None
+        position = 1
+        while position < len(records):
+            code = records[position]
+            position += 1
+            if code < HOLD:
+                outcome = outcomes[code]
+                if outcome == Outcome.SNAKE_EYES:
+                    scores[seat] = turn_total = 0
+                elif outcome == Outcome.BUST:
+                    turn_total = 0
+                else:
+                    turn_total += totals[code]
+            elif code == HOLD:
+                scores[seat] += turn_total
+                turn_total = 0
+                if scores[seat] >= target:
+                    winner = seat
+            elif code == NEXT_TURN:
+                seat = (seat + 1) % len(scores)
+                turns += 1
+            elif code == RESUME:
+                phase, scores, turn_total, position = _read_resume(
+                    records, position, len(scores)
+                )
+                if phase == Phase.GAME_OVER:
+                    winner = seat
+            else:
+                scores = [0] * len(scores)
+                seat, turn_total, turns, winner = code - START, 0, 1, None
+        yield winner, turns, scores
@@ -0,0 +1,75 @@
+"""
+Cross-process file locks and atomic file replacement.
+
+This module lets several game processes share the stats files safely:
+
+- `locked` holds an advisory lock on a ``.lock`` file next to the data
+  for the length of a read-modify-write cycle; ``fcntl.flock`` is used
+  on Unix and ``msvcrt.locking`` on Windows
+- `atomic_write` writes to a temporary file in the same folder, fsyncs
+  it and renames it over the target, so readers see either the old or
+  the new content and never a half-written file
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator
+
+WINDOWS = os.name == "nt"
+if WINDOWS:  # pragma: no cover
+    import msvcrt  # pylint: disable=import-error
+else:
+    import fcntl
+
+LOCK_SUFFIX = ".lock"
+
+
+@contextmanager
+def locked(path: str) -> Iterator[None]:
+    """
+    Hold an exclusive lock for ``path`` across processes.
+
+    Args:
+        path (str): The protected file; the lock file is this path with
+        `LOCK_SUFFIX` added.
+    """
+    # pylint: disable=possibly-used-before-assignment
+    with open(path + LOCK_SUFFIX, "a+b") as lock:
+        if WINDOWS:  # pragma: no cover
+            lock.seek(0)
+            msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if WINDOWS:  # pragma: no cover
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+
+def atomic_write(path: str, *chunks: bytes) -> None:
+    """
+    Replace ``path`` with ``chunks`` in one atomic step.
+
+    Args:
+        path (str): The file to replace.
+        chunks (bytes): The new content, written in order.
+    """
+    handle, temp = tempfile.mkstemp(
+        prefix=os.path.basename(path) + ".",
+        dir=os.path.dirname(path) or "."
+    )
+    try:
+        with os.fdopen(handle, "wb") as file:
+            for chunk in chunks:
+                file.write(chunk)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp, path)
+    except BaseException:
+        os.remove(temp)
+        raise
@@ -5,259 +5,323 @@
 """Main game controller for the Two-Dice Pig game."""
 
 from __future__ import annotations
+import os
 import sys
+import struct
 from pathlib import Path
 from dice.player import Player
+from dice.renderer import BufferedRenderer, Renderer
 from dice.intelligence import Intelligence
-from dice.histogram import Histogram
+from dice import stats_cache
+from dice.leaderboard import Leaderboard
 from dice.highscore import HighScore
 from dice.dice_hand import DiceHand
+from dice.engine import Event, EventKind, GameEngine, Phase
+from dice.event_log import EventLog
+from dice.file_lock import atomic_write
+from dice.mcts import MonteCarloSearch
+from dice.rng import RngStream
+from dice.snapshot import SNAPSHOT_PATH, dumps, loads
+from dice.stats_db import SqliteHistogram, SqlitePlayer, connect
 sys.path.append(str(Path(__file__).resolve().parent.parent))
 
+COMPUTER = "Jarvis AI"
+MAX_SEATS = 6
 
-class Game:
-    """Main game controller for Two-Dice Pig."""
 
-    def __init__(self) -> None:
-        """Initialize the game with players, scoring system, and dice mechanics."""
-        self.dice_hand = DiceHand()
+class Game:  # pylint: disable=too-many-public-methods
+    """
+    Main game controller for Two-Dice Pig.
+
+    The rules live in a `GameEngine` with one seat per participant; this
+    class reads terminal input, asks `Intelligence` for the computer seats
+    and prints the events the engine emits.
+    """
+
+    def __init__(
+            self, rng: RngStream | None = None,
+            event_log: EventLog | None = None,
+            renderer: Renderer | None = None,
+            stats_db: str | None = None
+            ) -> None:
+        """
+        Initialize the game with players, scoring system, and dice mechanics.
+
+        Args:
+            rng (RngStream): Random stream for this game's dice, a freshly
+            seeded stream is created when omitted so every game can be
+            replayed from `rng.entropy`.
+            event_log (EventLog): Optional log receiving every engine event.
+            renderer (Renderer): Sink for all output, a `BufferedRenderer`
+            when omitted.
+            stats_db (str): SQLite database for player IDs and stats; the
+            pickle files are used when omitted. Its rankings are kept
+            next to it, in the database path with ``.leaderboard`` added.
+        """
+        self.rng = rng if rng is not None else RngStream()
+        self.dice_hand = DiceHand(self.rng)
         self.ai_lvl = Intelligence()
-        self.player = Player()
-        self.histogram = Histogram()
+        if stats_db is not None:
+            connection = connect(stats_db)
+            self.player = SqlitePlayer(connection=connection)
+            self.histogram = SqliteHistogram(connection=connection)
+            self.leaderboard = Leaderboard(stats_db + ".leaderboard")
+            self.leaderboard.attach(self.histogram)
+        else:
+            self.player = Player()
+            self.histogram = stats_cache.histogram()
+            self.leaderboard = stats_cache.leaderboard()
         self.highscore: HighScore = HighScore()
-        self.pvp = ["Player 1", "Player 2"]
-        self.pvc = ["Player", "Jarvis AI"]
-        self.turn_total = 0
-        self.current_player_pvp = ""
-        self.current_player_pvc = ""
-        self.pvp_scores = {}
-        self.pvc_scores = {}
-
-    def switch_pvp(self) -> None:  # pragma: no cover
-        """Switch to the next player in PvP mode and reset the turn total."""
-        self.current_player_pvp = (
-            self.pvp[1]
-            if self.current_player_pvp == self.pvp[0]
-            else self.pvp[0]
+        self.engine = GameEngine(["Player 1", "Player 2"], self.dice_hand)
+        self.levels: list[str | None] = [None, None]
+        self.user_ids: list[str | None] = [None, None]
+        self.ai_states: list = [None, None]
+        self.ai_searches: list = [None, None]
+        self.renderer = renderer if renderer is not None else BufferedRenderer()
+        self.engine.listeners.append(
+            lambda event: self.renderer.event(event, self.engine)
         )
-        self.turn_total = 0
-
-    def switch_pvc(self) -> None:  # pragma: no cover
-        """Switch to the next participant in PvC mode and reset turn total."""
-        self.current_player_pvc = (
-            self.pvc[1]
-            if self.current_player_pvc == self.pvc[0]
-            else self.pvc[0]
+        self.event_log = event_log
+        if event_log is not None:
+            event_log.attach(self.engine)
+
+    def seat_players(
+            self, names: list[str],
+            levels: list[str | None],
+            user_ids: list[str | None] | None = None
+            ) -> None:
+        """
+        Seat a new match and reset every score.
+
+        Args:
+            names (list): Seat names in turn order.
+            levels (list): AI level ("1"-"5") of each seat, None for humans.
+            user_ids (list): Stats ID of each seat, None where no stats are
+            kept.
+        """
+        self.engine.players = list(names)
+        self.levels = list(levels)
+        self.user_ids = (list(user_ids) if user_ids is not None
+                         else [None] * len(names))
+        self.ai_states = [
+            self.ai_lvl.new_state() if level == "2" else None
+            for level in levels
+        ]
+        self.ai_searches = [
+            MonteCarloSearch(self.rng.spawn(1)[0]) if level == "5" else None
+            for level in levels
+        ]
+        self.engine.reset()
+
+    def prompt(self, text: str) -> str:
+        """Flush pending output, then read a line of input."""
+        self.renderer.flush()
+        return input(text)
+
+    def snapshot(self) -> bytes:
+        """Return the match in progress as a binary snapshot."""
+        return dumps(
+            self.engine, self.levels, self.user_ids, self.ai_states,
+            self.rng.to_bytes()
         )
-        self.turn_total = 0
+
+    def restore(self, data: bytes) -> None:
+        """
+        Continue the match saved in a snapshot from `snapshot`.
+
+        The engine emits an `EventKind.RESUME` event, so an attached
+        `EventLog` opens a game carrying the restored state.
+
+        Args:
+            data (bytes): The snapshot.
+
+        Raises:
+            ValueError: If the snapshot is damaged.
+        """
+        saved = loads(data)
+        try:
+            self.rng.restore(saved.rng_state)
+        except (struct.error, IndexError) as error:
+            raise ValueError("Damaged random state in saved game") from error
+        engine = self.engine
+        engine.players = saved.players
+        engine.target = saved.target
+        engine.resume(saved.scores, saved.current, saved.turn_total,
+                      saved.phase, saved.winner)
+        self.levels = saved.levels
+        self.user_ids = saved.user_ids
+        self.ai_states = saved.ai_states
+        self.ai_searches = [
+            MonteCarloSearch(self.rng.spawn(1)[0]) if level == "5" else None
+            for level in saved.levels
+        ]
+
+    def next_seat(self) -> None:
+        """Pass the dice to the next seat and reset the turn total."""
+        if self.engine.phase != Phase.GAME_OVER:
+            self.engine.next_turn()
 
     def game_mode(self) -> str:  # pragma: no cover
-        """Display and return the selected game mode (PvP or PvC)."""
-        print("\n---------- Game Mode ----------")  # pragma: no cover
-        print("1. Player vs Player\n2. Player vs Computer")
-        return input("Choose a game mode (1/2): ")
+        """Display and return the selected game mode."""
+        self.renderer.write("\n---------- Game Mode ----------")  # pragma: no cover
+        self.renderer.write(
+            "1. Player vs Player\n2. Player vs Computer\n3. Custom Match"
+            "\n4. Resume Saved Game"
+        )
+        return self.prompt("Choose a game mode (1/2/3/4): ")
 
     def game_level(self) -> str:
         """Display and return the selected AI difficulty level."""
-        print("\n---------- Game Level ----------")
-        print("1. Easy\n2. Medium\n3. Hard")
-        return input("Choose a game level (1/2/3): ")
-
-    def double_one_pvp(self) -> None:  # pragma: no cover
-        """Handle the event of rolling double ones in PvP mode."""
-        print(f"Turn total: {0}")
-        print("\nDouble ones! You lose all your points.")
-        self.pvp_scores[self.current_player_pvp] = 0
-
-    def double_one_pvc(self) -> None:
-        """Handle the event of rolling double ones in PvC mode."""
-        print(f"Turn total: {0}")
-        print("\nDouble ones! You lose all your points.")
-        self.pvc_scores[self.current_player_pvc] = 0
-
-    def add_turn_total(self, result: dict) -> None:  # pragma: no cover
-        """Add the result of a roll to the current turn total."""
-        self.turn_total += result["total"]
-        print(f"Turn total: {self.turn_total}")
+        self.renderer.write("\n---------- Game Level ----------")
+        self.renderer.write("1. Easy\n2. Medium\n3. Hard\n4. Optimal\n5. Monte Carlo")
+        return self.prompt("Choose a game level (1/2/3/4/5): ")
+
+    def show_events(self, events: list[Event]) -> None:
+        """Print the turn messages for events emitted by the engine."""
+        for event in events:
+            if event.kind == EventKind.SNAKE_EYES:
+                self.renderer.write(f"Turn total: {0}")
+                self.renderer.write("\nDouble ones! You lose all your points.")
+            elif event.kind == EventKind.BUST:
+                self.renderer.write(f"Turn total: {0}")
+                self.renderer.write("\nRolled a single one. Turn ends with no points.")
+            elif event.kind == EventKind.ROLL:
+                self.renderer.write(f"Turn total: {event.turn_total}")
+            elif event.kind == EventKind.REROLL:
+                self.renderer.write(f"Turn total: {event.turn_total}")
+                self.renderer.write("\nRolled a pair! You must roll again.")
 
     def roll(self) -> dict:
         """Roll dice for a human player and return the evaluated result."""
-        input("\nPress Enter to roll...")
+        self.prompt("\nPress Enter to roll...")
         result = self.dice_hand.evaluate_roll()
-        print(f"Rolled: {self.dice_hand.display_dice()}")
+        self.renderer.write(f"Rolled: {self.dice_hand.display_dice()}")
         return result
 
     def computer_roll(self) -> dict:  # pragma: no cover
         """Roll dice for the AI player and return the evaluated result."""
         result = self.dice_hand.evaluate_roll()
-        print(f"\nRolled: {self.dice_hand.display_dice()}")
+        self.renderer.write(f"\nRolled: {self.dice_hand.display_dice()}")
         return result
 
-    def scoreboard(self, choice: str) -> None:  # pragma: no cover
-        """Display the current scoreboard depending on the game mode."""
-        if choice == "1":
-            p1_name = self.pvp[0]
-            p1_score = [self.pvp_scores[self.pvp[0]]]
-            p2_name = self.pvp[1]
-            p2_score = [self.pvp_scores[self.pvp[1]]]
-            print(
-                f"\n----------- ScoreBoard ----------\n"
-                f"""   {p1_name} {p1_score} - {p2_score} {p2_name}"""
-            )
-        elif choice == "2":
-            p_name = self.pvc[0]
-            p_score = [self.pvc_scores[self.pvc[0]]]
-            ai_name = self.pvc[1]
-            ai_score = [self.pvc_scores[self.pvc[1]]]
-            print(
-                f"\n----------- ScoreBoard ----------\n"
-                f"""   {p_name} {p_score} - {ai_score} {ai_name}"""
+    def scoreboard(self) -> None:  # pragma: no cover
+        """Display the current scoreboard."""
+        players, scores = self.engine.players, self.engine.scores
+        self.renderer.write("\n----------- ScoreBoard ----------")
+        if len(players) == 2:
+            self.renderer.write(
+                f"""   {players[0]} {[scores[0]]} - """
+                f"""{[scores[1]]} {players[1]}"""
             )
+        else:
+            for name, score in zip(players, scores):
+                self.renderer.write(f"   {name} {[score]}")
 
     def pause_menu(self) -> str:  # pragma: no cover
         """Display the pause menu and return the selected option."""
-        print("\n----- Paused -----")
-        print("1. Continue\n2. Restart Game\n3. Change Name\n4. Quit Game")
-        return input("Select an option (1/2/3/4): ")
-
-    def pvp_play(self, user_choice: str) -> None:  # pragma: no cover
-        """Handle a full turn cycle for a single player in PvP mode."""
-        self.scoreboard(user_choice)
-        print(f"\n{self.current_player_pvp}'s turn:")
-        while True:
-            result = self.roll()
-            if result["is_double_one"]:
-                self.double_one_pvp()
-                break
-
-            if result["is_single_one"]:
-                print(f"Turn total: {0}")
-                print("\nRolled a single one. Turn ends with no points.")
-                break
-
-            self.add_turn_total(result)
-
-            if result["must_reroll"]:
-                print("\nRolled a pair! You must roll again.")
-                continue
+        self.renderer.write("\n----- Paused -----")
+        self.renderer.write(
+            "1. Continue\n2. Restart Game\n3. Change Name\n4. Quit Game"
+            "\n5. Save and Quit"
+        )
+        return self.prompt("Select an option (1/2/3/4/5): ")
 
-            if input("\nPause game? (p): ").strip().lower() == "p":
-                option = self.pause_menu()
-                if option == "1":
-                    pass
-                elif option == "2":
-                    self.pvp_scores = {player: 0 for player in self.pvp}
-                    self.turn_total = 0
-                    self.current_player_pvp = ""
-                    print("\nGame Restarted!")
-                    break
-                elif option == "3":
-                    p_id = input("\nEnter your user ID: ")
-                    name = input("Enter new name: ")
-                    self.histogram.update_username(p_id, name)
-                    score = self.pvp_scores[self.current_player_pvp]
-                    self.pvp_scores.pop(self.current_player_pvp, None)
-                    idx = self.pvp.index(self.current_player_pvp)
-                    self.pvp.pop(idx)
-                    self.pvp.insert(idx, name)
-                    self.current_player_pvp = name
-                    self.pvp_scores[name] = score
-                    print("Changes saved.")
-                elif option == "4":
-                    print("\nAre you sure you want to quit? ")
-                    select = input("All progress will be lost (y/n): ")
-                    if select != "n":
-                        self.pvp_scores = {player: 0 for player in self.pvp}
-                        self.turn_total = 0
-                        return "quit"
-
-            if input("\nRoll again? (y/n): ").strip().lower() != "y":
-                self.pvp_scores[self.current_player_pvp] += self.turn_total
-                break
+    def handle_pause(self, seat: int) -> str | None:  # pragma: no cover
+        """
+        Run the pause menu for the human in ``seat``.
 
-        self.switch_pvp()
+        Returns:
+            str: "restart" or "quit" when the turn must stop, else None.
+        """
+        option = self.pause_menu()
+        if option == "2":
+            self.engine.reset()
+            self.renderer.write("\nGame Restarted!")
+            return "restart"
+        if option == "3":
+            p_id = self.prompt("\nEnter your user ID: ")
+            name = self.prompt("Enter new name: ")
+            self.histogram.update_username(p_id, name)
+            self.engine.rename(seat, name)
+            self.renderer.write("Changes saved.")
+        elif option == "4":
+            self.renderer.write("\nAre you sure you want to quit? ")
+            select = self.prompt("All progress will be lost (y/n): ")
+            if select != "n":
+                return "quit"
+        elif option == "5":
+            try:
+                data = self.snapshot()
+            except ValueError:
+                self.renderer.write("\nA name or user ID is too long to save.")
+                return self.handle_pause(seat)
+            atomic_write(SNAPSHOT_PATH, data)
+            self.renderer.write("\nGame saved. Resume it from the game mode menu.")
+            return "quit"
         return None
 
-    def pvc_play(self, user_choice: str, level: str) -> None:  # pragma: no cover
-        """Handle a full turn cycle in PvC mode, including AI decision logic."""
-        self.scoreboard(user_choice)
-        print(f"\n{self.current_player_pvc}'s turn:")
-        ai_double_one = False
-        ai_opt = ""
+    def computer_decision(self, seat: int) -> str:
+        """Return the 'y'/'n' roll-again decision of the AI in ``seat``."""
+        level = self.levels[seat]
+        turn_total = self.engine.turn_total
+        score = self.engine.scores[seat]
+        opponent = self.engine.leading_opponent(seat)
+        if level == "1":
+            return self.ai_lvl.easy(turn_total)
+        if level == "2":
+            return self.ai_lvl.mid(
+                turn_total, score, False, self.ai_states[seat]
+            )
+        if level == "3":
+            return self.ai_lvl.hard(turn_total, opponent, score)
+        if level == "4":
+            return self.ai_lvl.optimal(turn_total, score, opponent)
+        if level == "5":
+            return self.ai_lvl.monte_carlo(
+                turn_total, score, opponent, self.ai_searches[seat]
+            )
+        return ""
+
+    def play_turn(self) -> str | None:  # pragma: no cover
+        """Handle a full turn for the seat to move, human or computer."""
+        engine = self.engine
+        seat = engine.current
+        computer = self.levels[seat] is not None
+        self.scoreboard()
+        self.renderer.write(f"\n{engine.current_name}'s turn:")
+        rolling = engine.phase != Phase.MAY_HOLD
         while True:
-            if self.current_player_pvc == self.pvc[1]:
-                result = self.computer_roll()
+            if rolling:
+                result = self.computer_roll() if computer else self.roll()
+                self.show_events(engine.apply_roll(result))
+                if engine.phase == Phase.TURN_OVER:
+                    break
+                if engine.phase == Phase.MUST_ROLL:
+                    continue
             else:
-                result = self.roll()
-
-            if result["is_double_one"]:
-                self.double_one_pvc()
-                ai_double_one = self.current_player_pvc == self.pvc[1]
-                break
-
-            if result["is_single_one"]:
-                print(f"Turn total: {0}")
-                print("\nRolled a single one. Turn ends with no points.")
-                break
-
-            self.add_turn_total(result)
+                self.renderer.write(f"Turn total: {engine.turn_total}")
+            rolling = True
 
-            if result["must_reroll"]:
-                print("\nRolled a pair! You must roll again.")
+            if computer:
+                if self.computer_decision(seat) != "y":
+                    engine.hold()
+                    break
                 continue
 
-            if self.current_player_pvc == self.pvc[0]:
-                user_input = input("\nPause game? (p to pause, Enter to continue): ")
-                if user_input.strip().lower() == "p":
-                    option = self.pause_menu()
-                    if option == "1":
-                        pass
-                    elif option == "2":
-                        self.pvc_scores = {player: 0 for player in self.pvc}
-                        self.turn_total = 0
-                        self.current_player_pvc = ""
-                        print("\nGame Restarted!")
-                        break
-                    elif option == "3":
-                        p_id = input("\nEnter your user ID: ")
-                        name = input("Enter new name: ")
-                        self.histogram.update_username(p_id, name)
-                        score = self.pvc_scores[self.pvc[0]]
-                        self.pvc_scores.pop(self.pvc[0], None)
-                        self.pvc.pop(0)
-                        self.pvc.insert(0, name)
-                        self.current_player_pvc = self.pvc[0]
-                        self.pvc_scores[self.pvc[0]] = score
-                        print("Changes saved.")
-
-                    elif option == "4":
-                        print("\nAre you sure you want to quit? ")
-                        select = input("All progress will be lost (y/n): ")
-                        if select != "n":
-                            self.pvc_scores = {player: 0 for player in self.pvc}
-                            self.turn_total = 0
-                            return "quit"
-
-                if input("\nRoll again? (y/n): ").strip().lower() != "y":
-                    self.pvc_scores[self.current_player_pvc] += self.turn_total
-                    break
+            user_input = self.prompt("\nPause game? (p to pause, Enter to continue): ")
+            if user_input.strip().lower() == "p":
+                paused = self.handle_pause(seat)
+                if paused == "restart":
+                    return None
+                if paused == "quit":
+                    return "quit"
 
-            elif self.current_player_pvc == self.pvc[1]:
-                if level == "1":
-                    ai_opt = self.ai_lvl.easy(self.turn_total)
-                elif level == "2":
-                    ai_score = self.pvc_scores[self.pvc[1]]
-                    ai_opt = self.ai_lvl.mid(self.turn_total, ai_score, ai_double_one)
-                elif level == "3":
-                    p_score = self.pvc_scores[self.pvc[0]]
-                    ai_score = self.pvc_scores[self.pvc[1]]
-                    ai_opt = self.ai_lvl.hard(self.turn_total, p_score, ai_score)
-
-                if ai_opt != "y":
-                    self.pvc_scores[self.current_player_pvc] += self.turn_total
-                    break
+            if self.prompt("\nRoll again? (y/n): ").strip().lower() != "y":
+                engine.hold()
+                break
 
-        self.switch_pvc()
+        self.next_seat()
+        self.renderer.flush()
         return None
 
     def player_type(self) -> tuple:  # pragma: no cover
@@ -266,126 +330,146 @@ class Game:
 
         And return ID + username.
         """
-        print("1. New Player\n2. Existing Player")
-        choice = input("Select an option (1/2): ")
+        self.renderer.write("1. New Player\n2. Existing Player")
+        choice = self.prompt("Select an option (1/2): ")
         if choice == "1":
-            input_id = input("\nEnter a new user ID Player e.g. Mar580: ")
+            input_id = self.prompt("\nEnter a new user ID Player e.g. Mar580: ")
             while input_id in self.player.get_user_id_list():
-                input_id = input("\nUser ID Exists!\nEnter new ID: ")
+                input_id = self.prompt("\nUser ID Exists!\nEnter new ID: ")
             self.player.set_id(input_id)
             user_id = self.player.get_user_id()
-            self.player.set_username(input("Enter your name Player: "))
+            self.player.set_username(self.prompt("Enter your name Player: "))
             username = self.player.get_username()
             self.histogram.update_username(user_id, username)
             return user_id, username
         if choice == "2":
-            print(
+            self.renderer.write(
                 "\nINFO: Make sure to enter an existing ID on your first try,"
                 " otherwise you will be asked to create a new one."
             )
-            input_id = input("\nEnter your existing user ID Player e.g. Mar580: ")
+            input_id = self.prompt("\nEnter your existing user ID Player e.g. Mar580: ")
             if input_id in self.player.get_user_id_list():
                 self.player.set_id(input_id)
                 user_id = self.player.get_user_id()
                 username = self.histogram.get_username(user_id)
                 return user_id, username
 
-            print("User ID Does Not Exist!\n")
-            input_id = input("Enter a new user ID Player e.g. Mar580: ")
+            self.renderer.write("User ID Does Not Exist!\n")
+            input_id = self.prompt("Enter a new user ID Player e.g. Mar580: ")
             while input_id in self.player.get_user_id_list():
-                input_id = input("User ID Exists!\nEnter new ID: ")
+                input_id = self.prompt("User ID Exists!\nEnter new ID: ")
             self.player.set_id(input_id)
             user_id = self.player.get_user_id()
-            self.player.set_username(input("Enter your name Player: "))
+            self.player.set_username(self.prompt("Enter your name Player: "))
             username = self.player.get_username()
             self.histogram.update_username(user_id, username)
             return user_id, username
         return None, None
 
-    def save_pvp1(self, p_id: str, winner: str) -> None:  # pragma: no cover
-        """Save stats for PvP player 1 after a completed match."""
+    def save_seat(self, seat: int) -> None:  # pragma: no cover
+        """Save stats for the human in ``seat`` after a completed match."""
+        p_id = self.user_ids[seat]
         self.histogram.increment_games_played(p_id)
-        if winner == self.pvp[0]:
+        if seat == self.engine.winner:
             self.histogram.increment_games_won(p_id)
         else:
             self.histogram.increment_games_lost(p_id)
-        self.highscore.set_highscore(self.pvp_scores[self.pvp[0]])
+        self.highscore.set_highscore(self.engine.scores[seat])
         score = self.highscore.get_highscore()
         self.histogram.check_highscore(p_id, score)
         self.histogram.save_stats()
 
-    def save_pvp2(self, p_id: str, winner: str) -> None:  # pragma: no cover
-        """Save stats for PvP player 2 after a completed match."""
-        self.histogram.increment_games_played(p_id)
-        if winner == self.pvp[1]:
-            self.histogram.increment_games_won(p_id)
-        else:
-            self.histogram.increment_games_lost(p_id)
-        self.highscore.set_highscore(self.pvp_scores[self.pvp[1]])
-        score = self.highscore.get_highscore()
-        self.histogram.check_highscore(p_id, score)
-        self.histogram.save_stats()
+    def run_match(self) -> None:  # pragma: no cover
+        """Play the seated match to the end and save the humans' stats."""
+        pause_menu_option = ""
+        while self.engine.winner is None:
+            pause_menu_option = self.play_turn()
+            if pause_menu_option == "quit":
+                break
 
-    def save_pvc1(self, p_id: str, winner: str) -> None:  # pragma: no cover
-        """Save stats for the player in Player vs Computer mode."""
-        self.histogram.increment_games_played(p_id)
-        if winner == self.pvc[0]:
-            self.histogram.increment_games_won(p_id)
-        else:
-            self.histogram.increment_games_lost(p_id)  # pragma: no cover
-        self.highscore.set_highscore(self.pvc_scores[self.pvc[0]])
-        score = self.highscore.get_highscore()
-        self.histogram.check_highscore(p_id, score)
-        self.histogram.save_stats()
+        if self.event_log is not None:
+            self.event_log.flush()
+        if pause_menu_option != "quit":
+            self.scoreboard()
+            with self.histogram.batch():
+                for seat, user_id in enumerate(self.user_ids):
+                    if user_id is not None:
+                        self.save_seat(seat)
+            winner = self.engine.winner
+            self.renderer.write(
+                f"\n🎉 {self.engine.players[winner]} wins with "
+                f"{self.engine.scores[winner]} points!"
+            )
 
-    def start_pvp_game(self, choice: str) -> None:  # pragma: no cover
+    def start_pvp_game(self) -> None:  # pragma: no cover
         """Set up and run a full Player vs Player match."""
-        print("\n------- Player Selection -------")
-        print("\n>>> Player 1\n")
+        self.renderer.write("\n------- Player Selection -------")
+        self.renderer.write("\n>>> Player 1\n")
         p1_id, p1_username = self.player_type()
-        self.pvp[0] = p1_username
-        print("\n>>> Player 2\n")
+        self.renderer.write("\n>>> Player 2\n")
         p2_id, p2_username = self.player_type()
-        self.pvp[1] = p2_username
-        self.current_player_pvp = self.pvp[0]
-        self.pvp_scores: dict[str, int] = {player: 0 for player in self.pvp}
-        pause_menu_option = ""
-        while max(self.pvp_scores.values()) < 100:
-            pause_menu_option = self.pvp_play(choice)
-            if pause_menu_option == "quit":
-                break
-        if pause_menu_option != "quit":
-            self.scoreboard(choice)
-            winner = max(self.pvp_scores, key=self.pvp_scores.get)
-            self.save_pvp1(p1_id, winner)
-            self.save_pvp2(p2_id, winner)
-            print(f"\n🎉 {winner} wins with {self.pvp_scores[winner]} points!")
+        self.seat_players(
+            [p1_username, p2_username], [None, None], [p1_id, p2_id]
+        )
+        self.run_match()
 
-    def start_pvc_game(self, choice: str) -> None:  # pragma: no cover
+    def start_pvc_game(self) -> None:  # pragma: no cover
         """Set up and run a full Player vs Computer match."""
-        print("\n------- Player Selection -------")
+        self.renderer.write("\n------- Player Selection -------")
         user_id, username = self.player_type()
-        self.pvc[0] = username
-        self.pvc_scores: dict[str, int] = {player: 0 for player in self.pvc}
-        self.current_player_pvc = self.pvc[0]
         level = self.game_level()
-        pause_menu_option = ""
-        while max(self.pvc_scores.values()) < 100:
-            pause_menu_option = self.pvc_play(choice, level)
-            if pause_menu_option == "quit":
-                break
-
-        if pause_menu_option != "quit":
-            self.scoreboard(choice)
-            winner = max(self.pvc_scores, key=self.pvc_scores.get)
-            self.save_pvc1(user_id, winner)
-            print(f"\n🎉 {winner} wins with {self.pvc_scores[winner]} points!")
+        self.seat_players([username, COMPUTER], [None, level], [user_id, None])
+        self.run_match()
+
+    def start_custom_game(self) -> None:  # pragma: no cover
+        """Set up and run a match with any mix of humans and computers."""
+        self.renderer.write("\n------- Player Selection -------")
+        count = self.prompt(f"How many seats? (2-{MAX_SEATS}): ")
+        while not count.isdigit() or not 2 <= int(count) <= MAX_SEATS:
+            count = self.prompt(f"Enter a number from 2 to {MAX_SEATS}: ")
+        names, levels, user_ids = [], [], []
+        for seat in range(1, int(count) + 1):
+            self.renderer.write(f"\n>>> Seat {seat}\n")
+            self.renderer.write("1. Human\n2. Computer")
+            if self.prompt("Select an option (1/2): ") == "2":
+                names.append(f"{COMPUTER} {seat}")
+                levels.append(self.game_level())
+                user_ids.append(None)
+            else:
+                user_id, username = self.player_type()
+                names.append(username)
+                levels.append(None)
+                user_ids.append(user_id)
+        self.seat_players(names, levels, user_ids)
+        self.run_match()
+
+    def resume_game(self) -> None:  # pragma: no cover
+        """Load the saved match, if any, and play it to the end."""
+        try:
+            with open(SNAPSHOT_PATH, "rb") as saved_game:
+                self.restore(saved_game.read())
+        except FileNotFoundError:
+            self.renderer.write("\nNo saved game found.")
+            return
+        except ValueError:
+            self.renderer.write("\nThe saved game is damaged and cannot be resumed.")
+            return
+        os.remove(SNAPSHOT_PATH)
+        self.renderer.write("\nGame resumed!")
+        self.run_match()
 
     def start_game(self) -> None:  # pragma: no cover
         """Start and manage the overall game flow including mode selection."""
         choice = self.game_mode()
         if choice == "1":
-            self.start_pvp_game(choice)
+            self.start_pvp_game()
 
         elif choice == "2":
-            self.start_pvc_game(choice)
+            self.start_pvc_game()
+
+        elif choice == "3":
+            self.start_custom_game()
+
+        elif choice == "4":
+            self.resume_game()
+        self.renderer.flush()
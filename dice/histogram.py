@@ -7,14 +7,142 @@ This module provides the `Histogram` class, which handles:
 - Loading statistics from a serialized file on startup
 - Saving updated statistics back to the file
 
-The statistics are stored in a dictionary keyed by player ID, and
-persisted using Python's `pickle` module.
+The statistics are stored in a `PlayerRecords` mapping keyed by player
+ID, which keeps them in compact columns behind a dict-like interface,
+and persisted using Python's `pickle` module:
+
+- The snapshot file holds every record as of the last compaction
+- Each save appends only the changes to the records touched since the
+  previous save to a journal next to it, so ending a match costs the
+  same whatever the number of players
+- Journal entries carry a length and CRC32; a torn entry left by a crash
+  is dropped on load and the rest are replayed over the snapshot
+- A new journal's header is written atomically before any entry, and a
+  journal left without one is replaced by an empty journal on load
+- Once the journal grows past `COMPACT_BYTES` it is rotated and folded
+  into a new snapshot by a background thread
+- Appends, rotation and compaction hold cross-process `locked` file
+  locks and snapshots are replaced atomically, so many game processes
+  can share one stats folder; the counters in the journal are deltas,
+  so their updates add up instead of overwriting each other
+- Inside ``with histogram.batch():`` saves are deferred, so any number of
+  updates to any number of players is written once when the block ends,
+  or dropped if it raises
+- `refresh` reloads the records only when the journal's `version` shows
+  another process saved since; `dice.stats_cache` shares one instance
+  per file within a process
 """
 
+import os
 import pickle
+import struct
+import threading
+import zlib
+from contextlib import contextmanager, suppress
+from typing import Callable, Iterator
+from dice.file_lock import atomic_write, locked
+from dice.records import PlayerRecords
+
+STATS_PATH = "dice/history.ser"
+JOURNAL_SUFFIX = ".journal"
+MAGIC = b"PIGJ"
+VERSION = 1
+HEADER = struct.Struct("<4sHI")
+ENTRY = struct.Struct("<II")
+COMPACT_BYTES = 1 << 16
+
+
+def new_record() -> dict:
+    """Return the statistics of a player who has not played yet."""
+    return {
+        "Username": "",
+        "Highscore": 0,
+        "Games_Played": 0,
+        "Games_Won": 0,
+        "Games_Lost": 0
+    }
 
 
-class Histogram:
+def apply_change(details: dict, change: tuple) -> None:
+    """
+    Apply one journal change to ``details``.
+
+    Args:
+        details (dict): Player records keyed by ID.
+        change (tuple): ID, new username or None, highscore, and the
+        games played, won and lost since the previous change.
+    """
+    p_id, username, highscore, played, won, lost = change
+    record = details.setdefault(p_id, new_record())
+    if username is not None:
+        record["Username"] = username
+    record["Highscore"] = max(record.get("Highscore", 0), highscore)
+    record["Games_Played"] = record.get("Games_Played", 0) + played
+    record["Games_Won"] = record.get("Games_Won", 0) + won
+    record["Games_Lost"] = record.get("Games_Lost", 0) + lost
+
+
+def read_journal(path: str) -> tuple[int | None, list, int]:
+    """
+    Read the changes in one journal file.
+
+    Args:
+        path (str): The journal.
+
+    Returns:
+        tuple: The journal's generation, its list of change batches and
+        the length of the intact part of the file; a torn or corrupt
+        entry ends the list. A file shorter than the header, left by a
+        crash while it was created, has generation None and no changes.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    if len(data) < HEADER.size:
+        return None, [], 0
+    if data[:4] != MAGIC:
+        raise ValueError(f"Not a stats journal: {path}")
+    _, version, generation = HEADER.unpack_from(data)
+    if version != VERSION:
+        raise ValueError(f"Unsupported stats journal version {version}")
+    batches = []
+    offset = HEADER.size
+    while offset + ENTRY.size <= len(data):
+        size, checksum = ENTRY.unpack_from(data, offset)
+        payload = data[offset + ENTRY.size:offset + ENTRY.size + size]
+        if len(payload) < size or zlib.crc32(payload) != checksum:
+            break
+        batches.append(pickle.loads(payload))
+        offset += ENTRY.size + size
+    return generation, batches, offset
+
+
+def read_snapshot(path: str) -> tuple[PlayerRecords, int]:
+    """
+    Read a snapshot file.
+
+    Args:
+        path (str): The snapshot.
+
+    Returns:
+        tuple: The records and the newest journal generation they
+        include, 0 for files written before the journal existed. Older
+        snapshots holding a dict of dicts are converted.
+    """
+    try:
+        with open(path, "rb") as file:
+            details = pickle.load(file)
+            try:
+                covered = pickle.load(file)
+            except EOFError:
+                covered = 0
+    except FileNotFoundError:
+        details, covered = {}, 0
+    if not isinstance(details, PlayerRecords):
+        details = PlayerRecords(details)
+    return details, covered
+
+
+class Histogram:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """
     Manages player statistics such as wins, losses.
 
@@ -23,13 +151,86 @@ class Histogram:
     Handles loading and saving these statistics to a serialized file.
     """
 
-    def __init__(self):  # pragma: no cover
+    def __init__(
+            self, path: str = STATS_PATH,
+            compact_bytes: int = COMPACT_BYTES
+            ) -> None:  # pragma: no cover
         """
         Initialize the Histogram by loading existing player statistics.
 
         From the stats file.
+
+        Args:
+            path (str): Snapshot file; the journal is this path with
+            `JOURNAL_SUFFIX` added.
+            compact_bytes (int): Journal size that triggers a compaction.
         """
+        self.path = path
+        self.journal_path = path + JOURNAL_SUFFIX
+        self.compact_bytes = compact_bytes
+        self.generation = 1
+        self.compactor: threading.Thread | None = None
+        self.known: tuple | None = None
         self.details = self.load_stats_file()
+        self.saved: dict[str, dict | None] = {}
+        self.dirty: set[str] = set()
+        self.batching = 0
+        self.listeners: list[Callable[[dict], None]] = []
+
+    def record(self, p_id: str) -> dict:
+        """
+        Return the record of a player, creating an empty one if missing.
+
+        The record as it was is kept as the baseline for `changes` and
+        `discard` until the next save.
+
+        Args:
+            p_id (str): The player's unique identifier.
+
+        Returns:
+            dict: The player's statistics, updated in place.
+        """
+        if p_id not in self.saved:
+            self.saved[p_id] = dict(self.details[p_id]) \
+                if p_id in self.details else None
+        if p_id not in self.details:
+            self.details[p_id] = new_record()
+        return self.details[p_id]
+
+    @contextmanager
+    def batch(self) -> Iterator["Histogram"]:
+        """
+        Group updates so they are saved together.
+
+        `save_stats` calls inside the block are deferred; the changed
+        records are saved once when the outermost block ends. If the
+        block raises, its changes are discarded instead.
+
+        Yields:
+            Histogram: This histogram.
+        """
+        self.batching += 1
+        try:
+            yield self
+        except BaseException:
+            self.batching -= 1
+            if not self.batching:
+                self.discard()
+            raise
+        self.batching -= 1
+        if not self.batching:
+            self.save_stats()
+
+    def discard(self) -> None:
+        """Undo the changes to the records touched since the last save."""
+        for p_id in self.dirty:
+            before = self.saved.get(p_id)
+            if before is not None:
+                self.details[p_id] = before
+            else:
+                del self.details[p_id]
+        self.dirty.clear()
+        self.saved.clear()
 
     def increment_games_played(self, p_id: str) -> None:  # pragma: no cover
         """
@@ -38,16 +239,9 @@ class Histogram:
         Args:
             id (str): The player's unique identifier.
         """
-        if p_id not in self.details.keys():
-            self.details[p_id] = {
-                                    "Username": "",
-                                    "Highscore": 0,
-                                    "Games_Played": 0,
-                                    "Games_Won": 0,
-                                    "Games_Lost": 0
-                                }
-        games_played_value = self.details[p_id].get("Games_Played", 0)
-        self.details[p_id]["Games_Played"] = games_played_value + 1
+        record = self.record(p_id)
+        record["Games_Played"] = record.get("Games_Played", 0) + 1
+        self.dirty.add(p_id)
 
     def increment_games_won(self, p_id: str) -> None:  # pragma: no cover
         """
@@ -56,16 +250,9 @@ class Histogram:
         Args:
             id (str): The player's unique identifier.
         """
-        if p_id not in self.details.keys():
-            self.details[p_id] = {
-                                    "Username": "",
-                                    "Highscore": 0,
-                                    "Games_Played": 0,
-                                    "Games_Won": 0,
-                                    "Games_Lost": 0
-                                }
-        games_won_value = self.details[p_id].get("Games_Won", 0)
-        self.details[p_id]["Games_Won"] = games_won_value + 1
+        record = self.record(p_id)
+        record["Games_Won"] = record.get("Games_Won", 0) + 1
+        self.dirty.add(p_id)
 
     def increment_games_lost(self, p_id: str) -> None:  # pragma: no cover
         """
@@ -74,16 +261,9 @@ class Histogram:
         Args:
             id (str): The player's unique identifier.
         """
-        if p_id not in self.details.keys():
-            self.details[p_id] = {
-                                    "Username": "",
-                                    "Highscore": 0,
-                                    "Games_Played": 0,
-                                    "Games_Won": 0,
-                                    "Games_Lost": 0
-                                }
-        games_lost_value = self.details[p_id].get("Games_Lost", 0)
-        self.details[p_id]["Games_Lost"] = games_lost_value + 1
+        record = self.record(p_id)
+        record["Games_Lost"] = record.get("Games_Lost", 0) + 1
+        self.dirty.add(p_id)
 
     def update_username(self, p_id: str, name: str) -> None:  # pragma: no cover
         """
@@ -93,15 +273,8 @@ class Histogram:
             id (str): The player's unique identifier.
             name (str): The username to assign.
         """
-        if p_id not in self.details.keys():
-            self.details[p_id] = {
-                                    "Username": "",
-                                    "Highscore": 0,
-                                    "Games_Played": 0,
-                                    "Games_Won": 0,
-                                    "Games_Lost": 0
-                                }
-        self.details[p_id]["Username"] = name
+        self.record(p_id)["Username"] = name
+        self.dirty.add(p_id)
 
     def get_username(self, p_id: str) -> str:  # pragma: no cover
         """
@@ -125,29 +298,286 @@ class Histogram:
             id (str): The player's unique identifier.
             score (int): The new score to evaluate.
         """
-        if p_id not in self.details.keys():
-            self.details[p_id] = {
-                                    "Username": "",
-                                    "Highscore": 0,
-                                    "Games_Played": 0,
-                                    "Games_Won": 0,
-                                    "Games_Lost": 0
-                                }
-        if score > self.details[p_id]["Highscore"]:
-            self.details[p_id]["Highscore"] = score
+        record = self.record(p_id)
+        if score > record["Highscore"]:
+            record["Highscore"] = score
+            self.dirty.add(p_id)
+
+    def record_results(
+            self, p_id: str,
+            won: int,
+            lost: int,
+            score: int
+            ) -> None:
+        """
+        Add the outcome of many games for one player in a single update.
+
+        Args:
+            p_id (str): The player's unique identifier.
+            won (int): Games won.
+            lost (int): Games lost.
+            score (int): Best score reached, kept if it beats the highscore.
+        """
+        record = self.record(p_id)
+        record["Games_Played"] = record.get("Games_Played", 0) + won + lost
+        record["Games_Won"] = record.get("Games_Won", 0) + won
+        record["Games_Lost"] = record.get("Games_Lost", 0) + lost
+        if score > record["Highscore"]:
+            record["Highscore"] = score
+        self.dirty.add(p_id)
+
+    def changes(self) -> list[tuple]:
+        """
+        Collect the changes to the records touched since the last save.
+
+        The baselines kept by `record` are dropped; the next update
+        takes a new one.
+
+        Returns:
+            list: One `apply_change` tuple per changed player.
+        """
+        changes = []
+        for p_id in self.dirty:
+            record = self.details[p_id]
+            before = self.saved.get(p_id) or new_record()
+            username = record.get("Username", "")
+            changes.append((
+                p_id,
+                username if username != before.get("Username") else None,
+                record.get("Highscore", 0),
+                record.get("Games_Played", 0) - before.get("Games_Played", 0),
+                record.get("Games_Won", 0) - before.get("Games_Won", 0),
+                record.get("Games_Lost", 0) - before.get("Games_Lost", 0)
+            ))
+        self.dirty.clear()
+        self.saved.clear()
+        return changes
+
+    def save_stats(self) -> None:
+        """
+        Save the records changed since the last save.
 
-    def save_stats(self) -> None:  # pragma: no cover
-        """Save all current player statistics to the serialized stats file."""
-        with open("dice/history.ser", "wb") as f:
-            pickle.dump(self.details, f)
+        Inside a `batch` the save is left to the end of the block.
+        Afterwards each of `listeners` is called once with the saved
+        records keyed by player ID, as returned by `merged_records`.
+        """
+        if self.batching:
+            return
+        changes = self.changes()
+        if changes:
+            self.write_changes(changes)
+            saved = self.merged_records([change[0] for change in changes])
+            for listener in self.listeners:
+                listener(saved)
+
+    def merged_records(self, p_ids: list[str]) -> dict:
+        """
+        Return the stored records of some players after a save.
+
+        The records are reloaded first if another process saved since,
+        so they include every process's games, not only this one's.
 
-    def load_stats_file(self) -> dict:  # pragma: no cover
+        Args:
+            p_ids (list): The players.
+
+        Returns:
+            dict: Their records keyed by player ID.
+        """
+        self.refresh()
+        return {p_id: self.details[p_id] for p_id in p_ids}
+
+    def all_records(self) -> dict:
+        """Return every player's record, keyed by player ID."""
+        return self.details
+
+    def write_changes(self, changes: list[tuple]) -> None:
+        """
+        Append changes to the journal in one fsynced write.
+
+        The journal lock is held for the append, so saves from other
+        processes land as whole entries, one after the other.
+
+        Args:
+            changes (list): Tuples from `changes`.
+        """
+        payload = pickle.dumps(changes)
+        entry = ENTRY.pack(len(payload), zlib.crc32(payload)) + payload
+        with locked(self.journal_path):
+            current = self.version() == self.known
+            if not os.path.exists(self.journal_path):
+                self.start_journal()
+            with open(self.journal_path, "ab") as f:
+                f.write(entry)
+                f.flush()
+                os.fsync(f.fileno())
+                size = f.tell()
+            self.known = self.version() if current else None
+        if size >= self.compact_bytes:
+            self.compact()
+
+    def start_journal(self) -> None:
+        """Atomically write an empty journal; needs the journal lock."""
+        atomic_write(self.journal_path,
+                     HEADER.pack(MAGIC, VERSION, self.next_generation()))
+
+    def next_generation(self) -> int:
+        """Return the generation of a new journal; needs the journal lock."""
+        return max([self.generation] + [
+            generation + 1 for generation, _ in self.rotated_journals()
+        ])
+
+    def load_stats_file(self) -> dict:
         """
         Load and return player statistics from the serialized stats file.
 
+        The snapshot is read and every journal it does not cover yet is
+        replayed over it. A torn entry at the end of the journal is cut
+        off so later saves append after the intact part, and a journal
+        without a complete header is replaced by an empty one.
+
         Returns:
             dict: A dictionary containing all stored player statistics.
         """
-        with open("dice/history.ser", "rb") as f:
-            details = pickle.load(f)
+        with locked(self.journal_path):
+            details, covered = read_snapshot(self.path)
+            self.generation = covered + 1
+            for generation, path in self.rotated_journals():
+                if generation <= covered:
+                    with suppress(FileNotFoundError):
+                        os.remove(path)
+                    continue
+                self.replay(details, path)
+                self.generation = generation + 1
+            if os.path.exists(self.journal_path):
+                generation = self.replay(details, self.journal_path)
+                if generation is None:
+                    self.start_journal()
+                else:
+                    self.generation = generation
+            self.known = self.version()
         return details
+
+    def version(self) -> tuple:
+        """
+        Return a token that changes whenever the journal is written.
+
+        Every save goes through the journal, so comparing tokens tells
+        whether another process saved since this one last read or wrote.
+        """
+        try:
+            stat = os.stat(self.journal_path)
+        except FileNotFoundError:
+            return ()
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def refresh(self) -> bool:
+        """
+        Reload the records if another process has saved since.
+
+        Nothing is reloaded while there are unsaved changes.
+
+        Returns:
+            bool: Whether the records were reloaded.
+        """
+        if self.dirty or self.batching or self.version() == self.known:
+            return False
+        self.details = self.load_stats_file()
+        self.saved.clear()
+        return True
+
+    def replay(self, details: dict, path: str) -> int | None:
+        """
+        Apply one journal file to ``details``.
+
+        Args:
+            details (dict): Records to update.
+            path (str): The journal.
+
+        Returns:
+            int: The journal's generation, None if it has no header.
+        """
+        generation, batches, intact = read_journal(path)
+        for batch in batches:
+            for change in batch:
+                apply_change(details, change)
+        if intact < os.path.getsize(path):
+            os.truncate(path, intact)
+        return generation
+
+    def rotated_journals(self) -> list[tuple[int, str]]:
+        """Return the (generation, path) of every rotated journal, oldest first."""
+        folder, name = os.path.split(self.journal_path)
+        prefix = name + "."
+        journals = []
+        for entry in os.listdir(folder or "."):
+            if entry.startswith(prefix) and entry[len(prefix):].isdigit():
+                journals.append(
+                    (int(entry[len(prefix):]), os.path.join(folder, entry))
+                )
+        return sorted(journals)
+
+    def compact(self, wait: bool = False) -> None:
+        """
+        Fold the journals into a new snapshot.
+
+        The journal is renamed and a fresh one started so saves carry on,
+        then a background thread writes the snapshot and deletes the
+        rotated journals it covers. The snapshot is rebuilt from the
+        files rather than from memory, so saves made by other processes
+        are kept.
+
+        Args:
+            wait (bool): Block until every save so far is in the
+            snapshot; otherwise return at once, skipping the compaction
+            if one is already running.
+        """
+        if self.compactor is not None and self.compactor.is_alive():
+            if not wait:
+                return
+            self.compactor.join()
+        with locked(self.journal_path):
+            if os.path.exists(self.journal_path):
+                current = self.version() == self.known
+                generation = read_journal(self.journal_path)[0]
+                if generation is not None:
+                    os.replace(self.journal_path,
+                               f"{self.journal_path}.{generation}")
+                    self.generation = generation + 1
+                self.start_journal()
+                self.known = self.version() if current else None
+            rotated = self.rotated_journals()
+        if not rotated:
+            return
+        self.compactor = threading.Thread(
+            target=self.write_snapshot, args=(rotated[-1][0],)
+        )
+        self.compactor.start()
+        if wait:
+            self.compactor.join()
+
+    def write_snapshot(self, covered: int) -> None:
+        """
+        Atomically replace the snapshot with one including more journals.
+
+        Only one process compacts at a time; the others wait on the
+        snapshot lock and then find their journals already folded in.
+
+        Args:
+            covered (int): Newest rotated journal generation to fold in.
+        """
+        with locked(self.path):
+            details, done = read_snapshot(self.path)
+            if done >= covered:
+                return
+            for generation, path in self.rotated_journals():
+                if done < generation <= covered:
+                    for batch in read_journal(path)[1]:
+                        for change in batch:
+                            apply_change(details, change)
+            atomic_write(self.path, pickle.dumps(details),
+                         pickle.dumps(covered))
+        with locked(self.journal_path):
+            for generation, path in self.rotated_journals():
+                if generation <= covered:
+                    with suppress(FileNotFoundError):
+                        os.remove(path)
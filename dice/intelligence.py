@@ -2,38 +2,118 @@
 Intelligence module for computer decision-making in a turn-based dice game.
 
 This module provides the `Intelligence` class, which implements AI logic
-for three difficulty levels:
+for five difficulty levels:
 
 - Easy: Rolls until a safe turn threshold (20 points) is reached.
 - Medium: Adapts roll behavior based on previous scores, allowed turns,
     and special conditions such as double ones.
 - Hard: Uses dynamic strategies based on player and computer scores,
     late-game scenarios, and score differences.
+- Optimal: Looks up the decision in the value-iteration policy table
+    from `dice.solver`.
+- Monte Carlo: Searches from the current state within a time budget
+    using `dice.mcts`.
 
-The class methods return 'y' to continue rolling or 'n' to stop.
+The class methods return 'y' to continue rolling or 'n' to stop. Each
+level also has a ``*_batch`` variant that takes NumPy arrays with one
+entry per game and returns a boolean "keep rolling" array, for bulk
+simulation.
 """
 
+import numpy as np
+from dice.mcts import MonteCarloSearch
+from dice.solver import optimal_policy
+
+
+class MidState:  # pylint: disable=too-few-public-methods
+    """Per-game state of the medium difficulty level."""
+
+    __slots__ = ("turn_count", "seen_scores")
+
+    def __init__(self) -> None:
+        """
+        Initialize the state for a new game.
+
+        Attributes:
+            turn_count (int): Counter controlling behavior for the
+            medium difficulty level.
+
+            seen_scores (set): Previous scores encountered in medium
+            difficulty logic.
+        """
+        self.turn_count = 5
+        self.seen_scores: set[int] = set()
+
+    def reset(self) -> None:
+        """Forget all seen scores and restart the turn counter."""
+        self.turn_count = 5
+        self.seen_scores = set()
+
+
+class MidBatchState:  # pylint: disable=too-few-public-methods
+    """
+    Explicit per-game state for `Intelligence.mid_batch`.
+
+    Mirrors `MidState` of the scalar medium level, with one entry per
+    simulated game.
+    """
+
+    def __init__(self, games: int, max_score: int = 100) -> None:
+        """
+        Initialize fresh medium-level state for ``games`` games.
+
+        Args:
+            games (int): Number of games simulated side by side.
+            max_score (int): Exclusive upper bound on the computer scores
+            that will be passed in.
+        """
+        self.turn_count = np.full(games, 5, dtype=np.int16)
+        self.seen = np.zeros((games, max_score), dtype=bool)
+
 
 class Intelligence:
     """
-    A class that implements decision-making logic for three difficulty levels.
+    A class that implements decision-making logic for five difficulty levels.
 
-    (easy, medium, and hard) in a turn-based dice game.
+    (easy, medium, hard, optimal and Monte Carlo) in a turn-based dice game.
     """
 
     def __init__(self):  # pragma: no cover
         """
         Initialize the Intelligence object.
 
-        Attributes:
-            medium_turn_count (int): Counter controlling
-            behavior for the medium difficulty level.
+        The decision logic itself is stateless, so one instance can serve
+        any number of games. Per-game state of the medium level lives in a
+        `MidState` passed to `mid`; the instance keeps a default one for
+        callers that play a single game.
 
-            score_list (list): Tracks previous scores
-            encountered in medium difficulty logic.
+        Attributes:
+            state (MidState): Medium-level state used when `mid` is
+            called without one.
         """
-        self.medium_turn_count = 5
-        self.score_list = []
+        self.state = MidState()
+
+    @property
+    def medium_turn_count(self) -> int:
+        """Counter controlling behavior of the default medium-level state."""
+        return self.state.turn_count
+
+    @medium_turn_count.setter
+    def medium_turn_count(self, value: int) -> None:
+        self.state.turn_count = value
+
+    @property
+    def score_list(self) -> list:
+        """Previous scores encountered by the default medium-level state."""
+        return list(self.state.seen_scores)
+
+    @score_list.setter
+    def score_list(self, value: list) -> None:
+        self.state.seen_scores = set(value)
+
+    def new_state(self) -> "MidState":
+        """Return fresh per-game state for a new match."""
+        return MidState()
 
     def easy(self, turn_total: int) -> str:  # pragma: no cover
         """
@@ -52,7 +132,8 @@ class Intelligence:
     def mid(
             self, turn_total: int,
             score: int,
-            comp_double_one: bool
+            comp_double_one: bool,
+            state: "MidState | None" = None
             ) -> str:  # pragma: no cover
         """
         Decision logic for the medium difficulty level.
@@ -65,25 +146,29 @@ class Intelligence:
             score (int): The computer's running score for the game.
             comp_double_one (bool): Whether the computer rolled
             double ones in this turn.
+            state (MidState): The game's medium-level state, the
+            instance's default state is used when omitted.
 
         Returns:
             str: 'y' to continue rolling, 'n' to stop rolling.
         """
-        if score not in self.score_list:
-            self.medium_turn_count -= 1
-            self.score_list.append(score)
+        if state is None:
+            state = self.state
+        if score not in state.seen_scores:
+            state.turn_count -= 1
+            state.seen_scores.add(score)
 
         if comp_double_one:
-            self.medium_turn_count = 5
-            self.score_list = []
+            state.reset()
 
-        if self.medium_turn_count > 0 and self.medium_turn_count < 4:
-            remainder = int((100 - score) / self.medium_turn_count)
+        turn_count = state.turn_count
+        if turn_count > 0 and turn_count < 4:
+            remainder = int((100 - score) / turn_count)
             if turn_total >= remainder:
                 return 'n'
             return 'y'
 
-        if self.medium_turn_count == 4:
+        if turn_count == 4:
             if turn_total >= 25:
                 return 'n'
             return 'y'
@@ -122,3 +207,155 @@ class Intelligence:
         if turn_total >= int(21 + (score_diff / 8)):
             return 'n'
         return 'y'
+
+    def optimal(
+            self, turn_total: int,
+            computer_score: int,
+            player_score: int
+            ) -> str:
+        """
+        Decision logic for the optimal difficulty level.
+
+        The decision is a lookup in the solved policy table, which is
+        computed once per process on first use.
+
+        Parameters:
+            turn_total (int): The current accumulated total for the turn.
+            computer_score (int): The computer's current score.
+            player_score (int): The player's current score.
+
+        Returns:
+            str: 'y' to continue rolling, 'n' to stop rolling.
+        """
+        if optimal_policy().should_roll(computer_score, player_score, turn_total):
+            return 'y'
+        return 'n'
+
+    def monte_carlo(
+            self, turn_total: int,
+            computer_score: int,
+            player_score: int,
+            search: MonteCarloSearch
+            ) -> str:
+        """
+        Decision logic for the Monte Carlo difficulty level.
+
+        Parameters:
+            turn_total (int): The current accumulated total for the turn.
+            computer_score (int): The computer's current score.
+            player_score (int): The player's current score.
+            search (MonteCarloSearch): The game's search, which keeps its
+            tree between decisions of the same turn.
+
+        Returns:
+            str: 'y' to continue rolling, 'n' to stop rolling.
+        """
+        if search.decide(turn_total, computer_score, player_score):
+            return 'y'
+        return 'n'
+
+    def easy_batch(self, turn_totals: np.ndarray) -> np.ndarray:
+        """
+        Vectorized `easy` for many games at once.
+
+        Parameters:
+            turn_totals (np.ndarray): Current turn total of each game.
+
+        Returns:
+            np.ndarray: True where the computer keeps rolling.
+        """
+        return np.asarray(turn_totals) < 20
+
+    def mid_batch(
+            self, turn_totals: np.ndarray,
+            scores: np.ndarray,
+            comp_double_one: np.ndarray,
+            state: MidBatchState
+            ) -> np.ndarray:
+        """
+        Vectorized `mid` for many games at once.
+
+        The state updates of the scalar version are applied to ``state``
+        in place, and a None decision is reported as False (hold).
+
+        Parameters:
+            turn_totals (np.ndarray): Current turn total of each game.
+            scores (np.ndarray): The computer's score in each game.
+            comp_double_one (np.ndarray): Whether the computer rolled
+            double ones in each game.
+            state (MidBatchState): Per-game medium-level state.
+
+        Returns:
+            np.ndarray: True where the computer keeps rolling.
+        """
+        turn_totals = np.asarray(turn_totals)
+        scores = np.asarray(scores)
+        games = np.arange(len(scores))
+        new_score = ~state.seen[games, scores]
+        state.turn_count[new_score] -= 1
+        state.seen[games, scores] = True
+
+        reset = np.asarray(comp_double_one, dtype=bool)
+        state.turn_count[reset] = 5
+        state.seen[reset] = False
+
+        count = state.turn_count
+        remainder = np.trunc((100 - scores) / np.maximum(count, 1))
+        counting_down = (count > 0) & (count < 4)
+        return np.where(
+            counting_down, turn_totals < remainder,
+            (count == 4) & (turn_totals < 25)
+        )
+
+    def hard_batch(
+            self, turn_totals: np.ndarray,
+            player_scores: np.ndarray,
+            computer_scores: np.ndarray
+            ) -> np.ndarray:
+        """
+        Vectorized `hard` for many games at once.
+
+        Parameters:
+            turn_totals (np.ndarray): Current turn total of each game.
+            player_scores (np.ndarray): The player's score in each game.
+            computer_scores (np.ndarray): The computer's score in each game.
+
+        Returns:
+            np.ndarray: True where the computer keeps rolling.
+        """
+        turn_totals = np.asarray(turn_totals)
+        player_scores = np.asarray(player_scores)
+        computer_scores = np.asarray(computer_scores)
+        late_game = (player_scores >= 71) | (computer_scores >= 71)
+        score_diff = np.abs(player_scores - computer_scores)
+        return np.where(
+            late_game,
+            turn_totals < 100 - computer_scores,
+            turn_totals < 21 + score_diff // 8,
+        )
+
+    def optimal_batch(
+            self, turn_totals: np.ndarray,
+            computer_scores: np.ndarray,
+            player_scores: np.ndarray
+            ) -> np.ndarray:
+        """
+        Vectorized `optimal` for many games at once.
+
+        Parameters:
+            turn_totals (np.ndarray): Current turn total of each game.
+            computer_scores (np.ndarray): The computer's score in each game.
+            player_scores (np.ndarray): The player's score in each game.
+
+        Returns:
+            np.ndarray: True where the computer keeps rolling.
+        """
+        policy = optimal_policy()
+        turn_totals = np.asarray(turn_totals)
+        computer_scores = np.asarray(computer_scores)
+        reached = computer_scores + turn_totals >= policy.target
+        rolls = policy.policy[
+            computer_scores, player_scores,
+            np.where(reached, 0, turn_totals)
+        ].astype(bool)
+        return rolls & ~reached
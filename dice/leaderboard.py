@@ -0,0 +1,272 @@
+"""
+Top-K player rankings kept up to date as stats are saved.
+
+This module provides the `Leaderboard` class, which ranks players by
+highscore, games won and win rate without scanning every record:
+
+- Each `Board` keeps only the best `TOP_K` players in a sorted list;
+  an update is a binary search plus a move within those K entries
+- The leaderboard listens to `Histogram` saves, so every saved record
+  updates all boards once; the records come from
+  `Histogram.merged_records`, so they include other processes' games
+- Highscores and wins never go down, so those boards stay exact and
+  keep the larger of two values when merging with the file; when
+  a player on the win rate board drops below the last place, someone
+  outside could now be better, so that board is rebuilt from the stats
+  the next time it is shown
+- The boards are pickled next to the stats file, merged with the copy
+  on disk under a `locked` cycle, so showing the top ten after a
+  restart reads a few hundred bytes
+"""
+
+import heapq
+import pickle
+from bisect import bisect_left, insort
+from typing import Iterable
+from dice.file_lock import atomic_write, locked
+from dice.histogram import Histogram
+
+LEADERBOARD_PATH = "dice/leaderboard.ser"
+TOP_K = 10
+MIN_GAMES = 5
+BOARDS = {
+    "highscore": "Highscore",
+    "wins": "Games won",
+    "win_rate": "Win rate",
+}
+RISING = ("highscore", "wins")
+
+
+def board_value(board: str, record: dict) -> float | None:
+    """
+    Return a record's ranking value on one board.
+
+    Args:
+        board (str): A key of `BOARDS`.
+        record (dict): The player's stats.
+
+    Returns:
+        float: The value, or None when the player is not ranked, which
+        for the win rate means fewer than `MIN_GAMES` games.
+    """
+    if board == "highscore":
+        return record.get("Highscore", 0)
+    if board == "wins":
+        return record.get("Games_Won", 0)
+    played = record.get("Games_Played", 0)
+    if played < MIN_GAMES:
+        return None
+    return record.get("Games_Won", 0) / played
+
+
+class Board:
+    """The best ``size`` players by one value, best first."""
+
+    def __init__(self, size: int = TOP_K) -> None:
+        """Initialize an empty, exact board."""
+        self.size = size
+        self.entries: list[tuple[float, str]] = []
+        self.values: dict[str, float] = {}
+        self.exact = True
+
+    def update(self, p_id: str, value: float | None) -> None:
+        """
+        Move a player to the place its new value earns.
+
+        Args:
+            p_id (str): The player.
+            value (float): The new value, None to take the player off.
+        """
+        floor = self.entries[-1][0] if self.entries else None
+        old = self.values.pop(p_id, None)
+        if old is not None:
+            del self.entries[bisect_left(self.entries, (-old, p_id))]
+            if len(self.entries) == self.size - 1 and (
+                    value is None or -value > floor):
+                self.exact = False
+        if value is None:
+            return
+        entry = (-value, p_id)
+        if len(self.entries) < self.size:
+            if old is None and not self.exact:
+                return
+            insort(self.entries, entry)
+        elif entry < self.entries[-1]:
+            _, dropped = self.entries.pop()
+            del self.values[dropped]
+            insort(self.entries, entry)
+        else:
+            return
+        self.values[p_id] = value
+
+    def rebuild(self, values: Iterable[tuple[str, float | None]]) -> None:
+        """
+        Refill the board from every player's value.
+
+        Args:
+            values (Iterable): (player, value) pairs.
+        """
+        self.entries = heapq.nsmallest(
+            self.size,
+            ((-value, p_id) for p_id, value in values if value is not None)
+        )
+        self.values = {p_id: -key for key, p_id in self.entries}
+        self.exact = True
+
+    def top(self) -> list[tuple[str, float]]:
+        """Return (player, value) pairs, best first."""
+        return [(p_id, -key) for key, p_id in self.entries]
+
+
+class Leaderboard:
+    """Rankings of the players in a `Histogram`, updated on every save."""
+
+    def __init__(
+            self, path: str = LEADERBOARD_PATH,
+            size: int = TOP_K
+            ) -> None:
+        """
+        Initialize an empty leaderboard; the file is read on first use.
+
+        Args:
+            path (str): Pickled boards.
+            size (int): Players per board.
+        """
+        self.path = path
+        self.size = size
+        self.boards = {board: Board(size) for board in BOARDS}
+        self.usernames: dict[str, str] = {}
+        self.touched: set[str] = set()
+        self.histogram: Histogram | None = None
+        self.ready = False
+
+    def attach(self, histogram: Histogram) -> None:
+        """Follow the saves of ``histogram``."""
+        self.histogram = histogram
+        histogram.listeners.append(self.update)
+
+    def prepare(self) -> None:
+        """
+        Read the boards on first use.
+
+        Without a leaderboard file the boards are built from all records
+        of the attached histogram once; the file is written with the
+        next save.
+        """
+        if self.ready:
+            return
+        if not self.load() and self.histogram is not None:
+            self.rebuild()
+        self.ready = True
+
+    def update(self, records: dict) -> None:
+        """
+        Re-rank the players in ``records`` and save the boards.
+
+        Args:
+            records (dict): Saved records keyed by player ID.
+        """
+        self.prepare()
+        for p_id, record in records.items():
+            for board, ranks in self.boards.items():
+                ranks.update(p_id, board_value(board, record))
+            self.usernames[p_id] = record.get("Username", "")
+            self.touched.add(p_id)
+        self.save()
+
+    def rebuild(self, board: str | None = None) -> None:
+        """
+        Refill boards from every record of the attached histogram.
+
+        Args:
+            board (str): The board to refill, all of them when omitted.
+        """
+        records = self.histogram.all_records()
+        for name in [board] if board else list(self.boards):
+            self.boards[name].rebuild(
+                (p_id, board_value(name, record))
+                for p_id, record in records.items()
+            )
+        for ranks in self.boards.values():
+            for p_id in ranks.values:
+                self.usernames[p_id] = records[p_id].get("Username", "")
+
+    def top(self, board: str) -> list[tuple[str, str, float]]:
+        """
+        Return the ranking on one board.
+
+        Args:
+            board (str): A key of `BOARDS`.
+
+        Returns:
+            list: (player ID, username, value) triples, best first.
+        """
+        self.prepare()
+        ranks = self.boards[board]
+        if not ranks.exact and self.histogram is not None:
+            self.rebuild(board)
+        return [(p_id, self.usernames.get(p_id, ""), value)
+                for p_id, value in ranks.top()]
+
+    def load(self) -> bool:
+        """
+        Read the boards from the leaderboard file.
+
+        Returns:
+            bool: Whether the file existed.
+        """
+        try:
+            with open(self.path, "rb") as file:
+                boards, usernames = pickle.load(file)
+        except FileNotFoundError:
+            return False
+        for name, board in boards.items():
+            if name in self.boards and board.size == self.size:
+                self.boards[name] = board
+        self.usernames = usernames
+        return True
+
+    def save(self) -> None:
+        """
+        Write the boards, merged with the copy on disk.
+
+        Players this process has not updated keep the value another
+        process saved for them, and on the `RISING` boards every player
+        keeps the larger of the two values; the merged boards replace
+        the file atomically.
+        """
+        with locked(self.path):
+            mine, names = self.boards, self.usernames
+            self.boards = {board: Board(self.size) for board in BOARDS}
+            if self.load():
+                for name, board in self.boards.items():
+                    values = dict(mine[name].top())
+                    for p_id, value in board.top():
+                        if p_id not in self.touched:
+                            values[p_id] = value
+                        elif name in RISING:
+                            values[p_id] = max(values.get(p_id, value), value)
+                    merged = Board(self.size)
+                    merged.rebuild(values.items())
+                    merged.exact = board.exact and mine[name].exact
+                    self.boards[name] = merged
+                names = {**self.usernames, **names}
+            else:
+                self.boards = mine
+            self.usernames = {
+                p_id: names.get(p_id, "")
+                for board in self.boards.values() for p_id in board.values
+            }
+            atomic_write(self.path, pickle.dumps(
+                (self.boards, self.usernames)
+            ))
+
+    def table(self) -> str:
+        """Return every board as printable rankings."""
+        lines = []
+        for board, title in BOARDS.items():
+            lines.append(f"\n--- Top {self.size} by {title} ---")
+            for place, (p_id, name, value) in enumerate(self.top(board), 1):
+                shown = f"{value:.0%}" if board == "win_rate" else value
+                lines.append(f"{place:>2}. {name or p_id:<16} {shown}")
+        return "\n".join(lines)
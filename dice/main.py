@@ -7,7 +7,8 @@ controller for the application. It handles:
 - Displaying the main menu
 - Showing game rules
 - Displaying player statistics
-- Initializing and managing core game components (`Game` and `Histogram`)
+- Initializing and managing core game components (`Game` and its shared
+  `Histogram`)
 - Running the main program loop
 
 The module can be executed directly to start the game.
@@ -15,8 +16,8 @@ The module can be executed directly to start the game.
 
 import sys
 from pathlib import Path
+from dice.event_log import EVENT_LOG_PATH, EventLog
 from dice.game import Game
-from dice.histogram import Histogram
 
 
 class Main:
@@ -27,10 +28,16 @@ class Main:
     and initializes core game components.
     """
 
-    def __init__(self):  # pragma: no cover
-        """Initialize the Main controller with game and histogram managers."""
-        self.game = Game()
-        self.histogram = Histogram()
+    def __init__(self, stats_db: str | None = None):  # pragma: no cover
+        """
+        Initialize the Main controller with game and histogram managers.
+
+        Args:
+            stats_db (str): SQLite database for player stats; the pickle
+            files are used when omitted.
+        """
+        self.game = Game(event_log=EventLog(EVENT_LOG_PATH), stats_db=stats_db)
+        self.histogram = self.game.histogram
 
     def menu(self) -> str:  # pragma: no cover
         """
@@ -59,8 +66,15 @@ class Main:
         Display stored player statistics such as high scores.
 
         games played, wins, and losses.
+
+        The rankings come first, straight from the leaderboard; the
+        records are served from memory unless another process has saved
+        since they were read.
         """
-        stats_dict = self.histogram.load_stats_file()
+        print(self.game.leaderboard.table())
+        print("\n--- All players ---")
+        self.histogram.refresh()
+        stats_dict = self.histogram.all_records()
         for key in stats_dict.values():
             lst = list(key.values())
             print(f"\nUsername: {lst[0]}")
@@ -90,6 +104,7 @@ class Main:
                     print("\n------- Player Statistics -------")
                     self.display_stats()
                 case "3":
+                    self.game.event_log.close()
                     break
                 case _:
                     print("Wrong Input! Enter Valid Option.")
@@ -0,0 +1,230 @@
+"""
+Time-budgeted Monte Carlo tree search for the computer player.
+
+This module provides the `MonteCarloSearch` class, an anytime opponent
+for rule variants without precomputed tables:
+
+- Each search iteration walks a UCT tree over (own score, opponent score,
+  turn total) states, sampling dice at chance steps
+- New states are valued by a headless rollout that plays the rest of the
+  game with a fast hold-at-20 policy on a `RollTape`
+- Search stops when the millisecond budget runs out and the most visited
+  action so far is returned
+- The tree is kept between decisions of the same turn and cleared when a
+  new turn starts
+"""
+
+import math
+import time
+from dice.dice_hand import OUTCOMES, TOTALS, Outcome, RollTape
+from dice.engine import TARGET
+from dice.rng import RngStream
+
+ROLLOUT_HOLD = 20
+EXPLORATION = 1.4
+MAX_DEPTH = 200
+CLOCK_CHECK = 16
+
+
+class SearchNode:
+    """Visit and win counts for the two actions at one decision state."""
+
+    __slots__ = ("visits", "roll_visits", "roll_wins", "hold_visits",
+                 "hold_wins")
+
+    def __init__(self) -> None:
+        """Initialize a node that has not been visited."""
+        self.visits = 0
+        self.roll_visits = 0
+        self.roll_wins = 0.0
+        self.hold_visits = 0
+        self.hold_wins = 0.0
+
+    def select(self, can_hold: bool) -> bool:
+        """
+        Choose the action to explore with UCB1.
+
+        Args:
+            can_hold (bool): False at the start of a turn.
+
+        Returns:
+            bool: True to roll, False to hold.
+        """
+        if not can_hold or self.roll_visits == 0:
+            return True
+        if self.hold_visits == 0:
+            return False
+        log_visits = math.log(self.visits)
+        roll = self.roll_wins / self.roll_visits + EXPLORATION * math.sqrt(
+            log_visits / self.roll_visits
+        )
+        hold = self.hold_wins / self.hold_visits + EXPLORATION * math.sqrt(
+            log_visits / self.hold_visits
+        )
+        return roll >= hold
+
+    def update(self, roll: bool, value: float) -> None:
+        """Record the outcome of one iteration through this node."""
+        self.visits += 1
+        if roll:
+            self.roll_visits += 1
+            self.roll_wins += value
+        else:
+            self.hold_visits += 1
+            self.hold_wins += value
+
+
+class MonteCarloSearch:
+    """
+    Anytime roll/hold search for one computer player in one game.
+
+    The instance holds the search tree, so create one per game.
+    """
+
+    def __init__(
+            self, rng: RngStream | None = None,
+            budget_ms: float = 100.0,
+            max_iterations: int | None = None,
+            target: int = TARGET
+            ) -> None:
+        """
+        Initialize the search.
+
+        Args:
+            rng (RngStream): Stream for sampled dice, a fresh one when omitted.
+            budget_ms (float): Time allowed per decision in milliseconds.
+            max_iterations (int): Optional cap on iterations per decision,
+            which makes the search deterministic for a seeded stream.
+            target (int): Score needed to win.
+        """
+        if rng is None:
+            rng = RngStream()
+        self.tape = RollTape(rng.generator)
+        self.budget_ms = budget_ms
+        self.max_iterations = max_iterations
+        self.target = target
+        self.tree: dict[tuple[int, int, int], SearchNode] = {}
+        self.turn: tuple[int, int] | None = None
+        self.iterations = 0
+
+    def decide(self, turn_total: int, score: int, opponent: int) -> bool:
+        """
+        Search from the current state until the budget runs out.
+
+        Args:
+            turn_total (int): Points accumulated so far this turn.
+            score (int): The computer's banked score.
+            opponent (int): The opponent's banked score.
+
+        Returns:
+            bool: True to roll again, False to hold.
+        """
+        if score + turn_total >= self.target:
+            return False
+        if self.turn != (score, opponent) or turn_total == 0:
+            self.tree.clear()
+            self.turn = (score, opponent)
+
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        iterations = 0
+        while True:
+            self._search(score, opponent, turn_total, 0)
+            iterations += 1
+            if iterations == self.max_iterations:
+                break
+            if (iterations % CLOCK_CHECK == 0
+                    and time.perf_counter() >= deadline):
+                break
+        self.iterations = iterations
+
+        node = self.tree[(score, opponent, turn_total)]
+        if turn_total == 0:
+            return True
+        return node.roll_visits >= node.hold_visits
+
+    def _search(
+            self, score: int,
+            opponent: int,
+            turn_total: int,
+            depth: int
+            ) -> float:
+        """Run one iteration and return the mover's sampled result."""
+        key = (score, opponent, turn_total)
+        node = self.tree.get(key)
+        if node is None or depth >= MAX_DEPTH:
+            if node is None:
+                self.tree[key] = SearchNode()
+            return self.rollout(score, opponent, turn_total)
+
+        roll = node.select(turn_total > 0)
+        if roll:
+            value = self._roll(score, opponent, turn_total, depth)
+        elif score + turn_total >= self.target:
+            value = 1.0
+        else:
+            value = 1.0 - self._search(
+                opponent, score + turn_total, 0, depth + 1
+            )
+        node.update(roll, value)
+        return value
+
+    def _roll(
+            self, score: int,
+            opponent: int,
+            turn_total: int,
+            depth: int
+            ) -> float:
+        """Sample dice until the next decision or the end of the turn."""
+        while True:
+            left, right = self.tape.next_pair()
+            index = left * 6 + right - 7
+            outcome = OUTCOMES[index]
+            if outcome == Outcome.SNAKE_EYES:
+                return 1.0 - self._search(opponent, 0, 0, depth + 1)
+            if outcome == Outcome.BUST:
+                return 1.0 - self._search(opponent, score, 0, depth + 1)
+            turn_total += TOTALS[index]
+            if outcome != Outcome.REROLL:
+                return self._search(score, opponent, turn_total, depth + 1)
+
+    def rollout(  # pylint: disable=too-many-locals
+            self, score: int, opponent: int, turn_total: int
+            ) -> float:
+        """
+        Play the rest of the game headlessly with a hold-at-20 policy.
+
+        Args:
+            score (int): The mover's banked score.
+            opponent (int): The opponent's banked score.
+            turn_total (int): Points already accumulated this turn.
+
+        Returns:
+            float: 1.0 if the player to move wins, otherwise 0.0.
+        """
+        next_pair = self.tape.next_pair
+        outcomes = OUTCOMES
+        totals = TOTALS
+        target = self.target
+        scores = [score, opponent]
+        mover = 0
+        must_roll = turn_total == 0
+        while True:
+            banked = scores[mover] + turn_total
+            if not must_roll and (banked >= target
+                                  or turn_total >= ROLLOUT_HOLD):
+                if banked >= target:
+                    return 1.0 if mover == 0 else 0.0
+                scores[mover] = banked
+                mover, turn_total, must_roll = 1 - mover, 0, True
+                continue
+            left, right = next_pair()
+            index = left * 6 + right - 7
+            outcome = outcomes[index]
+            if outcome == Outcome.SNAKE_EYES:
+                scores[mover] = 0
+                mover, turn_total, must_roll = 1 - mover, 0, True
+            elif outcome == Outcome.BUST:
+                mover, turn_total, must_roll = 1 - mover, 0, True
+            else:
+                turn_total += totals[index]
+                must_roll = outcome == Outcome.REROLL
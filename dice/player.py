@@ -1,5 +1,6 @@
 """Player module for managing individual game participants and their statistics."""
 import pickle
+from dice.file_lock import atomic_write, locked
 
 
 class Player:
@@ -32,8 +33,21 @@ class Player:
         self.__userid = p_id
         if self.__userid not in self.user_id_list:
             self.user_id_list.add(self.__userid)
-            with open('dice/user_id.ser', 'wb') as ids:
-                pickle.dump(self.user_id_list, ids)
+            self.save_user_ids()
+
+    def save_user_ids(self) -> None:  # pragma: no cover
+        """
+        Write the set of existing player IDs to persistent storage.
+
+        The file is re-read under a cross-process lock and merged with
+        this player's IDs before it is atomically replaced, so IDs
+        registered by other players or processes are kept.
+        """
+        with locked('dice/user_id.ser'):
+            self.user_id_list = set(self.user_id_list) | set(
+                self.get_user_id_list()
+            )
+            atomic_write('dice/user_id.ser', pickle.dumps(self.user_id_list))
 
     def set_username(self, name: str) -> None:  # pragma: no cover
         """
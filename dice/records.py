@@ -0,0 +1,169 @@
+"""
+Compact storage for player statistics records.
+
+This module provides `PlayerRecords`, the container `Histogram` keeps
+its statistics in. It replaces one five-key dict per player with
+struct-of-arrays columns:
+
+- The highscore and the games played, won and lost of every player sit
+  in four ``array("i")`` columns, one row per player
+- Usernames are interned in a shared table and each row stores its
+  index, so repeated or empty names cost four bytes
+- The container behaves like the old ``{id: {"Username": ..., ...}}``
+  dict; indexing it returns a `RecordView`, a two-slot mapping that reads
+  and writes the player's row in place
+- Pickling stores the columns as raw bytes, so saving and loading a
+  large population is a handful of large copies instead of millions of
+  small objects
+
+A record costs 20 bytes of columns plus its index entry, against
+several hundred bytes for the dict and int objects it replaces.
+"""
+
+from array import array
+from collections.abc import Mapping, MutableMapping
+from typing import Iterator
+
+FIELDS = ("Username", "Highscore", "Games_Played", "Games_Won", "Games_Lost")
+COLUMNS = FIELDS[1:]
+
+
+class RecordView(MutableMapping):
+    """Dict-like view of one player's row in a `PlayerRecords`."""
+
+    __slots__ = ("table", "row")
+
+    def __init__(self, table: "PlayerRecords", row: int) -> None:
+        """Initialize a view of ``row`` in ``table``."""
+        self.table = table
+        self.row = row
+
+    def __getitem__(self, key: str) -> str | int:
+        """Return one field of the record."""
+        if key == "Username":
+            return self.table.names[self.table.usernames[self.row]]
+        return self.table.columns[key][self.row]
+
+    def __setitem__(self, key: str, value: str | int) -> None:
+        """Update one field of the record."""
+        if key == "Username":
+            self.table.usernames[self.row] = self.table.intern(value)
+        else:
+            self.table.columns[key][self.row] = value
+
+    def __delitem__(self, key: str) -> None:
+        """Refuse: records always have every field."""
+        raise TypeError("Record fields cannot be deleted")
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the field names in their usual order."""
+        return iter(FIELDS)
+
+    def __len__(self) -> int:
+        """Return the number of fields."""
+        return len(FIELDS)
+
+    def __repr__(self) -> str:
+        """Show the record like the dict it stands for."""
+        return repr(dict(self))
+
+
+class PlayerRecords(MutableMapping):
+    """Player statistics keyed by ID, stored column by column."""
+
+    def __init__(self, records: Mapping | None = None) -> None:
+        """
+        Initialize the records, copying ``records`` if given.
+
+        Args:
+            records (Mapping): Existing ``{id: record}`` statistics; fields
+            missing from a record count as empty or zero.
+        """
+        self.ids: list[str] = []
+        self.index: dict[str, int] = {}
+        self.names: list[str] = [""]
+        self.name_index: dict[str, int] = {"": 0}
+        self.usernames = array("I")
+        self.columns = {column: array("i") for column in COLUMNS}
+        if records:
+            for p_id, record in records.items():
+                self[p_id] = record
+
+    def intern(self, name: str) -> int:
+        """Return the index of ``name`` in the username table, adding it."""
+        number = self.name_index.get(name)
+        if number is None:
+            number = self.name_index[name] = len(self.names)
+            self.names.append(name)
+        return number
+
+    def __getitem__(self, p_id: str) -> RecordView:
+        """Return a live view of one player's record."""
+        return RecordView(self, self.index[p_id])
+
+    def __setitem__(self, p_id: str, record: Mapping) -> None:
+        """Store a copy of ``record`` as the player's statistics."""
+        row = self.index.get(p_id)
+        if row is None:
+            row = self.index[p_id] = len(self.ids)
+            self.ids.append(p_id)
+            self.usernames.append(0)
+            for values in self.columns.values():
+                values.append(0)
+        self.usernames[row] = self.intern(record.get("Username", ""))
+        for column, values in self.columns.items():
+            values[row] = record.get(column, 0)
+
+    def __delitem__(self, p_id: str) -> None:
+        """Remove a player, moving the last row into its place."""
+        row = self.index.pop(p_id)
+        last = self.ids.pop()
+        if last != p_id:
+            self.ids[row] = last
+            self.index[last] = row
+            self.usernames[row] = self.usernames[-1]
+            for values in self.columns.values():
+                values[row] = values[-1]
+        self.usernames.pop()
+        for values in self.columns.values():
+            values.pop()
+
+    def __contains__(self, p_id: object) -> bool:
+        """Return whether the player has a record."""
+        return p_id in self.index
+
+    def setdefault(
+            self, key: str,
+            default: Mapping | None = None
+            ) -> RecordView:
+        """Return the player's record, storing ``default`` first if missing."""
+        if key not in self.index:
+            self[key] = default if default is not None else {}
+        return self[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the player IDs in insertion order."""
+        return iter(list(self.ids))
+
+    def __len__(self) -> int:
+        """Return the number of players."""
+        return len(self.ids)
+
+    def __repr__(self) -> str:
+        """Show the records like the dict they stand for."""
+        return f"PlayerRecords({len(self)} players)"
+
+    def __getstate__(self) -> tuple:
+        """Pickle the IDs, the name table and the raw columns."""
+        return (self.ids, self.names, self.usernames.tobytes(),
+                [self.columns[column].tobytes() for column in COLUMNS])
+
+    def __setstate__(self, state: tuple) -> None:
+        """Rebuild the records and their lookup tables from a pickle."""
+        self.ids, self.names, usernames, columns = state
+        self.index = {p_id: row for row, p_id in enumerate(self.ids)}
+        self.name_index = {name: number
+                           for number, name in enumerate(self.names)}
+        self.usernames = array("I", usernames)
+        self.columns = {column: array("i", data)
+                        for column, data in zip(COLUMNS, columns)}
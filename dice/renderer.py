@@ -0,0 +1,92 @@
+"""
+Output sinks for the game's text and events.
+
+This module provides the renderers `Game` writes all of its output to,
+so the same game logic can run in a terminal, in a simulation or behind
+a server:
+
+- `Renderer` prints every line immediately
+- `BufferedRenderer` collects lines and writes them to the terminal in
+  one go, once per turn or before the next prompt
+- `SilentRenderer` drops everything
+- `StructuredRenderer` drops the text and passes each engine event on as
+  a JSON-ready dictionary
+"""
+
+import sys
+from typing import Callable
+from dice.engine import Event, GameEngine
+
+
+def event_message(event: Event, engine: GameEngine) -> dict:
+    """Return the JSON-ready form of an engine event."""
+    return {
+        "event": event.kind.name.lower(),
+        "seat": event.seat,
+        "player": engine.players[event.seat],
+        "turn_total": event.turn_total,
+        "score": event.score,
+        "faces": list(event.faces) if event.faces else None,
+    }
+
+
+class Renderer:
+    """Unbuffered terminal output, the behaviour of plain ``print``."""
+
+    def write(self, text: str) -> None:
+        """Output one line of text."""
+        print(text)
+
+    def event(self, event: Event, engine: GameEngine) -> None:
+        """Receive an engine event; text renderers ignore it."""
+
+    def flush(self) -> None:
+        """Make everything written so far visible."""
+
+
+class BufferedRenderer(Renderer):
+    """Terminal output written in one block per flush."""
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer."""
+        self.lines: list[str] = []
+
+    def write(self, text: str) -> None:
+        """Queue one line of text."""
+        self.lines.append(text)
+
+    def flush(self) -> None:
+        """Write the queued lines to standard output with a single call."""
+        if self.lines:
+            self.lines.append("")
+            sys.stdout.write("\n".join(self.lines))
+            sys.stdout.flush()
+            self.lines.clear()
+
+
+class SilentRenderer(Renderer):
+    """Output sink for simulations: nothing is shown."""
+
+    def write(self, text: str) -> None:
+        """Discard the text."""
+
+
+class StructuredRenderer(Renderer):
+    """Passes engine events on as dictionaries instead of text."""
+
+    def __init__(self, emit: Callable[[dict], None]) -> None:
+        """
+        Initialize the renderer.
+
+        Args:
+            emit (Callable): Called with one dictionary per engine event,
+            in the format of `event_message`.
+        """
+        self.emit = emit
+
+    def write(self, text: str) -> None:
+        """Discard the text; the events carry the same information."""
+
+    def event(self, event: Event, engine: GameEngine) -> None:
+        """Pass the event on as a dictionary."""
+        self.emit(event_message(event, engine))
@@ -0,0 +1,339 @@
+"""
+Asyncio game server hosting many concurrent Two-Dice Pig matches.
+
+This module provides the `GameServer` class, which serves one `Session`
+per connection over TCP or a Unix socket:
+
+- The protocol is one JSON object per line; every command gets exactly
+  one JSON reply line with the events it caused and the new match state
+- Each session owns its own `GameEngine`, dice stream and AI state, so
+  matches never share mutable state
+- Replies are awaited with `drain()`, so a slow reader pauses only its
+  own session, and commands are read one at a time with a line limit
+- Connections idle for longer than the timeout are closed
+- Computer turns run in a thread pool so `Intelligence` never blocks the
+  event loop
+
+Commands::
+
+    {"cmd": "new", "mode": "pvc", "level": "hard", "names": ["Ann"]}
+    {"cmd": "new", "mode": "pvp", "names": ["Ann", "Bob"]}
+    {"cmd": "roll"}
+    {"cmd": "hold"}
+    {"cmd": "state"}
+    {"cmd": "quit"}
+
+The module can be executed directly to start a server.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from dice.dice_hand import DiceHand
+from dice.engine import Action, Event, GameEngine, Phase
+from dice.game import COMPUTER
+from dice.renderer import event_message
+from dice.rng import RngStream
+from dice.simulation import Decider, LEVELS, make_decider
+
+IDLE_TIMEOUT = 300.0
+MAX_LINE = 4096
+MAX_SESSIONS = 10000
+AI_WORKERS = 4
+
+
+class ProtocolError(Exception):
+    """A command that cannot be applied to the session."""
+
+
+def field(message: dict, key: str, kind: type, default: object) -> object:
+    """
+    Return one field of a command, checking its JSON type.
+
+    Args:
+        message (dict): The command.
+        key (str): The field.
+        kind (type): The Python type the field must decode to.
+        default: Value used when the field is missing.
+
+    Returns:
+        The field's value, or ``default``.
+    """
+    value = message.get(key, default)
+    if not isinstance(value, kind):
+        raise ProtocolError(f"{key} must be a {kind.__name__}")
+    return value
+
+
+class Session:
+    """One match hosted for one connection."""
+
+    def __init__(self, rng: RngStream) -> None:
+        """
+        Initialize a session that has not started a match yet.
+
+        Args:
+            rng (RngStream): Stream for this session's dice and AI search.
+        """
+        self.rng = rng
+        self.engine: GameEngine | None = None
+        self.computer_seat: int | None = None
+        self.decide: Decider | None = None
+
+    def new_match(self, message: dict) -> None:
+        """
+        Start a PvP or PvC match described by a ``new`` command.
+
+        Args:
+            message (dict): The command with ``mode``, ``names`` and, for
+            PvC, ``level`` (a name from `LEVELS`).
+        """
+        mode = field(message, "mode", str, "pvc")
+        names = field(message, "names", list, [])
+        if not all(isinstance(name, str) for name in names):
+            raise ProtocolError("names must be strings")
+        if mode == "pvp":
+            names = (names + ["Player 1", "Player 2"][len(names):])[:2]
+            self.computer_seat = None
+            self.decide = None
+        elif mode == "pvc":
+            level = field(message, "level", str, "easy")
+            if level not in LEVELS:
+                raise ProtocolError(f"unknown level: {level}")
+            self.decide = make_decider(level, self.rng)
+            names = (names or ["Player"])[:1] + [COMPUTER]
+            self.computer_seat = 1
+        else:
+            raise ProtocolError(f"unknown mode: {mode}")
+        self.engine = GameEngine(names, DiceHand(self.rng))
+
+    def human_action(self, action: Action) -> list[Event]:
+        """
+        Apply a roll or hold for the human to move.
+
+        Returns:
+            list: The emitted events, up to the end of the human's turn.
+        """
+        engine = self.require_engine()
+        if engine.phase == Phase.GAME_OVER:
+            raise ProtocolError("game is over")
+        if engine.current == self.computer_seat:
+            raise ProtocolError("not your turn")
+        if action not in engine.legal_actions():
+            raise ProtocolError(f"cannot {action.name.lower()} now")
+        events = engine.step(action)
+        if engine.phase == Phase.TURN_OVER:
+            events += engine.next_turn()
+        return events
+
+    def computer_to_move(self) -> bool:
+        """Return True when the computer seat has the dice."""
+        return (self.engine is not None
+                and self.engine.current == self.computer_seat
+                and self.engine.phase != Phase.GAME_OVER)
+
+    def play_computer_turn(self) -> list[Event]:
+        """
+        Play the computer's whole turn; blocking, so run it off the loop.
+
+        Returns:
+            list: The emitted events, including the hand-over.
+        """
+        engine = self.require_engine()
+        seat = engine.current
+        events: list[Event] = []
+        while engine.phase in (Phase.MUST_ROLL, Phase.MAY_HOLD):
+            if engine.phase == Phase.MAY_HOLD and not self.decide(
+                    engine.turn_total, engine.scores[seat],
+                    engine.leading_opponent(seat)):
+                events += engine.hold()
+            else:
+                events += engine.step(Action.ROLL)
+        if engine.phase == Phase.TURN_OVER:
+            events += engine.next_turn()
+        return events
+
+    def require_engine(self) -> GameEngine:
+        """Return the match engine, failing if no match was started."""
+        if self.engine is None:
+            raise ProtocolError("no match, send a new command first")
+        return self.engine
+
+    def state(self) -> dict | None:
+        """Return the JSON-ready match state, None before a match."""
+        engine = self.engine
+        if engine is None:
+            return None
+        return {
+            "players": list(engine.players),
+            "scores": list(engine.scores),
+            "current": engine.current,
+            "turn_total": engine.turn_total,
+            "phase": engine.phase.name.lower(),
+            "winner": engine.winner,
+            "actions": [action.name.lower()
+                        for action in engine.legal_actions()],
+        }
+
+
+class GameServer:
+    """Line-JSON server multiplexing one `Session` per connection."""
+
+    def __init__(
+            self, seed: int | None = None,
+            idle_timeout: float = IDLE_TIMEOUT,
+            max_sessions: int = MAX_SESSIONS,
+            ai_workers: int = AI_WORKERS
+            ) -> None:
+        """
+        Initialize the server without binding a socket.
+
+        Args:
+            seed (int): Root seed; sessions get child streams in connection
+            order, so a seeded server is reproducible.
+            idle_timeout (float): Seconds a connection may stay silent.
+            max_sessions (int): Connections served at once; more are
+            refused with an error line.
+            ai_workers (int): Threads available for computer turns.
+        """
+        self.root = RngStream(seed)
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.executor = ThreadPoolExecutor(max_workers=ai_workers)
+        self.sessions: set[Session] = set()
+        self.server: asyncio.AbstractServer | None = None
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0):
+        """Listen on a TCP port (0 picks a free one) and return the server."""
+        self.server = await asyncio.start_server(
+            self.handle_connection, host, port, limit=MAX_LINE
+        )
+        return self.server
+
+    async def start_unix(self, path: str):
+        """Listen on a Unix socket and return the server."""
+        self.server = await asyncio.start_unix_server(
+            self.handle_connection, path, limit=MAX_LINE
+        )
+        return self.server
+
+    async def close(self) -> None:
+        """Stop listening and release the AI threads."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def send(self, writer: asyncio.StreamWriter, reply: dict) -> None:
+        """Write one reply line and wait for the client to take it."""
+        writer.write(json.dumps(reply).encode() + b"\n")
+        await writer.drain()
+
+    async def handle_connection(
+            self, reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter
+            ) -> None:
+        """Serve one client until it quits, goes idle or disconnects."""
+        if len(self.sessions) >= self.max_sessions:
+            await self.send(writer, {"error": "server full"})
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+            return
+        session = Session(self.root.spawn(1)[0])
+        self.sessions.add(session)
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for(
+                        reader.readline(), self.idle_timeout
+                    )
+                except asyncio.TimeoutError:
+                    await self.send(writer, {"error": "idle timeout"})
+                    break
+                except ValueError:
+                    await self.send(writer, {"error": "line too long"})
+                    break
+                if not line:
+                    break
+                reply = await self.dispatch(session, line)
+                await self.send(writer, reply)
+                if reply.get("bye"):
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions.discard(session)
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def dispatch(self, session: Session, line: bytes) -> dict:
+        """
+        Apply one command line to a session.
+
+        Returns:
+            dict: The reply, either ``events`` and ``state`` or ``error``.
+        """
+        try:
+            message = json.loads(line)
+            if not isinstance(message, dict):
+                raise ProtocolError("expected a JSON object")
+            command = field(message, "cmd", str, "")
+            events: list[Event] = []
+            if command == "new":
+                session.new_match(message)
+                events = session.engine.reset()
+            elif command in ("roll", "hold"):
+                action = Action.ROLL if command == "roll" else Action.HOLD
+                events = session.human_action(action)
+            elif command == "quit":
+                return {"bye": True, "state": session.state()}
+            elif command != "state":
+                raise ProtocolError(f"unknown command: {command}")
+            if session.computer_to_move():
+                loop = asyncio.get_running_loop()
+                events += await loop.run_in_executor(
+                    self.executor, session.play_computer_turn
+                )
+        except (ValueError, ProtocolError) as error:
+            return {"error": str(error)}
+        engine = session.engine
+        return {
+            "events": [event_message(event, engine) for event in events],
+            "state": session.state(),
+        }
+
+
+async def serve(args: argparse.Namespace) -> None:  # pragma: no cover
+    """Run a server from parsed command-line options until cancelled."""
+    server = GameServer(args.seed, args.idle_timeout, args.max_sessions)
+    if args.unix:
+        listener = await server.start_unix(args.unix)
+    else:
+        listener = await server.start_tcp(args.host, args.port)
+    for sock in listener.sockets:
+        print(f"Serving Two-Dice Pig on {sock.getsockname()}")
+    try:
+        await listener.serve_forever()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+    PARSER = argparse.ArgumentParser(description="Two-Dice Pig game server")
+    PARSER.add_argument("--host", default="127.0.0.1")
+    PARSER.add_argument("--port", type=int, default=8765)
+    PARSER.add_argument("--unix", help="serve on this Unix socket instead")
+    PARSER.add_argument("--seed", type=int)
+    PARSER.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT)
+    PARSER.add_argument("--max-sessions", type=int, default=MAX_SESSIONS)
+    try:
+        asyncio.run(serve(PARSER.parse_args()))
+    except KeyboardInterrupt:
+        pass
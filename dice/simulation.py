@@ -0,0 +1,387 @@
+"""
+Headless AI-vs-AI simulation for Two-Dice Pig.
+
+This module plays complete computer turns and games without any terminal
+I/O, following the same rules and `Intelligence` calls as
+`Game.play_turn`, and spreads large numbers of games over a process pool:
+
+- Every roll goes through `dice.engine.roll_rules`, the rules the
+  `GameEngine` itself applies, without building an engine per game
+- Games are split into fixed-size chunks, each rolled from its own child
+  `RngStream`, so results for a seed do not depend on the worker count
+- Seats alternate who starts, which measures first-mover advantage
+- Results are aggregated into win rates with 95% Wilson confidence
+  intervals, mean game length, final score distributions and games per
+  second
+"""
+
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from typing import Callable
+from dice.dice_hand import DiceHand
+from dice.engine import TARGET, Phase, roll_rules
+from dice.intelligence import Intelligence
+from dice.mcts import MonteCarloSearch
+from dice.rng import RngStream
+
+LEVELS = {"easy": "1", "mid": "2", "hard": "3", "optimal": "4", "mcts": "5"}
+CHUNK_SIZE = 5000
+TAPE_SIZE = 1 << 16
+SCORE_BUCKET = 10
+BUCKETS = TARGET // SCORE_BUCKET + 1
+
+Decider = Callable[[int, int, int], bool]
+AI = Intelligence()
+
+
+def make_decider(level: str, stream: RngStream | None = None) -> Decider:
+    """
+    Build a roll/hold decision function for an AI level.
+
+    The returned function takes (turn total, own score, opponent score)
+    and returns True to keep rolling. All deciders share one stateless
+    `Intelligence`; each owns fresh per-game state, so use one decider per
+    seat per game.
+
+    Args:
+        level (str): One of the names in `LEVELS`.
+        stream (RngStream): Stream the MCTS search spawns its dice from,
+        fresh entropy when omitted; other levels ignore it.
+
+    Returns:
+        Callable: The decision function.
+    """
+    if level == "easy":
+        return lambda turn_total, score, opponent: AI.easy(turn_total) == 'y'
+    if level == "mid":
+        state = AI.new_state()
+        return lambda turn_total, score, opponent: (
+            AI.mid(turn_total, score, False, state) == 'y'
+        )
+    if level == "hard":
+        return lambda turn_total, score, opponent: (
+            AI.hard(turn_total, opponent, score) == 'y'
+        )
+    if level == "optimal":
+        return lambda turn_total, score, opponent: (
+            AI.optimal(turn_total, score, opponent) == 'y'
+        )
+    if level == "mcts":
+        rng = stream.spawn(1)[0] if stream is not None else None
+        return MonteCarloSearch(rng).decide
+    raise ValueError(f"Unknown AI level: {level}")
+
+
+def play_turn(
+        hand: DiceHand,
+        decide: Decider,
+        score: int,
+        opponent: int
+        ) -> int:
+    """
+    Play one computer turn and return the player's new score.
+
+    Args:
+        hand (DiceHand): Dice to roll with.
+        decide (Callable): Decision function from `make_decider`.
+        score (int): The player's score before the turn.
+        opponent (int): The opponent's score.
+
+    Returns:
+        int: The score after the turn (0 after snake eyes).
+    """
+    turn_total = 0
+    while True:
+        result = hand.evaluate_roll()
+        turn_total, score, phase = roll_rules(
+            result["outcome"], result["total"], turn_total, score
+        )
+        if phase is Phase.TURN_OVER:
+            return score
+        if phase is Phase.MAY_HOLD and not decide(turn_total, score, opponent):
+            return score + turn_total
+
+
+def play_game(
+        hand: DiceHand,
+        deciders: tuple[Decider, Decider],
+        first: int = 0
+        ) -> tuple[int, int, list[int]]:
+    """
+    Play a full game between two computer players.
+
+    Args:
+        hand (DiceHand): Dice to roll with.
+        deciders (tuple): Decision function for seat 0 and seat 1.
+        first (int): Seat that takes the first turn.
+
+    Returns:
+        tuple: Winning seat, number of turns played and the final scores.
+    """
+    scores = [0, 0]
+    seat = first
+    turns = 0
+    while True:
+        turns += 1
+        scores[seat] = play_turn(
+            hand, deciders[seat], scores[seat], scores[1 - seat]
+        )
+        if scores[seat] >= TARGET:
+            return seat, turns, scores
+        seat = 1 - seat
+
+
+class MatchupResult:  # pylint: disable=too-many-instance-attributes
+    """Aggregated outcome of many games between two AI levels."""
+
+    def __init__(self, levels: tuple[str, str]) -> None:
+        """
+        Initialize empty counters for a pairing.
+
+        Args:
+            levels (tuple): AI level of seat 0 and seat 1.
+        """
+        self.levels = levels
+        self.games = 0
+        self.wins = [0, 0]
+        self.first_mover_wins = 0
+        self.turns = 0
+        self.score_totals = [0, 0]
+        self.high_scores = [0, 0]
+        self.score_counts = [[0] * BUCKETS, [0] * BUCKETS]
+        self.seconds = 0.0
+
+    def record(
+            self, winner: int,
+            first: int,
+            turns: int,
+            scores: list[int]
+            ) -> None:
+        """
+        Add one finished game.
+
+        Args:
+            winner (int): Winning seat.
+            first (int): Seat that took the first turn.
+            turns (int): Turns played.
+            scores (list): Final score of each seat.
+        """
+        self.games += 1
+        self.wins[winner] += 1
+        self.turns += turns
+        if winner == first:
+            self.first_mover_wins += 1
+        for seat, score in enumerate(scores):
+            self.score_totals[seat] += score
+            self.high_scores[seat] = max(self.high_scores[seat], score)
+            self.score_counts[seat][min(score // SCORE_BUCKET, BUCKETS - 1)] += 1
+
+    def merge(self, other: "MatchupResult") -> None:
+        """Add the counters of another result for the same pairing."""
+        self.games += other.games
+        self.wins[0] += other.wins[0]
+        self.wins[1] += other.wins[1]
+        self.first_mover_wins += other.first_mover_wins
+        self.turns += other.turns
+        for seat in (0, 1):
+            self.score_totals[seat] += other.score_totals[seat]
+            self.high_scores[seat] = max(
+                self.high_scores[seat], other.high_scores[seat]
+            )
+            self.score_counts[seat] = [
+                mine + theirs for mine, theirs in
+                zip(self.score_counts[seat], other.score_counts[seat])
+            ]
+
+    def win_rate(self, seat: int) -> float:
+        """Return the fraction of games won by ``seat``."""
+        return self.wins[seat] / self.games if self.games else 0.0
+
+    def confidence_interval(self, seat: int, z: float = 1.96) -> tuple:
+        """
+        Return the Wilson score interval for the win rate of ``seat``.
+
+        Args:
+            seat (int): Seat index.
+            z (float): Normal quantile, 1.96 for a 95% interval.
+
+        Returns:
+            tuple: Lower and upper bound.
+        """
+        if not self.games:
+            return 0.0, 1.0
+        rate = self.win_rate(seat)
+        denominator = 1 + z * z / self.games
+        centre = rate + z * z / (2 * self.games)
+        margin = z * math.sqrt(
+            rate * (1 - rate) / self.games + z * z / (4 * self.games ** 2)
+        )
+        return (
+            (centre - margin) / denominator,
+            (centre + margin) / denominator,
+        )
+
+    def mean_score(self, seat: int) -> float:
+        """Return the average final score of ``seat``."""
+        return self.score_totals[seat] / self.games if self.games else 0.0
+
+    def score_distribution(self, seat: int) -> list[float]:
+        """
+        Return the share of games ending in each score bucket for ``seat``.
+
+        Buckets are `SCORE_BUCKET` points wide; the last one holds every
+        score of `TARGET` or more.
+        """
+        if not self.games:
+            return [0.0] * BUCKETS
+        return [count / self.games for count in self.score_counts[seat]]
+
+    @property
+    def mean_game_length(self) -> float:
+        """Return the average number of turns per game."""
+        return self.turns / self.games if self.games else 0.0
+
+    @property
+    def first_mover_win_rate(self) -> float:
+        """Return the fraction of games won by the seat that started."""
+        return self.first_mover_wins / self.games if self.games else 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        """Return the simulation throughput."""
+        return self.games / self.seconds if self.seconds else 0.0
+
+    def report(self) -> str:
+        """Return a human-readable summary of the matchup."""
+        lines = [f"{self.levels[0]} vs {self.levels[1]}: {self.games} games"]
+        for seat in (0, 1):
+            low, high = self.confidence_interval(seat)
+            lines.append(
+                f"  {self.levels[seat]:>8} wins {self.win_rate(seat):7.2%}"
+                f"  (95% CI {low:.2%} - {high:.2%})"
+            )
+        lines.append(f"  Mean game length: {self.mean_game_length:.2f} turns")
+        labels = [
+            f"{low}-{low + SCORE_BUCKET - 1}"
+            for low in range(0, TARGET, SCORE_BUCKET)
+        ] + [f"{TARGET}+"]
+        lines.append(
+            f"  {'Scores':>8}  {'mean':>5}"
+            + "".join(f"{label:>7}" for label in labels)
+        )
+        for seat in (0, 1):
+            lines.append(
+                f"  {self.levels[seat]:>8}  {self.mean_score(seat):5.1f}"
+                + "".join(
+                    f"{share:7.1%}" for share in self.score_distribution(seat)
+                )
+            )
+        lines.append(f"  First mover wins: {self.first_mover_win_rate:.2%}")
+        lines.append(f"  Games per second: {self.games_per_second:,.0f}")
+        return "\n".join(lines)
+
+
+def simulate_chunk(
+        levels: tuple[str, str],
+        games: int,
+        stream: RngStream,
+        first_game: int = 0
+        ) -> MatchupResult:
+    """
+    Play ``games`` games in the current process.
+
+    Seat 0 starts the even-numbered games and seat 1 the odd ones, counted
+    from ``first_game``.
+
+    Args:
+        levels (tuple): AI level of seat 0 and seat 1.
+        games (int): Number of games to play.
+        stream (RngStream): Random stream for this chunk.
+        first_game (int): Index of the first game, used for alternation.
+
+    Returns:
+        MatchupResult: Counters for this chunk.
+    """
+    result = MatchupResult(levels)
+    hand = DiceHand(stream, tape_size=TAPE_SIZE)
+    for index in range(first_game, first_game + games):
+        first = index % 2
+        deciders = (make_decider(levels[0], stream),
+                    make_decider(levels[1], stream))
+        winner, turns, scores = play_game(hand, deciders, first)
+        result.record(winner, first, turns, scores)
+    return result
+
+
+def _simulate_task(task: tuple) -> MatchupResult:
+    """Unpack a chunk description for the process pool."""
+    return simulate_chunk(*task)
+
+
+def simulate(
+        levels: tuple[str, str],
+        games: int,
+        workers: int = 1,
+        seed: int | None = None,
+        chunk_size: int = CHUNK_SIZE
+        ) -> MatchupResult:
+    """
+    Play many games between two AI levels, optionally in parallel.
+
+    Args:
+        levels (tuple): AI level of seat 0 and seat 1.
+        games (int): Total number of games.
+        workers (int): Worker processes; 1 runs in the calling process.
+        seed (int): Root seed; the same seed gives the same counts.
+        chunk_size (int): Games per independently seeded chunk.
+
+    Returns:
+        MatchupResult: Aggregated counters and timing.
+    """
+    for level in levels:
+        make_decider(level)
+    starts = range(0, games, chunk_size)
+    streams = RngStream(seed).spawn(len(starts))
+    tasks = [
+        (levels, min(chunk_size, games - start), stream, start)
+        for start, stream in zip(starts, streams)
+    ]
+    total = MatchupResult(levels)
+    began = time.perf_counter()
+    if workers <= 1:
+        for task in tasks:
+            total.merge(_simulate_task(task))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for chunk in pool.map(_simulate_task, tasks):
+                total.merge(chunk)
+    total.seconds = time.perf_counter() - began
+    return total
+
+
+def run_tournament(
+        levels: list[str],
+        games: int,
+        workers: int = 1,
+        seed: int | None = None
+        ) -> list[MatchupResult]:
+    """
+    Play every pairing of ``levels`` against each other.
+
+    Args:
+        levels (list): AI levels taking part.
+        games (int): Games per pairing.
+        workers (int): Worker processes per pairing.
+        seed (int): Root seed; each pairing gets its own child stream.
+
+    Returns:
+        list: One `MatchupResult` per pairing.
+    """
+    pairings = list(combinations(levels, 2))
+    seeds = RngStream(seed).spawn(len(pairings))
+    return [
+        simulate(pairing, games, workers, stream.getrandbits(64))
+        for pairing, stream in zip(pairings, seeds)
+    ]
@@ -0,0 +1,242 @@
+"""
+Optimal-play solver for Two-Dice Pig.
+
+This module computes, by value iteration, the probability of winning from
+every (my score, opponent score, turn total) state under the rules in
+``dice/rules.txt``:
+
+- A single one ends the turn and loses the turn total
+- Snake eyes end the turn and reset the roller's score to zero
+- Any other pair is added to the turn total and must be rolled again
+- Holding banks the turn total; the first to 100 points wins
+
+The result is an `OptimalPolicy` holding a roll/hold policy table and a
+win-probability table, so each in-game decision is a single lookup. The
+tables are persisted with `dice.table_store` and memory-mapped on later
+runs instead of being solved again.
+"""
+
+import zlib
+from collections import Counter
+from functools import lru_cache
+import numpy as np
+from dice.dice_hand import OUTCOME_TABLE, Outcome
+from dice.engine import TARGET
+from dice.table_store import load_tables, save_tables
+
+MAX_ROLL = 12
+POLICY_PATH = "dice/optimal_policy.bin"
+
+
+def rules_fingerprint() -> int:
+    """Return a checksum of the roll outcomes the solver is built on."""
+    return zlib.crc32(bytes(
+        value
+        for entry in OUTCOME_TABLE
+        for value in (*entry["face_values"], entry["outcome"])
+    ))
+
+
+def _outcome_probabilities() -> tuple[float, float, dict, dict]:
+    """
+    Group the 36 equally likely rolls by their effect on the turn.
+
+    Returns:
+        tuple: Probability of a bust, probability of snake eyes, and the
+        probability of each total for forced rerolls and for normal rolls.
+    """
+    counts = Counter(entry["outcome"] for entry in OUTCOME_TABLE)
+    reroll = Counter()
+    normal = Counter()
+    for entry in OUTCOME_TABLE:
+        if entry["outcome"] == Outcome.REROLL:
+            reroll[entry["total"]] += 1
+        elif entry["outcome"] == Outcome.NORMAL:
+            normal[entry["total"]] += 1
+    size = len(OUTCOME_TABLE)
+    return (
+        counts[Outcome.BUST] / size,
+        counts[Outcome.SNAKE_EYES] / size,
+        {total: count / size for total, count in reroll.items()},
+        {total: count / size for total, count in normal.items()},
+    )
+
+
+class OptimalPolicy:
+    """
+    Roll/hold policy and win probabilities for every game state.
+
+    Both tables are indexed by ``[my score, opponent score, turn total]``
+    for scores below the target and turn totals below target + 12.
+    """
+
+    def __init__(
+            self, policy: np.ndarray,
+            win_probability: np.ndarray,
+            target: int = TARGET
+            ) -> None:
+        """
+        Initialize the policy from solved tables.
+
+        Args:
+            policy (np.ndarray): Non-zero where rolling is optimal.
+            win_probability (np.ndarray): Probability that the player to
+            move wins when playing optimally from each state.
+            target (int): Score needed to win.
+        """
+        self.policy = policy
+        self.win_probability = win_probability
+        self.target = target
+
+    def should_roll(
+            self, score: int,
+            opponent_score: int,
+            turn_total: int
+            ) -> bool:
+        """
+        Return whether rolling again is optimal.
+
+        Args:
+            score (int): The deciding player's banked score.
+            opponent_score (int): The opponent's banked score.
+            turn_total (int): Points accumulated so far this turn.
+
+        Returns:
+            bool: True to roll again, False to hold.
+        """
+        if score + turn_total >= self.target:
+            return False
+        return bool(self.policy[score, opponent_score, turn_total])
+
+    def chance_to_win(
+            self, score: int,
+            opponent_score: int,
+            turn_total: int = 0
+            ) -> float:
+        """
+        Return the optimal player's probability of winning from a state.
+
+        Args:
+            score (int): The deciding player's banked score.
+            opponent_score (int): The opponent's banked score.
+            turn_total (int): Points accumulated so far this turn.
+
+        Returns:
+            float: Win probability between 0 and 1.
+        """
+        if score + turn_total >= self.target:
+            return 1.0
+        return float(self.win_probability[score, opponent_score, turn_total])
+
+
+def solve(  # pylint: disable=too-many-locals
+        target: int = TARGET,
+        tolerance: float = 1e-9,
+        max_iterations: int = 10_000
+        ) -> OptimalPolicy:
+    """
+    Solve Two-Dice Pig by value iteration.
+
+    Each sweep fixes the turn-start probabilities from the previous sweep
+    and fills the turn-total axis from the top down, vectorized over all
+    (my score, opponent score) pairs. States where holding reaches the
+    target are wins, and a forced reroll there is solved in closed form.
+
+    Args:
+        target (int): Score needed to win.
+        tolerance (float): Stop when no probability moves by more than this.
+        max_iterations (int): Upper bound on the number of sweeps.
+
+    Returns:
+        OptimalPolicy: The solved policy and win-probability tables.
+    """
+    p_bust, p_snake, reroll, normal = _outcome_probabilities()
+    p_reroll = sum(reroll.values())
+    p_normal = sum(normal.values())
+    depth = target + MAX_ROLL
+    # Work turn-total-major so every slice below is contiguous.
+    win = np.zeros((depth, target, target), dtype=np.float64)
+    roll = np.zeros_like(win)
+    hold = np.zeros_like(win)
+    padding = np.zeros((depth, target))
+
+    for _ in range(max_iterations):
+        start = win[0].copy()
+        # Value of rolling lost to a single one or to snake eyes.
+        lost = p_bust * (1.0 - start.T) + p_snake * (1.0 - start[:, 0])
+        roll_when_won = (lost + p_normal) / (1.0 - p_reroll)
+        # banked[a, j] is the opponent's chance after I bank up to a points.
+        banked = np.vstack((start.T, padding))
+        for turn_total in range(depth - 1, -1, -1):
+            reached = max(target - turn_total, 0)
+            if reached == 0:
+                roll[turn_total] = roll_when_won
+                win[turn_total] = 1.0
+                continue
+            value = roll[turn_total]
+            np.copyto(value, lost)
+            for total, probability in reroll.items():
+                value += probability * roll[turn_total + total]
+            for total, probability in normal.items():
+                value += probability * win[turn_total + total]
+            value[reached:] = roll_when_won[reached:]
+            if turn_total == 0:
+                win[0] = value
+                continue
+            holding = hold[turn_total]
+            np.subtract(
+                1.0, banked[turn_total:turn_total + target], out=holding
+            )
+            best = win[turn_total]
+            np.maximum(value, holding, out=best)
+            best[reached:] = 1.0
+        if np.abs(win[0] - start).max() < tolerance:
+            break
+
+    policy = roll > hold
+    policy[0] = True
+    for turn_total in range(1, depth):
+        policy[turn_total, max(target - turn_total, 0):] = False
+    return OptimalPolicy(
+        np.ascontiguousarray(policy.transpose(1, 2, 0), dtype=np.uint8),
+        np.ascontiguousarray(win.transpose(1, 2, 0), dtype=np.float32),
+        target,
+    )
+
+
+def load_or_solve(path: str = POLICY_PATH, target: int = TARGET) -> OptimalPolicy:
+    """
+    Memory-map the stored policy, solving and storing it when needed.
+
+    The stored tables are rebuilt when they are missing, damaged or were
+    solved for a different target or rule set. If the file cannot be
+    written the freshly solved tables are used from memory.
+
+    Args:
+        path (str): Location of the table file.
+        target (int): Score needed to win.
+
+    Returns:
+        OptimalPolicy: Policy backed by the mapped file when possible.
+    """
+    fingerprint = rules_fingerprint()
+    tables = load_tables(path, target, fingerprint)
+    if tables is None:
+        policy = solve(target)
+        try:
+            save_tables(path, target, fingerprint, {
+                "policy": policy.policy,
+                "win_probability": policy.win_probability,
+            })
+        except OSError:
+            return policy
+        tables = load_tables(path, target, fingerprint, verify=True)
+        if tables is None:
+            return policy
+    return OptimalPolicy(tables["policy"], tables["win_probability"], target)
+
+
+@lru_cache(maxsize=None)
+def optimal_policy(target: int = TARGET) -> OptimalPolicy:
+    """Return the policy for ``target``, loading or solving it on first use."""
+    return load_or_solve(POLICY_PATH, target)
@@ -0,0 +1,65 @@
+"""
+Process-wide shared player statistics.
+
+Every part of the program that needs the stats asks this module instead
+of building its own `Histogram`:
+
+- `histogram` returns one instance per stats file, loaded the first time
+  and only reloaded when another process has saved since, so updates
+  from one consumer are seen by all the others straight away
+- `leaderboard` returns the single `Leaderboard` following that
+  histogram
+- `clear` forgets everything, for tests
+"""
+
+from dice.histogram import STATS_PATH, Histogram
+from dice.leaderboard import LEADERBOARD_PATH, Leaderboard
+
+_histograms: dict[str, Histogram] = {}
+_leaderboards: dict[str, Leaderboard] = {}
+
+
+def histogram(path: str = STATS_PATH) -> Histogram:
+    """
+    Return the shared histogram of a stats file.
+
+    Args:
+        path (str): The stats snapshot file.
+
+    Returns:
+        Histogram: The loaded, up-to-date statistics.
+    """
+    cached = _histograms.get(path)
+    if cached is None:
+        cached = _histograms[path] = Histogram(path)
+    else:
+        cached.refresh()
+    return cached
+
+
+def leaderboard(
+        path: str = LEADERBOARD_PATH,
+        stats_path: str = STATS_PATH
+        ) -> Leaderboard:
+    """
+    Return the shared leaderboard, following the shared histogram.
+
+    Args:
+        path (str): The leaderboard file.
+        stats_path (str): The stats file it ranks.
+
+    Returns:
+        Leaderboard: The rankings.
+    """
+    stats = histogram(stats_path)
+    cached = _leaderboards.get(path)
+    if cached is None or cached.histogram is not stats:
+        cached = _leaderboards[path] = Leaderboard(path)
+        cached.attach(stats)
+    return cached
+
+
+def clear() -> None:
+    """Forget every shared instance."""
+    _histograms.clear()
+    _leaderboards.clear()
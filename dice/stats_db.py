@@ -0,0 +1,296 @@
+"""
+Optional SQLite storage for player statistics and IDs.
+
+This module provides drop-in replacements for `Histogram` and `Player`
+that keep everything in one SQLite database instead of whole-file
+pickles:
+
+- One ``players`` row per ID, indexed on the ID, username, highscore
+  and wins, so single players and rankings are looked up without
+  loading the rest
+- The database runs in WAL mode, so readers never block the writer
+- Records are read on first use and cached; `save_stats`, or the end of
+  a `batch`, writes every changed record in one transaction, adding
+  deltas to the counters so several processes can share the file
+- `migrate` copies the existing ``history.ser`` and ``user_id.ser``
+  into a database in one go
+
+Select it with ``python -m dice play --stats-db dice/stats.db``.
+"""
+
+import pickle
+import sqlite3
+from typing import Iterator
+from dice.histogram import STATS_PATH, Histogram, new_record
+from dice.player import Player
+
+STATS_DB_PATH = "dice/stats.db"
+USER_ID_PATH = "dice/user_id.ser"
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    user_id TEXT PRIMARY KEY,
+    username TEXT NOT NULL DEFAULT '',
+    highscore INTEGER NOT NULL DEFAULT 0,
+    games_played INTEGER NOT NULL DEFAULT 0,
+    games_won INTEGER NOT NULL DEFAULT 0,
+    games_lost INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS players_username ON players (username);
+CREATE INDEX IF NOT EXISTS players_highscore ON players (highscore);
+CREATE INDEX IF NOT EXISTS players_games_won ON players (games_won);
+"""
+COLUMNS = "username, highscore, games_played, games_won, games_lost"
+UPSERT = """
+INSERT INTO players (user_id, username, highscore, games_played,
+                     games_won, games_lost)
+VALUES (:p_id, coalesce(:username, ''), :highscore, :played, :won, :lost)
+ON CONFLICT (user_id) DO UPDATE SET
+    username = coalesce(:username, username),
+    highscore = max(highscore, excluded.highscore),
+    games_played = games_played + excluded.games_played,
+    games_won = games_won + excluded.games_won,
+    games_lost = games_lost + excluded.games_lost
+"""
+REPLACE = f"INSERT OR REPLACE INTO players (user_id, {COLUMNS}) " \
+    "VALUES (?, ?, ?, ?, ?, ?)"
+
+
+def connect(path: str = STATS_DB_PATH) -> sqlite3.Connection:
+    """
+    Open the stats database, creating the table and indexes if needed.
+
+    Args:
+        path (str): Database file.
+
+    Returns:
+        Connection: A connection in WAL mode.
+    """
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def to_record(row: tuple) -> dict:
+    """Return a ``players`` row, without the ID, as a stats record."""
+    return dict(zip(new_record(), row))
+
+
+class SqliteHistogram(Histogram):
+    """`Histogram` keeping its records in a SQLite database."""
+
+    def __init__(
+            self, path: str = STATS_DB_PATH,
+            connection: sqlite3.Connection | None = None
+            ) -> None:
+        """
+        Initialize the histogram; records are read when first used.
+
+        Args:
+            path (str): Database file.
+            connection (Connection): Open connection to share, for example
+            with `SqlitePlayer`.
+        """
+        # pylint: disable=super-init-not-called
+        self.path = path
+        self.connection = connection if connection is not None \
+            else connect(path)
+        self.details: dict[str, dict] = {}
+        self.saved: dict[str, dict] = {}
+        self.dirty: set[str] = set()
+        self.batching = 0
+        self.listeners: list = []
+
+    def load(self, p_id: str) -> bool:
+        """
+        Cache the record of ``p_id`` if it is stored.
+
+        Returns:
+            bool: Whether the player has a record.
+        """
+        if p_id in self.details:
+            return True
+        row = self.connection.execute(
+            f"SELECT {COLUMNS} FROM players WHERE user_id = ?", (p_id,)
+        ).fetchone()
+        if row is None:
+            return False
+        self.details[p_id] = to_record(row)
+        return True
+
+    def record(self, p_id: str) -> dict:
+        """Return the record of a player, reading it from the database."""
+        self.load(p_id)
+        return super().record(p_id)
+
+    def get_username(self, p_id: str) -> str:
+        """Retrieve the username associated with the given player ID."""
+        self.load(p_id)
+        return super().get_username(p_id)
+
+    def write_changes(self, changes: list[tuple]) -> None:
+        """Write changes from `changes` in one transaction."""
+        with self.connection:
+            self.connection.executemany(UPSERT, (
+                dict(zip(("p_id", "username", "highscore", "played", "won",
+                          "lost"), change))
+                for change in changes
+            ))
+
+    def load_stats_file(self) -> dict:
+        """
+        Return the statistics of every player.
+
+        Returns:
+            dict: All records keyed by player ID.
+        """
+        rows = self.connection.execute(
+            f"SELECT user_id, {COLUMNS} FROM players ORDER BY user_id"
+        )
+        return {row[0]: to_record(row[1:]) for row in rows}
+
+    def merged_records(self, p_ids: list[str]) -> dict:
+        """Return the records of some players, read again from the database."""
+        for p_id in p_ids:
+            self.details.pop(p_id, None)
+            self.load(p_id)
+        return {p_id: self.details[p_id] for p_id in p_ids}
+
+    def all_records(self) -> dict:
+        """Return every player's record, read from the database."""
+        return self.load_stats_file()
+
+    def refresh(self) -> bool:
+        """
+        Forget the cached records so they are read again when used.
+
+        Nothing is dropped while there are unsaved changes.
+
+        Returns:
+            bool: Whether the cache was dropped.
+        """
+        if self.dirty or self.batching:
+            return False
+        self.details.clear()
+        self.saved.clear()
+        return True
+
+    def top(self, column: str, count: int = 10) -> list[tuple[str, dict]]:
+        """
+        Return the best players by one indexed column.
+
+        Args:
+            column (str): ``highscore`` or ``games_won``.
+            count (int): Number of players.
+
+        Returns:
+            list: (ID, record) pairs, best first.
+        """
+        if column not in ("highscore", "games_won"):
+            raise ValueError(f"Cannot rank players by {column}")
+        rows = self.connection.execute(
+            f"SELECT user_id, {COLUMNS} FROM players "
+            f"ORDER BY {column} DESC, user_id LIMIT ?", (count,)
+        )
+        return [(row[0], to_record(row[1:])) for row in rows]
+
+    def compact(self, wait: bool = False) -> None:
+        """Nothing to fold: the database is updated in place."""
+
+
+class UserIds:
+    """Set-like view of the player IDs stored in the database."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        """Initialize the view on ``connection``."""
+        self.connection = connection
+
+    def __contains__(self, p_id: object) -> bool:
+        """Return whether ``p_id`` is registered."""
+        return self.connection.execute(
+            "SELECT 1 FROM players WHERE user_id = ?", (p_id,)
+        ).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over every registered ID."""
+        for (p_id,) in self.connection.execute(
+                "SELECT user_id FROM players ORDER BY user_id"):
+            yield p_id
+
+    def __len__(self) -> int:
+        """Return the number of registered IDs."""
+        return self.connection.execute(
+            "SELECT count(*) FROM players"
+        ).fetchone()[0]
+
+    def add(self, p_id: str) -> None:
+        """Register ``p_id`` with an empty record."""
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO players (user_id) VALUES (?)", (p_id,)
+            )
+
+
+class SqlitePlayer(Player):
+    """`Player` registering its ID in a SQLite database."""
+
+    def __init__(
+            self, path: str = STATS_DB_PATH,
+            connection: sqlite3.Connection | None = None
+            ) -> None:
+        """
+        Initialize a player with no ID yet.
+
+        Args:
+            path (str): Database file.
+            connection (Connection): Open connection to share, for example
+            with `SqliteHistogram`.
+        """
+        self.connection = connection if connection is not None \
+            else connect(path)
+        super().__init__()
+
+    def get_user_id_list(self) -> UserIds:
+        """Return the registered IDs as a set-like view of the database."""
+        return UserIds(self.connection)
+
+    def save_user_ids(self) -> None:
+        """Nothing to do: `UserIds.add` already stored the ID."""
+
+
+def migrate(
+        db_path: str = STATS_DB_PATH,
+        stats_path: str = STATS_PATH,
+        ids_path: str = USER_ID_PATH
+        ) -> int:
+    """
+    Copy the pickled statistics and user IDs into a database.
+
+    Records already in the database are replaced by the pickled ones.
+
+    Args:
+        db_path (str): Database file, created if missing.
+        stats_path (str): Pickled statistics, with their journal.
+        ids_path (str): Pickled set of user IDs.
+
+    Returns:
+        int: Number of players copied.
+    """
+    details = Histogram(stats_path).details
+    try:
+        with open(ids_path, "rb") as ids:
+            user_ids = pickle.load(ids)
+    except FileNotFoundError:
+        user_ids = set()
+    for p_id in user_ids:
+        details.setdefault(p_id, new_record())
+    connection = connect(db_path)
+    with connection:
+        connection.executemany(REPLACE, (
+            (p_id, *(record.get(key, default)
+                     for key, default in new_record().items()))
+            for p_id, record in details.items()
+        ))
+    connection.close()
+    return len(details)
@@ -0,0 +1,218 @@
+"""
+Flat binary storage for precomputed AI tables.
+
+Tables such as the solver's policy and win probabilities are written once
+to a single file and memory-mapped on first use, so:
+
+- Loading costs a header parse instead of recomputing or unpickling
+- Several game processes on one host share the same physical pages
+- A header with the rule-set parameters and a checksum of the header
+  and entry table lets stale or damaged files be detected and rebuilt
+  without touching the payload; the payload has its own checksum,
+  checked only on request so a load does not read every page
+
+Layout: a fixed header, one entry per array (name, dtype, shape, offset),
+then the raw array data, each array aligned to 64 bytes.
+"""
+
+import mmap
+import os
+import struct
+import zlib
+import numpy as np
+
+MAGIC = b"PIGT"
+VERSION = 2
+ALIGNMENT = 64
+HEADER = struct.Struct("<4sHHIIII")
+ENTRY = struct.Struct("<16s8sIIIQ")
+
+
+def _aligned(offset: int) -> int:
+    """Round ``offset`` up to the next multiple of `ALIGNMENT`."""
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _index_checksum(fields: tuple, table: bytes) -> int:
+    """Return the CRC32 of the header ``fields`` and the entry table."""
+    return zlib.crc32(table, zlib.crc32(HEADER.pack(*fields, 0)))
+
+
+def _pack_arrays(arrays: dict[str, np.ndarray]) -> tuple[bytes, int, bytes]:
+    """
+    Lay out arrays for `save_tables`.
+
+    Args:
+        arrays (dict): Arrays to store, keyed by name.
+
+    Returns:
+        tuple: The packed entry table, the file offset of the payload and
+        the payload, each array aligned to `ALIGNMENT`.
+    """
+    entries = []
+    offset = _aligned(HEADER.size + ENTRY.size * len(arrays))
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        shape = tuple(array.shape) + (0,) * (3 - array.ndim)
+        entries.append((name, array, shape, offset))
+        offset = _aligned(offset + array.nbytes)
+
+    payload_start = entries[0][3] if entries else offset
+    payload = bytearray(offset - payload_start)
+    for _, array, _, start in entries:
+        begin = start - payload_start
+        payload[begin:begin + array.nbytes] = array.tobytes()
+
+    table = b"".join(
+        ENTRY.pack(
+            name.encode("ascii"), array.dtype.str.encode("ascii"),
+            *shape, start
+        )
+        for name, array, shape, start in entries
+    )
+    return table, payload_start, bytes(payload)
+
+
+def save_tables(
+        path: str,
+        target: int,
+        fingerprint: int,
+        arrays: dict[str, np.ndarray]
+        ) -> None:
+    """
+    Write arrays of up to three dimensions to ``path``.
+
+    The file is written next to ``path`` and moved into place, so readers
+    never see a partially written table.
+
+    Args:
+        path (str): Destination file.
+        target (int): Winning score the tables were computed for.
+        fingerprint (int): Checksum of the rule set the tables assume.
+        arrays (dict): Non-empty arrays to store, keyed by a name of up
+        to 16 bytes.
+    """
+    table, payload_start, payload = _pack_arrays(arrays)
+    fields = (MAGIC, VERSION, len(arrays), target, fingerprint,
+              zlib.crc32(payload))
+    header = HEADER.pack(*fields, _index_checksum(fields, table))
+    temp_path = f"{path}.tmp{os.getpid()}"
+    with open(temp_path, "wb") as f:
+        f.write(header)
+        f.write(table)
+        f.write(bytes(payload_start - len(header) - len(table)))
+        f.write(payload)
+    os.replace(temp_path, path)
+
+
+def _read_entries(mapping: mmap.mmap, count: int) -> list[tuple] | None:
+    """
+    Parse the entry table of a mapped table file.
+
+    Args:
+        mapping (mmap): The mapped file.
+        count (int): Number of entries.
+
+    Returns:
+        list: (name, dtype, shape, offset) of each array, or None when an
+        array would reach past the end of the file.
+    """
+    entries = []
+    for index in range(count):
+        name, dtype, *shape, start = ENTRY.unpack_from(
+            mapping, HEADER.size + ENTRY.size * index
+        )
+        dtype = np.dtype(dtype.rstrip(b"\0").decode("ascii"))
+        shape = [dim for dim in shape if dim]
+        if start + dtype.itemsize * int(np.prod(shape)) > len(mapping):
+            return None
+        entries.append((name.rstrip(b"\0").decode("ascii"), dtype, shape,
+                        start))
+    return entries
+
+
+def _read_index(
+        mapping: mmap.mmap,
+        target: int,
+        fingerprint: int,
+        verify: bool
+        ) -> list[tuple] | None:
+    """
+    Check the header and entry table of a mapped table file.
+
+    Args:
+        mapping (mmap): The mapped file.
+        target (int): Winning score the caller needs tables for.
+        fingerprint (int): Checksum of the caller's rule set.
+        verify (bool): Also check the payload checksum.
+
+    Returns:
+        list: (name, dtype, shape, offset) of each array, or None when
+        the file is damaged or built for different rules.
+    """
+    if len(mapping) < HEADER.size:
+        return None
+    *fields, checksum = HEADER.unpack_from(mapping, 0)
+    magic, version, count, stored_target, stored_fingerprint, payload_crc = (
+        fields
+    )
+    if (magic, version, stored_target, stored_fingerprint) != (
+            MAGIC, VERSION, target, fingerprint):
+        return None
+    table_end = HEADER.size + ENTRY.size * count
+    if table_end > len(mapping) or checksum != _index_checksum(
+            tuple(fields), mapping[HEADER.size:table_end]):
+        return None
+
+    entries = _read_entries(mapping, count)
+    if entries is None:
+        return None
+    payload_start = entries[0][3] if entries else len(mapping)
+    if verify and zlib.crc32(
+            memoryview(mapping)[payload_start:]) != payload_crc:
+        return None
+    return entries
+
+
+def load_tables(
+        path: str,
+        target: int,
+        fingerprint: int,
+        verify: bool = False
+        ) -> dict[str, np.ndarray] | None:
+    """
+    Memory-map the tables stored at ``path``.
+
+    Only the header and entry table are read and checked; the payload
+    pages are read when the arrays are first used.
+
+    Args:
+        path (str): File written by `save_tables`.
+        target (int): Winning score the caller needs tables for.
+        fingerprint (int): Checksum of the caller's rule set.
+        verify (bool): Also check the payload checksum, which reads the
+        whole file.
+
+    Returns:
+        dict: Read-only arrays backed by the mapping, or None when the file
+        is missing, damaged or built for different rules.
+    """
+    try:
+        with open(path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        entries = _read_index(mapping, target, fingerprint, verify)
+    except (struct.error, ValueError, TypeError):
+        entries = None
+    if entries is None:
+        mapping.close()
+        return None
+    return {
+        name: np.frombuffer(
+            mapping, dtype=dtype, count=int(np.prod(shape)), offset=start
+        ).reshape(shape)
+        for name, dtype, shape, start in entries
+    }
@@ -0,0 +1,313 @@
+"""
+Round-robin and Swiss tournaments between computer players.
+
+This module provides the `Tournament` class, which schedules matches
+between entrants playing at `Intelligence` levels and runs them through
+the headless simulator:
+
+- Round robin pairs everyone once using the circle method; Swiss pairs
+  entrants on equal points each round while avoiding rematches
+- Every match is a fixed number of games with alternating first turn,
+  split into chunks that each roll from a child of the match's
+  `RngStream`, so a seed fixes every result whatever the worker count or
+  completion order
+- All chunks of a round robin, and of each Swiss round, run in parallel
+  worker processes; only Swiss waits for a round to finish before pairing
+  the next, and standings are yielded as each match completes
+- `save` writes all results to `Histogram` with one update per entrant
+  and a single `save_stats()`
+"""
+
+import math
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from typing import Iterator, NamedTuple
+from dice.histogram import Histogram
+from dice.rng import RngStream
+from dice.simulation import MatchupResult, make_decider, simulate_chunk
+
+ROUND_ROBIN = "round-robin"
+SWISS = "swiss"
+FORMATS = (ROUND_ROBIN, SWISS)
+GAMES_PER_MATCH = 100
+MATCH_CHUNK = 25
+BYE = -1
+
+
+class Entrant(NamedTuple):
+    """A computer player taking part in a tournament."""
+
+    name: str
+    level: str
+    user_id: str | None = None
+
+
+class Standing:  # pylint: disable=too-many-instance-attributes,too-few-public-methods
+    """Running totals of one entrant."""
+
+    __slots__ = ("entrant", "points", "wins", "draws", "losses",
+                 "games_won", "games_lost", "high_score", "opponents")
+
+    def __init__(self, entrant: Entrant) -> None:
+        """Initialize an entrant that has not played yet."""
+        self.entrant = entrant
+        self.points = 0.0
+        self.wins = 0
+        self.draws = 0
+        self.losses = 0
+        self.games_won = 0
+        self.games_lost = 0
+        self.high_score = 0
+        self.opponents: set[int] = set()
+
+    def sort_key(self) -> tuple:
+        """Return the ranking key: points, then game difference."""
+        return (-self.points, self.games_lost - self.games_won,
+                self.entrant.name)
+
+
+class MatchReport(NamedTuple):
+    """One finished match and the standings right after it."""
+
+    round: int
+    seats: tuple[int, int]
+    result: MatchupResult
+    standings: list[Standing]
+
+
+def round_robin_rounds(count: int) -> list[list[tuple[int, int]]]:
+    """
+    Pair ``count`` entrants so each meets every other once.
+
+    Args:
+        count (int): Number of entrants.
+
+    Returns:
+        list: One list of (seat, seat) pairings per round; with an odd
+        count one entrant sits out each round.
+    """
+    order = list(range(count)) + ([None] if count % 2 else [])
+    rounds = []
+    for _ in range(len(order) - 1):
+        half = len(order) // 2
+        rounds.append([
+            (first, second)
+            for first, second in zip(order[:half], reversed(order[half:]))
+            if first is not None and second is not None
+        ])
+        order.insert(1, order.pop())
+    return rounds
+
+
+def swiss_pairings(standings: list[Standing]) -> tuple[list, int | None]:
+    """
+    Pair entrants with similar points who have not met yet.
+
+    Args:
+        standings (list): Standings indexed by entrant.
+
+    Returns:
+        tuple: The (seat, seat) pairings and the entrant with a bye, if any.
+    """
+    ranked = sorted(range(len(standings)),
+                    key=lambda index: standings[index].sort_key())
+    bye = None
+    if len(ranked) % 2:
+        for index in reversed(ranked):
+            if BYE not in standings[index].opponents:
+                bye = index
+                break
+        if bye is None:
+            bye = ranked[-1]
+        ranked.remove(bye)
+    pairings = []
+    while ranked:
+        first = ranked.pop(0)
+        partner = next(
+            (other for other in ranked
+             if other not in standings[first].opponents),
+            ranked[0]
+        )
+        ranked.remove(partner)
+        pairings.append((first, partner))
+    return pairings, bye
+
+
+class Tournament:
+    """A scheduled competition between `Entrant` computer players."""
+
+    def __init__(
+            self, entrants: list[Entrant],
+            fmt: str = ROUND_ROBIN,
+            games_per_match: int = GAMES_PER_MATCH,
+            rounds: int | None = None,
+            seed: int | None = None
+            ) -> None:
+        """
+        Initialize the tournament and validate the roster.
+
+        Args:
+            entrants (list): The players; levels are names from `LEVELS`.
+            fmt (str): `ROUND_ROBIN` or `SWISS`.
+            games_per_match (int): Games in each match.
+            rounds (int): Swiss rounds, enough to separate the field when
+            omitted; ignored for round robin.
+            seed (int): Root seed for every match.
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown tournament format: {fmt}")
+        if len(entrants) < 2:
+            raise ValueError("A tournament needs at least two entrants")
+        if games_per_match < 1:
+            raise ValueError("A match needs at least one game")
+        for entrant in entrants:
+            make_decider(entrant.level)
+        self.entrants = entrants
+        self.fmt = fmt
+        self.games_per_match = games_per_match
+        if fmt == SWISS:
+            self.rounds = rounds or math.ceil(math.log2(len(entrants)))
+        else:
+            self.rounds = len(round_robin_rounds(len(entrants)))
+        self.root = RngStream(seed)
+        self.standings = [Standing(entrant) for entrant in entrants]
+        self.results: list[MatchReport] = []
+
+    def ranking(self) -> list[Standing]:
+        """Return the standings from first to last place."""
+        return sorted(self.standings, key=Standing.sort_key)
+
+    def record(self, seats: tuple[int, int], result: MatchupResult) -> None:
+        """Add a finished match to the standings."""
+        first, second = (self.standings[seat] for seat in seats)
+        first.opponents.add(seats[1])
+        second.opponents.add(seats[0])
+        for seat, standing in enumerate((first, second)):
+            standing.games_won += result.wins[seat]
+            standing.games_lost += result.wins[1 - seat]
+            standing.high_score = max(
+                standing.high_score, result.high_scores[seat]
+            )
+        if result.wins[0] == result.wins[1]:
+            for standing in (first, second):
+                standing.points += 0.5
+                standing.draws += 1
+            return
+        winner, loser = (
+            (first, second) if result.wins[0] > result.wins[1]
+            else (second, first)
+        )
+        winner.points += 1
+        winner.wins += 1
+        loser.losses += 1
+
+    def play(self, workers: int = 1) -> Iterator[MatchReport]:
+        """
+        Play every round, yielding each match as soon as it finishes.
+
+        Args:
+            workers (int): Worker processes; 1 plays in this process.
+
+        Yields:
+            MatchReport: The match and the standings after it.
+        """
+        pool = ProcessPoolExecutor(workers) if workers > 1 else None
+        try:
+            if self.fmt == ROUND_ROBIN:
+                schedule = round_robin_rounds(len(self.entrants))
+                yield from self.play_matches([
+                    (number, pairing)
+                    for number, pairings in enumerate(schedule)
+                    for pairing in pairings
+                ], pool)
+                return
+            for number in range(self.rounds):
+                pairings, bye = swiss_pairings(self.standings)
+                if bye is not None:
+                    self.standings[bye].points += 1
+                    self.standings[bye].opponents.add(BYE)
+                yield from self.play_matches(
+                    [(number, pairing) for pairing in pairings], pool
+                )
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    def match_chunks(
+            self, seats: tuple[int, int],
+            stream: RngStream
+            ) -> list[tuple]:
+        """Return the `simulate_chunk` arguments of one match."""
+        levels = tuple(self.entrants[seat].level for seat in seats)
+        starts = range(0, self.games_per_match, MATCH_CHUNK)
+        return [
+            (levels, min(MATCH_CHUNK, self.games_per_match - start),
+             child, start)
+            for start, child in zip(starts, stream.spawn(len(starts)))
+        ]
+
+    def play_matches(
+            self, matches: list[tuple[int, tuple[int, int]]],
+            pool: Executor | None
+            ) -> Iterator[MatchReport]:
+        """
+        Play (round index, seats) matches and yield each as it finishes.
+
+        Every chunk of every match is submitted to ``pool`` at once; a
+        match is recorded when its last chunk comes back.
+        """
+        streams = self.root.spawn(len(matches))
+        chunks = {
+            match: self.match_chunks(match[1], stream)
+            for match, stream in zip(matches, streams)
+        }
+        results = {match: MatchupResult(tasks[0][0])
+                   for match, tasks in chunks.items()}
+        left = {match: len(tasks) for match, tasks in chunks.items()}
+        if pool is None:
+            finished = ((match, simulate_chunk(*task))
+                        for match, tasks in chunks.items() for task in tasks)
+        else:
+            futures = {pool.submit(simulate_chunk, *task): match
+                       for match, tasks in chunks.items() for task in tasks}
+            finished = ((futures[future], future.result())
+                        for future in as_completed(futures))
+        for match, chunk in finished:
+            results[match].merge(chunk)
+            left[match] -= 1
+            if left[match]:
+                continue
+            number, seats = match
+            self.record(seats, results[match])
+            report = MatchReport(number + 1, seats, results[match],
+                                 self.ranking())
+            self.results.append(report)
+            yield report
+
+    def save(self, histogram: Histogram) -> None:
+        """
+        Write every entrant's games to ``histogram`` and save it once.
+
+        Entrants without a user ID are skipped.
+        """
+        for standing in self.standings:
+            if standing.entrant.user_id is None:
+                continue
+            histogram.record_results(
+                standing.entrant.user_id, standing.games_won,
+                standing.games_lost, standing.high_score
+            )
+        histogram.save_stats()
+
+    def table(self) -> str:
+        """Return the standings as a printable table."""
+        lines = [f"{'#':>3} {'Entrant':<16} {'Level':<8} {'Pts':>5} "
+                 f"{'W-D-L':>9} {'Games':>13} {'Best':>5}"]
+        for place, standing in enumerate(self.ranking(), 1):
+            record = f"{standing.wins}-{standing.draws}-{standing.losses}"
+            games = f"{standing.games_won}-{standing.games_lost}"
+            lines.append(
+                f"{place:>3} {standing.entrant.name:<16} "
+                f"{standing.entrant.level:<8} {standing.points:>5.1f} "
+                f"{record:>9} {games:>13} {standing.high_score:>5}"
+            )
+        return "\n".join(lines)
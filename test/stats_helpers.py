@@ -0,0 +1,31 @@
+"""Shared fixtures for the tests of the player stats files."""
+
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+
+class StatsTestCase(unittest.TestCase):
+    """Test case with a stats snapshot in a temporary folder."""
+
+    records: dict = {}
+
+    def setUp(self):
+        """Write `records` to a stats file in a temporary folder."""
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder)
+        self.path = os.path.join(self.folder, "history.ser")
+        with open(self.path, "wb") as file:
+            pickle.dump(self.records, file)
+
+    def play(self, hist, p_id, won, score):
+        """Record one finished game and save it."""
+        hist.increment_games_played(p_id)
+        if won:
+            hist.increment_games_won(p_id)
+        else:
+            hist.increment_games_lost(p_id)
+        hist.check_highscore(p_id, score)
+        hist.save_stats()
@@ -0,0 +1,42 @@
+"""Unit tests for the ``python -m dice`` entry point."""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from dice.__main__ import main
+
+
+class TestCli(unittest.TestCase):
+    """Test suite for the command-line entry point."""
+
+    def test_simulate_prints_report(self):
+        """The simulate command plays headlessly and prints the report."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            status = main(["simulate", "--p1", "easy", "--p2", "hard",
+                           "--games", "50", "--seed", "3"])
+        self.assertEqual(status, 0)
+        report = output.getvalue()
+        self.assertIn("easy vs hard: 50 games", report)
+        self.assertIn("Games per second", report)
+
+    def test_simulate_rejects_bad_counts(self):
+        """Non-positive game counts are a usage error."""
+        with redirect_stdout(io.StringIO()), \
+                self.assertRaises(SystemExit):
+            main(["simulate", "--games", "0"])
+
+    def test_tournament_prints_matches_and_table(self):
+        """The tournament command streams each match, then the table."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            status = main(["tournament", "easy", "mid", "hard",
+                           "--games", "10", "--seed", "2"])
+        self.assertEqual(status, 0)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(sum(line.startswith("Round") for line in lines), 3)
+        self.assertIn("W-D-L", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,9 @@
 
 import unittest
 from unittest.mock import patch
-from dice.dice_hand import DiceHand
+import numpy as np
+from dice.dice_hand import DiceHand, Outcome, OUTCOME_TABLE
+from dice.rng import RngStream
 
 
 class TestDiceHand(unittest.TestCase):
@@ -61,6 +63,88 @@ class TestDiceHand(unittest.TestCase):
         display = self.hand.display_dice()
         self.assertEqual(display, f"{self.hand.left_die} {self.hand.right_die}")
 
+    def test_outcome_table_covers_all_pairs(self) -> None:
+        """Test the table holds one entry per pair with matching codes."""
+        self.assertEqual(len(OUTCOME_TABLE), 36)
+        codes = [entry["outcome"] for entry in OUTCOME_TABLE]
+        self.assertEqual(codes.count(Outcome.SNAKE_EYES), 1)
+        self.assertEqual(codes.count(Outcome.BUST), 10)
+        self.assertEqual(codes.count(Outcome.REROLL), 5)
+        self.assertEqual(codes.count(Outcome.NORMAL), 20)
+
+    @patch("dice.dice_class.Dice.roll")
+    def test_evaluate_roll_uses_shared_entry(self, mock_roll) -> None:
+        """Test evaluate_roll returns the immutable table entry."""
+        mock_roll.side_effect = [5, 5, 5, 5]
+        first = self.hand.evaluate_roll()
+        second = self.hand.evaluate_roll()
+        self.assertIs(first, second)
+        self.assertEqual(first["outcome"], Outcome.REROLL)
+        self.assertEqual(first["face_values"], (5, 5))
+        with self.assertRaises(TypeError):
+            first["total"] = 0  # type: ignore[index]
+
+    def test_roll_batch_shapes(self) -> None:
+        """Test roll_batch returns one entry per roll for every key."""
+        batch = self.hand.roll_batch(1000, np.random.default_rng(1))
+        self.assertEqual(batch["face_values"].shape, (1000, 2))
+        for key in ("total", "is_pair", "is_single_one",
+                    "is_double_one", "must_reroll"):
+            self.assertEqual(batch[key].shape, (1000,))
+        self.assertTrue(((batch["face_values"] >= 1)
+                         & (batch["face_values"] <= 6)).all())
+
+    def test_roll_batch_matches_evaluate_roll(self) -> None:
+        """Test every batched flag agrees with the per-roll evaluation."""
+        batch = self.hand.roll_batch(5000, np.random.default_rng(7))
+        for i, (left, right) in enumerate(batch["face_values"].tolist()):
+            with patch("dice.dice_class.Dice.roll", side_effect=[left, right]):
+                expected = self.hand.evaluate_roll()
+            self.assertEqual(batch["total"][i], expected["total"])
+            for key in ("is_pair", "is_single_one",
+                        "is_double_one", "must_reroll"):
+                self.assertEqual(bool(batch[key][i]), expected[key])
+            self.assertEqual(batch["outcome"][i], expected["outcome"])
+
+    def test_roll_batch_seeded(self) -> None:
+        """Test the same generator seed reproduces the same batch."""
+        first = self.hand.roll_batch(100, np.random.default_rng(3))
+        second = self.hand.roll_batch(100, np.random.default_rng(3))
+        np.testing.assert_array_equal(
+            first["face_values"], second["face_values"]
+        )
+
+    def test_tape_serves_bulk_faces(self) -> None:
+        """Test tape mode rolls valid faces and refills when exhausted."""
+        hand = DiceHand(RngStream(5), tape_size=8)
+        rolls = [hand.roll() for _ in range(10)]
+        self.assertEqual(len(rolls), 10)
+        for left, right in rolls:
+            self.assertIn(left, range(1, 7))
+            self.assertIn(right, range(1, 7))
+        self.assertEqual(hand.tape.position, 4)
+
+    def test_tape_evaluate_and_display(self) -> None:
+        """Test evaluate_roll and display_dice work unchanged in tape mode."""
+        hand = DiceHand(RngStream(9), tape_size=64)
+        result = hand.evaluate_roll()
+        left, right = result["face_values"]
+        self.assertEqual(result["total"], left + right)
+        self.assertEqual(
+            hand.display_dice(),
+            f"{hand.left_die.DICE_UNICODE[left]} "
+            f"{hand.right_die.DICE_UNICODE[right]}"
+        )
+
+    def test_tape_reproducible(self) -> None:
+        """Test tapes seeded alike serve the same rolls."""
+        first = DiceHand(RngStream(2), tape_size=16)
+        second = DiceHand(RngStream(2), tape_size=16)
+        self.assertEqual(
+            [first.roll() for _ in range(40)],
+            [second.roll() for _ in range(40)],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,116 @@
+"""Unit tests for the headless game engine."""
+
+import unittest
+from dice.dice_hand import OUTCOME_TABLE, DiceHand
+from dice.engine import Action, EventKind, GameEngine, Phase
+from dice.rng import RngStream
+
+SNAKE_EYES = OUTCOME_TABLE[0]
+SINGLE_ONE = OUTCOME_TABLE[1]
+PAIR_OF_TWOS = OUTCOME_TABLE[7]
+TWO_THREE = OUTCOME_TABLE[8]
+
+
+class TestGameEngine(unittest.TestCase):
+    """Test suite for GameEngine."""
+
+    def setUp(self):
+        """Create a two-seat engine on seeded dice."""
+        self.engine = GameEngine(["A", "B"], DiceHand(RngStream(1)))
+
+    def test_normal_roll_allows_hold(self):
+        """A normal roll adds to the turn total and allows holding."""
+        events = self.engine.apply_roll(TWO_THREE)
+        self.assertEqual(events[0].kind, EventKind.ROLL)
+        self.assertEqual(self.engine.turn_total, 5)
+        self.assertEqual(self.engine.legal_actions(),
+                         (Action.ROLL, Action.HOLD))
+
+    def test_pair_forces_roll(self):
+        """A pair adds to the turn total but forbids holding."""
+        events = self.engine.apply_roll(PAIR_OF_TWOS)
+        self.assertEqual(events[0].kind, EventKind.REROLL)
+        self.assertEqual(self.engine.turn_total, 4)
+        self.assertEqual(self.engine.legal_actions(), (Action.ROLL,))
+        with self.assertRaises(ValueError):
+            self.engine.hold()
+
+    def test_single_one_ends_turn(self):
+        """A single one loses the turn total but keeps the score."""
+        self.engine.scores[0] = 30
+        self.engine.apply_roll(TWO_THREE)
+        events = self.engine.apply_roll(SINGLE_ONE)
+        self.assertEqual(events[0].kind, EventKind.BUST)
+        self.assertEqual(self.engine.scores[0], 30)
+        self.assertEqual(self.engine.phase, Phase.TURN_OVER)
+
+    def test_snake_eyes_resets_score(self):
+        """Double ones wipe the banked score."""
+        self.engine.scores[0] = 30
+        events = self.engine.apply_roll(SNAKE_EYES)
+        self.assertEqual(events[0].kind, EventKind.SNAKE_EYES)
+        self.assertEqual(self.engine.scores[0], 0)
+        self.assertEqual(self.engine.legal_actions(), ())
+
+    def test_hold_banks_and_next_turn_rotates(self):
+        """Holding banks the turn total; next_turn passes the dice."""
+        self.engine.apply_roll(TWO_THREE)
+        self.engine.hold()
+        self.assertEqual(list(self.engine.scores), [5, 0])
+        events = self.engine.next_turn()
+        self.assertEqual(events[0].kind, EventKind.TURN_START)
+        self.assertEqual(self.engine.current_name, "B")
+        self.assertEqual(self.engine.turn_total, 0)
+
+    def test_hold_reaching_target_wins(self):
+        """Reaching the target ends the game."""
+        self.engine.scores[0] = 98
+        self.engine.apply_roll(TWO_THREE)
+        events = self.engine.hold()
+        self.assertEqual(events[-1].kind, EventKind.WIN)
+        self.assertEqual(self.engine.winner, 0)
+        self.assertEqual(self.engine.phase, Phase.GAME_OVER)
+
+    def test_listeners_receive_events(self):
+        """Listeners see every event in order."""
+        seen = []
+        self.engine.listeners.append(seen.append)
+        self.engine.reset(first=1)
+        self.engine.apply_roll(TWO_THREE)
+        self.assertEqual([event.kind for event in seen],
+                         [EventKind.RESTART, EventKind.TURN_START,
+                          EventKind.ROLL])
+        self.assertEqual(seen[-1].seat, 1)
+        self.assertEqual(seen[-1].faces, (2, 3))
+
+    def test_needs_two_seats(self):
+        """A match cannot be set up with a single seat."""
+        with self.assertRaises(ValueError):
+            GameEngine(["Solo"])
+
+    def test_many_seats_rotate(self):
+        """Rotation wraps after the last of several seats."""
+        engine = GameEngine(["A", "B", "C", "D"])
+        for _ in range(4):
+            engine.next_turn()
+        self.assertEqual(engine.current, 0)
+        engine.scores[2] = 40
+        self.assertEqual(engine.leading_opponent(0), 40)
+        self.assertEqual(engine.leading_opponent(2), 0)
+
+    def test_step_plays_to_a_winner(self):
+        """Stepping with the engine's own dice always finishes a game."""
+        self.engine.reset()
+        while self.engine.winner is None:
+            if self.engine.phase == Phase.TURN_OVER:
+                self.engine.next_turn()
+            elif (Action.HOLD in self.engine.legal_actions()
+                  and self.engine.turn_total >= 20):
+                self.engine.step(Action.HOLD)
+            else:
+                self.engine.step(Action.ROLL)
+        self.assertGreaterEqual(max(self.engine.scores), 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
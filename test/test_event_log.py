@@ -0,0 +1,119 @@
+"""Unit tests for the binary game event log and its replayer."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from dice.dice_hand import DiceHand
+from dice.engine import Action, GameEngine, Phase
+from dice.event_log import (
+    HEADER, EventLog, iter_games, read_header, replay, replay_results
+)
+from dice.rng import RngStream
+
+
+def play_logged_game(engine):
+    """Play one hold-at-20 game on ``engine`` from a fresh reset."""
+    engine.reset()
+    while engine.winner is None:
+        if engine.phase == Phase.TURN_OVER:
+            engine.next_turn()
+        elif (Action.HOLD in engine.legal_actions()
+              and engine.turn_total >= 20):
+            engine.step(Action.HOLD)
+        else:
+            engine.step(Action.ROLL)
+
+
+class TestEventLog(unittest.TestCase):
+    """Test suite for EventLog and replay."""
+
+    def setUp(self):
+        """Create a temporary log path and a seeded engine."""
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder)
+        self.path = os.path.join(self.folder, "events.log")
+        self.engine = GameEngine(["A", "B"], DiceHand(RngStream(4)))
+
+    def test_nothing_written_before_flush(self):
+        """The file is only created when records are flushed."""
+        log = EventLog(self.path)
+        log.attach(self.engine)
+        self.engine.reset()
+        self.assertFalse(os.path.exists(self.path))
+        log.close()
+        self.assertEqual(read_header(self.path), 100)
+
+    def test_replay_matches_final_state(self):
+        """Replaying every record rebuilds the scores and winner."""
+        with EventLog(self.path) as log:
+            log.attach(self.engine)
+            play_logged_game(self.engine)
+        games = list(iter_games(self.path))
+        self.assertEqual(len(games), 1)
+        engine = replay(games[0])
+        self.assertEqual(list(engine.scores), list(self.engine.scores))
+        self.assertEqual(engine.winner, self.engine.winner)
+        self.assertLess(os.path.getsize(self.path), HEADER.size + 400)
+
+    def test_replay_to_any_record(self):
+        """A prefix of the records gives the state at that point."""
+        with EventLog(self.path) as log:
+            log.attach(self.engine)
+            self.engine.reset(first=1)
+            self.engine.step(Action.ROLL)
+            turn_total = self.engine.turn_total
+            play_logged_game(self.engine)
+        engine = replay(next(iter_games(self.path)), upto=2)
+        self.assertEqual(engine.current, 1)
+        self.assertEqual(engine.turn_total, turn_total)
+
+    def test_replay_results_for_many_games(self):
+        """The fast replayer agrees with the engine for every game."""
+        expected = []
+        with EventLog(self.path) as log:
+            log.attach(self.engine)
+            for _ in range(25):
+                play_logged_game(self.engine)
+                expected.append(
+                    (self.engine.winner, list(self.engine.scores))
+                )
+        results = [(winner, scores)
+                   for winner, _, scores in replay_results(self.path)]
+        self.assertEqual(results, expected)
+
+    def test_resumed_game_is_its_own_game(self):
+        """A resumed game starts from the restored state, not the last game."""
+        with EventLog(self.path) as log:
+            log.attach(self.engine)
+            play_logged_game(self.engine)
+            first = (self.engine.winner, list(self.engine.scores))
+            self.engine.resume([250, 23], 1, 17, Phase.MAY_HOLD)
+            self.engine.hold()
+        games = list(iter_games(self.path))
+        self.assertEqual(len(games), 2)
+        engine = replay(games[1], upto=2)
+        self.assertEqual(list(engine.scores), [250, 23])
+        self.assertEqual((engine.current, engine.turn_total), (1, 17))
+        results = [(winner, scores)
+                   for winner, _, scores in replay_results(self.path)]
+        self.assertEqual(results, [first, (None, [250, 40])])
+
+    def test_appends_across_sessions(self):
+        """Reopening a log appends games after the single header."""
+        for _ in range(2):
+            with EventLog(self.path) as log:
+                log.attach(self.engine)
+                play_logged_game(self.engine)
+        self.assertEqual(len(list(iter_games(self.path))), 2)
+
+    def test_rejects_foreign_file(self):
+        """Files without the log header are refused."""
+        with open(self.path, "wb") as file:
+            file.write(b"not a log")
+        with self.assertRaises(ValueError):
+            read_header(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Unit tests for the cross-process file lock and atomic writes."""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from dice.file_lock import atomic_write, locked
+
+
+def add_to_counter(path, times):
+    """Increment the number in ``path`` with plain, unatomic file I/O."""
+    for _ in range(times):
+        with locked(path):
+            with open(path, encoding="utf-8") as file:
+                value = int(file.read())
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(str(value + 1))
+
+
+class TestFileLock(unittest.TestCase):
+    """Test suite for locked and atomic_write."""
+
+    def setUp(self):
+        """Create a file in a temporary folder."""
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder)
+        self.path = os.path.join(self.folder, "counter")
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("0")
+
+    def test_lock_serializes_processes(self):
+        """Read-modify-write cycles under the lock lose no update."""
+        context = multiprocessing.get_context("fork")
+        workers = [context.Process(target=add_to_counter,
+                                   args=(self.path, 50))
+                   for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        with open(self.path, encoding="utf-8") as file:
+            self.assertEqual(file.read(), "200")
+
+    def test_atomic_write_replaces_content(self):
+        """The chunks become the whole new content."""
+        atomic_write(self.path, b"12", b"34")
+        with open(self.path, "rb") as file:
+            self.assertEqual(file.read(), b"1234")
+        self.assertEqual(os.listdir(self.folder), ["counter"])
+
+    def test_failed_write_keeps_old_file(self):
+        """A failure before the rename leaves the target untouched."""
+        with patch("os.replace", side_effect=OSError), \
+                self.assertRaises(OSError):
+            atomic_write(self.path, b"new")
+        with open(self.path, "rb") as file:
+            self.assertEqual(file.read(), b"0")
+        self.assertEqual(os.listdir(self.folder), ["counter"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,21 +1,37 @@
 # test/test_game_basic.py
 """Unit tests for the Game class, covering PvP and PvC turns and utility methods."""
 
+import os
+import tempfile
 import unittest
+from io import StringIO
 from unittest.mock import patch, MagicMock
 from dice.game import Game
+from dice.dice_hand import OUTCOME_TABLE, Outcome
+from dice.engine import EventKind
+from dice.renderer import StructuredRenderer
 
 
-class TestGameBasic(unittest.TestCase):
-    """Basic unit tests for Game (PvP & PvC turns) plus utility methods."""
+class GameTestCase(unittest.TestCase):
+    """Shared setup for the Game test suites."""
 
     def setUp(self):
         """Set up a Game instance with default players and scores."""
         self.game = Game()
-        self.game.pvp = ["Player 1", "Player 2"]
-        self.game.pvc = ["Player", "Jarvis AI"]
-        self.game.pvp_scores = {p: 0 for p in self.game.pvp}
-        self.game.pvc_scores = {p: 0 for p in self.game.pvc}
+        self.engine = self.game.engine
+
+    def seat_pvp(self):
+        """Seat two humans."""
+        self.game.seat_players(["Player 1", "Player 2"], [None, None])
+
+    def seat_pvc(self, level, computer_first=False):
+        """Seat a human against the computer at ``level``."""
+        self.game.seat_players(["Player", "Jarvis AI"], [None, level])
+        self.engine.current = 1 if computer_first else 0
+
+
+class TestGameBasic(GameTestCase):
+    """Basic unit tests for Game (PvP & PvC turns) plus utility methods."""
 
     # ---------------- PvP simple turn ----------------
     @patch("builtins.input", side_effect=["n", "n"])
@@ -24,13 +40,14 @@ class TestGameBasic(unittest.TestCase):
         "is_single_one": False,
         "must_reroll": False,
         "total": 5,
+        "outcome": Outcome.NORMAL,
     })
     def test_pvp_play_simple(self, _mock_roll, _mock_input):
         """Test a simple PvP turn with no ones or rerolls."""
-        self.game.current_player_pvp = "Player 1"
-        self.game.pvp_play("1")
-        self.assertEqual(self.game.pvp_scores["Player 1"], 5)
-        self.assertEqual(self.game.current_player_pvp, "Player 2")
+        self.seat_pvp()
+        self.game.play_turn()
+        self.assertEqual(self.engine.scores[0], 5)
+        self.assertEqual(self.engine.current_name, "Player 2")
 
     # ---------------- PvP double one ----------------
     @patch("builtins.input", side_effect=["n", "n"])
@@ -39,13 +56,14 @@ class TestGameBasic(unittest.TestCase):
         "is_single_one": False,
         "must_reroll": False,
         "total": 0,
+        "outcome": Outcome.SNAKE_EYES,
     })
     def test_pvp_play_double_one(self, _mock_roll, _mock_input):
         """Test that a double one in PvP resets the player's score to 0."""
-        self.game.current_player_pvp = "Player 1"
-        self.game.pvp_scores["Player 1"] = 10
-        self.game.pvp_play("1")
-        self.assertEqual(self.game.pvp_scores["Player 1"], 0)
+        self.seat_pvp()
+        self.engine.scores[0] = 10
+        self.game.play_turn()
+        self.assertEqual(self.engine.scores[0], 0)
 
     # ---------------- PvP single one ----------------
     @patch("builtins.input", side_effect=["n", "n"])
@@ -54,13 +72,14 @@ class TestGameBasic(unittest.TestCase):
         "is_single_one": True,
         "must_reroll": False,
         "total": 10,
+        "outcome": Outcome.BUST,
     })
     def test_pvp_play_single_one(self, _mock_roll, _mock_input):
         """Test that a single one in PvP does not add to the player's score."""
-        self.game.current_player_pvp = "Player 1"
-        self.game.pvp_scores["Player 1"] = 15
-        self.game.pvp_play("1")
-        self.assertEqual(self.game.pvp_scores["Player 1"], 15)
+        self.seat_pvp()
+        self.engine.scores[0] = 15
+        self.game.play_turn()
+        self.assertEqual(self.engine.scores[0], 15)
 
     # ---------------- PvC simple turn ----------------
     @patch("builtins.input", side_effect=["n", "n"])
@@ -69,28 +88,30 @@ class TestGameBasic(unittest.TestCase):
         "is_single_one": False,
         "must_reroll": False,
         "total": 4,
+        "outcome": Outcome.NORMAL,
     })
     def test_pvc_play_player_turn(self, _mock_roll, _mock_input):
         """Test a simple player turn in PvC mode."""
-        self.game.current_player_pvc = "Player"
-        self.game.pvc_play("2", "1")
-        self.assertEqual(self.game.pvc_scores["Player"], 4)
-        self.assertEqual(self.game.current_player_pvc, "Jarvis AI")
+        self.seat_pvc("1")
+        self.game.play_turn()
+        self.assertEqual(self.engine.scores[0], 4)
+        self.assertEqual(self.engine.current_name, "Jarvis AI")
 
     # ---------------- PvC AI turn ----------------
     @patch("dice.game.Game.computer_roll")
     @patch("dice.intelligence.Intelligence.easy", return_value="n")
     def test_pvc_play_ai_turn(self, _mock_easy, mock_comp_roll):
         """Test AI turn in PvC mode."""
-        self.game.current_player_pvc = "Jarvis AI"
+        self.seat_pvc("1", computer_first=True)
         mock_comp_roll.return_value = {
             "is_double_one": False,
             "is_single_one": False,
             "must_reroll": False,
             "total": 7,
+            "outcome": Outcome.NORMAL,
         }
-        self.game.pvc_play("2", "1")
-        self.assertEqual(self.game.pvc_scores["Jarvis AI"], 7)
+        self.game.play_turn()
+        self.assertEqual(self.engine.scores[1], 7)
 
     # ---------------- PvC single one ----------------
     @patch("builtins.input", side_effect=["n", "n"])
@@ -99,47 +120,50 @@ class TestGameBasic(unittest.TestCase):
         "is_single_one": True,
         "must_reroll": False,
         "total": 0,
+        "outcome": Outcome.BUST,
     })
     def test_pvc_play_single_one_player(self, _mock_roll, _mock_input):
         """Test that a single one on the player turn in PvC does not add score."""
-        self.game.current_player_pvc = "Player"
-        self.game.pvc_play("2", "1")
-        self.assertEqual(self.game.pvc_scores["Player"], 0)
+        self.seat_pvc("1")
+        self.game.play_turn()
+        self.assertEqual(self.engine.scores[0], 0)
 
     # ---------------- PvC double one (AI turn) ----------------
     @patch("dice.game.Game.computer_roll")
     @patch("dice.intelligence.Intelligence.easy", return_value="n")
     def test_pvc_play_double_one_ai(self, _mock_easy, mock_comp_roll):
         """Test that a double one in AI PvC turn resets the score to 0."""
-        self.game.current_player_pvc = "Jarvis AI"
+        self.seat_pvc("1", computer_first=True)
         mock_comp_roll.return_value = {
             "is_double_one": True,
             "is_single_one": False,
             "must_reroll": False,
             "total": 12,
+            "outcome": Outcome.SNAKE_EYES,
         }
-        self.game.pvc_scores["Jarvis AI"] = 20
-        self.game.pvc_play("2", "1")
-        self.assertEqual(self.game.pvc_scores["Jarvis AI"], 0)
+        self.engine.scores[1] = 20
+        self.game.play_turn()
+        self.assertEqual(self.engine.scores[1], 0)
 
     # ---------------- PvC must reroll ----------------
     @patch("builtins.input", side_effect=["n", "n"])
     @patch("dice.game.Game.roll", side_effect=[
         {
             "is_double_one": False, "is_single_one": False,
-            "must_reroll": True, "total": 6
+            "must_reroll": True, "total": 6,
+            "outcome": Outcome.REROLL
             },
         {
             "is_double_one": False, "is_single_one": False,
-            "must_reroll": False, "total": 4
+            "must_reroll": False, "total": 4,
+            "outcome": Outcome.NORMAL
             },
     ])
     def test_pvc_play_must_reroll(self, _mock_roll, _mock_input):
         """Test that a reroll in PvC adds to the turn total correctly."""
-        self.game.current_player_pvc = "Player"
-        self.game.pvc_scores["Player"] = 0
-        self.game.pvc_play("2", "1")
-        self.assertEqual(self.game.pvc_scores["Player"], 10)
+        self.seat_pvc("1")
+        self.game.play_turn()
+        self.assertEqual(self.engine.scores[0], 10)
 
     # ---------------- PvP pause/quit ----------------
     @patch("builtins.input", side_effect=["p", "4", "y"])
@@ -148,14 +172,17 @@ class TestGameBasic(unittest.TestCase):
         "is_single_one": False,
         "must_reroll": False,
         "total": 8,
+        "outcome": Outcome.NORMAL,
     })
     def test_pvp_pause_quit(self, _mock_roll, _mock_input):
-        """Test pausing then quitting during PvP returns 'quit' and resets score."""
-        self.game.current_player_pvp = "Player 1"
-        result = self.game.pvp_play("1")
+        """Test pausing then quitting during PvP returns 'quit' without a restart."""
+        self.seat_pvp()
+        kinds = []
+        self.engine.listeners.append(lambda event: kinds.append(event.kind))
+        result = self.game.play_turn()
         self.assertEqual(result, "quit")
-        self.assertEqual(self.game.pvp_scores["Player 1"], 0)
-        self.assertEqual(self.game.turn_total, 0)
+        self.assertEqual(self.engine.scores[0], 0)
+        self.assertNotIn(EventKind.RESTART, kinds)
 
     # ---------------- PvC player changes name ----------------
     @patch("builtins.input", side_effect=["p", "3", "player123", "NewName", "n"])
@@ -164,88 +191,77 @@ class TestGameBasic(unittest.TestCase):
         "is_single_one": False,
         "must_reroll": False,
         "total": 5,
+        "outcome": Outcome.NORMAL,
     })
     def test_pvc_player_change_name(self, _mock_roll, _mock_input):
         """Test updating the PvC player's name mid-turn."""
-        self.game.current_player_pvc = "Player"
-        self.game.pvc_scores["Player"] = 0
-        self.game.pvc_play("2", "1")
-        self.assertIn("NewName", self.game.pvc)
-        self.assertEqual(self.game.current_player_pvc, "Jarvis AI")
-        self.assertEqual(self.game.pvc_scores["NewName"], 5)
+        self.seat_pvc("1")
+        self.game.play_turn()
+        self.assertEqual(self.engine.players, ["NewName", "Jarvis AI"])
+        self.assertEqual(self.engine.current_name, "Jarvis AI")
+        self.assertEqual(self.engine.scores[0], 5)
 
     # ---------------- PvC AI mid hold ----------------
     @patch("dice.game.Game.computer_roll")
     @patch("dice.intelligence.Intelligence.mid", return_value="n")
     def test_pvc_ai_mid_hold(self, _mock_mid, mock_comp_roll):
         """Test medium-level AI deciding to hold in PvC."""
-        self.game.current_player_pvc = "Jarvis AI"
-        self.game.pvc_scores["Jarvis AI"] = 10
+        self.seat_pvc("2", computer_first=True)
+        self.engine.scores[1] = 10
         mock_comp_roll.return_value = {
             "is_double_one": False,
             "is_single_one": False,
             "must_reroll": False,
             "total": 15,
+            "outcome": Outcome.NORMAL,
         }
-        self.game.pvc_play("2", "2")
-        self.assertEqual(self.game.pvc_scores["Jarvis AI"], 25)
-        self.assertEqual(self.game.current_player_pvc, "Player")
-
-    # ---------------- Switch PvP ----------------
-    def test_switch_pvp(self):
-        """Test switching turn in PvP resets turn total."""
-        self.game.turn_total = 12
-        self.game.current_player_pvp = "Player 1"
-        self.game.switch_pvp()
-        self.assertEqual(self.game.current_player_pvp, "Player 2")
-        self.assertEqual(self.game.turn_total, 0)
-
-    # ---------------- Switch PvC ----------------
-    def test_switch_pvc(self):
-        """Test switching turn in PvC resets turn total."""
-        self.game.turn_total = 15
-        self.game.current_player_pvc = "Player"
-        self.game.switch_pvc()
-        self.assertEqual(self.game.current_player_pvc, "Jarvis AI")
-        self.assertEqual(self.game.turn_total, 0)
-
-    # ---------------- Double one PvP ----------------
-    def test_double_one_pvp_resets_score(self):
-        """Test double one in PvP resets player's score."""
-        self.game.current_player_pvp = "Player 1"
-        self.game.pvp_scores["Player 1"] = 50
-        self.game.double_one_pvp()
-        self.assertEqual(self.game.pvp_scores["Player 1"], 0)
-
-    # ---------------- Double one PvC ----------------
-    def test_double_one_pvc_resets_score(self):
-        """Test double one in PvC resets player's score."""
-        self.game.current_player_pvc = "Player"
-        self.game.pvc_scores["Player"] = 40
-        self.game.double_one_pvc()
-        self.assertEqual(self.game.pvc_scores["Player"], 0)
-
-    # ---------------- Save PvP1 stats ----------------
-    def test_save_pvp1_updates_stats(self):
-        """Test saving PvP1 stats updates histogram + highscore."""
-        self.game.pvp_scores = {"Player 1": 50, "Player 2": 40}
+        self.game.play_turn()
+        self.assertEqual(self.engine.scores[1], 25)
+        self.assertEqual(self.engine.current_name, "Player")
+
+    # ---------------- Next seat ----------------
+    def test_next_seat_resets_turn_total(self):
+        """Test passing the dice resets the turn total."""
+        self.seat_pvp()
+        self.engine.turn_total = 12
+        self.game.next_seat()
+        self.assertEqual(self.engine.current_name, "Player 2")
+        self.assertEqual(self.engine.turn_total, 0)
+
+    # ---------------- Double one ----------------
+    def test_double_one_resets_score(self):
+        """Test double one resets the seat's score."""
+        self.seat_pvp()
+        self.engine.scores[0] = 50
+        self.engine.apply_roll(OUTCOME_TABLE[0])
+        self.assertEqual(self.engine.scores[0], 0)
+
+    # ---------------- Save stats ----------------
+    def test_save_seat_winner_updates_stats(self):
+        """Test saving a winning seat updates histogram + highscore."""
+        self.game.seat_players(["Player 1", "Player 2"], [None, None],
+                               ["p1_id", "p2_id"])
+        self.engine.scores[0], self.engine.scores[1] = 50, 40
+        self.engine.winner = 0
         self.game.histogram = MagicMock()
         self.game.highscore = MagicMock()
-        self.game.save_pvp1("p1_id", "Player 1")
+        self.game.save_seat(0)
         self.game.histogram.increment_games_played.assert_called_with("p1_id")
         self.game.histogram.increment_games_won.assert_called_with("p1_id")
         self.game.highscore.set_highscore.assert_called_with(50)
         self.game.histogram.check_highscore.assert_called()
 
-    # ---------------- Save PvC1 player wins ----------------
-    def test_save_pvc1_player_wins(self):
-        """Test saving PvC stats when player wins updates histogram & highscore."""
-        self.game.pvc_scores = {"Player": 60, "Jarvis AI": 45}
+    def test_save_seat_loser_updates_stats(self):
+        """Test saving a losing seat against the computer."""
+        self.game.seat_players(["Player", "Jarvis AI"], [None, "1"],
+                               ["user123", None])
+        self.engine.scores[0], self.engine.scores[1] = 60, 100
+        self.engine.winner = 1
         self.game.histogram = MagicMock()
         self.game.highscore = MagicMock()
-        self.game.save_pvc1("user123", "Player")
+        self.game.save_seat(0)
         self.game.histogram.increment_games_played.assert_called_with("user123")
-        self.game.histogram.increment_games_won.assert_called_with("user123")
+        self.game.histogram.increment_games_lost.assert_called_with("user123")
         self.game.highscore.set_highscore.assert_called_with(60)
 
     # ---------------- player_type new ----------------
@@ -275,5 +291,102 @@ class TestGameBasic(unittest.TestCase):
         self.assertEqual(username, "ExistingPlayer")
 
 
+class TestGameSeating(GameTestCase):
+    """Tests for matches with any number and mix of seats."""
+
+    def test_next_seat_wraps_many_seats(self):
+        """Test rotation wraps around with more than two seats."""
+        self.game.seat_players(["A", "B", "C"], [None, "1", "3"])
+        for _ in range(3):
+            self.game.next_seat()
+        self.assertEqual(self.engine.current_name, "A")
+        self.assertEqual(len(self.engine.scores), 3)
+
+    @patch("dice.intelligence.Intelligence.hard", return_value="n")
+    def test_computer_decision_uses_leader(self, mock_hard):
+        """Test an AI among several seats plays against the leader."""
+        self.game.seat_players(["A", "B", "C"], [None, None, "3"])
+        self.engine.scores[0], self.engine.scores[1] = 30, 70
+        self.engine.turn_total = 9
+        self.assertEqual(self.game.computer_decision(2), "n")
+        mock_hard.assert_called_with(9, 70, 0)
+
+
+class TestGameRenderer(GameTestCase):
+    """Tests for swapping the output renderer."""
+
+    @patch("dice.game.Game.computer_roll")
+    @patch("dice.intelligence.Intelligence.easy", return_value="n")
+    def test_renderer_swap_keeps_logic(self, _mock_easy, mock_comp_roll):
+        """Test a structured renderer sees events and prints nothing."""
+        received = []
+        mock_comp_roll.return_value = OUTCOME_TABLE[8]
+        self.seat_pvc("1", computer_first=True)
+        self.game.renderer = StructuredRenderer(received.append)
+        with patch("sys.stdout", new_callable=StringIO) as stdout:
+            self.game.play_turn()
+            self.assertEqual(stdout.getvalue(), "")
+        self.assertEqual(self.engine.scores[1], 5)
+        self.assertEqual([message["event"] for message in received],
+                         ["roll", "hold", "turn_start"])
+
+
+class TestGameSnapshot(GameTestCase):
+    """Tests for saving and restoring games in progress."""
+
+    def test_snapshot_restore_continues_game(self):
+        """Test a restored game has the same seats, state and dice."""
+        self.game.seat_players(["Ann", "Jarvis AI"], [None, "2"],
+                               ["ann1", None])
+        self.engine.scores[0], self.engine.turn_total = 33, 12
+        self.game.ai_states[1].seen_scores.add(40)
+        data = self.game.snapshot()
+        expected = [self.game.dice_hand.roll() for _ in range(5)]
+
+        other = Game()
+        other.restore(data)
+        self.assertEqual(other.engine.players, ["Ann", "Jarvis AI"])
+        self.assertEqual(list(other.engine.scores), [33, 0])
+        self.assertEqual(other.engine.turn_total, 12)
+        self.assertEqual(other.levels, [None, "2"])
+        self.assertEqual(other.user_ids, ["ann1", None])
+        self.assertEqual(other.ai_states[1].seen_scores, {40})
+        self.assertEqual([other.dice_hand.roll() for _ in range(5)], expected)
+
+    def test_restore_rejects_damaged_snapshot(self):
+        """Test a truncated snapshot raises ValueError and changes nothing."""
+        self.game.seat_players(["Ann", "Bob"], [None, None])
+        data = self.game.snapshot()
+        other = Game()
+        with self.assertRaises(ValueError):
+            other.restore(data[:-7])
+        self.assertEqual(other.engine.players, ["Player 1", "Player 2"])
+
+    @patch("dice.game.atomic_write")
+    @patch("builtins.input", side_effect=["5", "4", "y"])
+    def test_save_rejects_long_name(self, _mock_input, mock_write):
+        """Test an unsaveable name reopens the pause menu and writes nothing."""
+        self.game.seat_players(["A" * 300, "Bob"], [None, None])
+        with patch("sys.stdout", new_callable=StringIO) as stdout:
+            self.assertEqual(self.game.handle_pause(0), "quit")
+        self.assertIn("too long to save", stdout.getvalue())
+        self.assertEqual(stdout.getvalue().count("Paused"), 2)
+        mock_write.assert_not_called()
+
+
+class TestGameStatsStore(GameTestCase):
+    """Tests for the stats store a game is built on."""
+
+    def test_stats_db_has_own_leaderboard(self):
+        """Test the SQLite store does not share the pickle store's rankings."""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "stats.db")
+            game = Game(stats_db=path)
+            self.assertEqual(game.leaderboard.path, path + ".leaderboard")
+            self.assertIs(game.histogram.listeners[0].__self__,
+                          game.leaderboard)
+            game.histogram.connection.close()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,14 +1,29 @@
 """
 Unit tests for the Histogram class.
 
-These tests mock file I/O operations to prevent reading/writing
-real files and ensure deterministic, isolated testing.
+The record tests mock the stats file loading to stay deterministic and
+isolated; the journal tests work on files in a temporary folder.
 """
 
+import multiprocessing
+import os
 import unittest
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
+from test.stats_helpers import StatsTestCase
 
-from dice.histogram import Histogram
+from dice.histogram import (
+    HEADER, JOURNAL_SUFFIX, Histogram, read_journal
+)
+
+
+def play_many(path, p_id, games):
+    """Save ``games`` single-game updates from a separate process."""
+    hist = Histogram(path, compact_bytes=400)
+    for _ in range(games):
+        hist.increment_games_played(p_id)
+        hist.increment_games_won("shared")
+        hist.save_stats()
+    hist.compact(wait=True)
 
 
 class TestHistogram(unittest.TestCase):
@@ -26,9 +41,9 @@ class TestHistogram(unittest.TestCase):
             }
         }
 
-        # Mock pickle.load to return mock_data
-        with patch("builtins.open", mock_open(read_data=b"data")), \
-                patch("pickle.load", return_value=self.mock_data):
+        # Mock the stats file to return mock_data
+        with patch("dice.histogram.Histogram.load_stats_file",
+                   return_value=self.mock_data):
             self.hist = Histogram()
 
     def test_increment_games_played(self):
@@ -72,12 +87,161 @@ class TestHistogram(unittest.TestCase):
         self.assertIn("new_player", self.hist.details)
         self.assertEqual(self.hist.details["new_player"]["Games_Played"], 1)
 
-    @patch("pickle.dump")
-    def test_save_stats(self, mock_dump):
-        """Test stats saving using mocked pickle.dump."""
-        with patch("builtins.open", mock_open()):
-            self.hist.save_stats()
-            mock_dump.assert_called_once_with(self.hist.details, unittest.mock.ANY)
+    def test_record_results(self):
+        """Many games are added to the counters in one update."""
+        self.hist.record_results("player1", 4, 6, 80)
+        record = self.hist.details["player1"]
+        self.assertEqual(record["Games_Played"], 15)
+        self.assertEqual(record["Games_Won"], 7)
+        self.assertEqual(record["Games_Lost"], 8)
+        self.assertEqual(record["Highscore"], 80)
+
+    def test_record_results_new_player(self):
+        """A new ID starts from an empty record."""
+        self.hist.record_results("bot", 2, 1, 30)
+        self.assertEqual(self.hist.details["bot"]["Games_Played"], 3)
+        self.assertEqual(self.hist.details["bot"]["Highscore"], 30)
+
+    def test_only_changed_records_are_dirty(self):
+        """Mutations mark just the touched players for the next save."""
+        self.hist.check_highscore("player1", 10)
+        self.assertEqual(self.hist.dirty, set())
+        self.hist.increment_games_won("player1")
+        self.assertEqual(self.hist.dirty, {"player1"})
+
+    def test_batch_saves_once_at_the_end(self):
+        """Saves inside nested batches become one save on exit."""
+        with patch.object(self.hist, "write_changes") as write, \
+                patch.object(self.hist, "refresh", return_value=False):
+            with self.hist.batch():
+                for p_id in ("player1", "player2"):
+                    with self.hist.batch():
+                        self.hist.increment_games_played(p_id)
+                        self.hist.save_stats()
+                write.assert_not_called()
+        write.assert_called_once()
+        self.assertEqual(len(write.call_args.args[0]), 2)
+        self.assertEqual(self.hist.dirty, set())
+
+    def test_batch_discards_on_error(self):
+        """A failing batch leaves the records as they were saved."""
+        with self.assertRaises(RuntimeError), self.hist.batch():
+            self.hist.increment_games_won("player1")
+            self.hist.update_username("player2", "Eve")
+            raise RuntimeError
+        self.assertEqual(self.hist.details, self.mock_data)
+        self.assertEqual(self.hist.dirty, set())
+
+
+class TestHistogramJournal(StatsTestCase):
+    """Tests for the journal, its recovery and compaction."""
+
+    records = {"p1": {"Username": "Ann", "Highscore": 40, "Games_Played": 2,
+                      "Games_Won": 1, "Games_Lost": 1}}
+
+    def setUp(self):
+        """Create a snapshot with one player in a temporary folder."""
+        super().setUp()
+        self.journal = self.path + JOURNAL_SUFFIX
+
+    def test_save_appends_and_reloads(self):
+        """Saves leave the snapshot alone and survive a reload."""
+        hist = Histogram(self.path)
+        snapshot_size = os.path.getsize(self.path)
+        self.play(hist, "p1", True, 90)
+        hist.update_username("p2", "Bob")
+        self.play(hist, "p2", False, 30)
+        self.assertEqual(os.path.getsize(self.path), snapshot_size)
+        self.assertEqual(Histogram(self.path).details, hist.details)
+        self.assertEqual(hist.details["p1"]["Games_Won"], 2)
+
+    def test_save_cost_independent_of_players(self):
+        """A save writes only the records touched since the last one."""
+        hist = Histogram(self.path)
+        for number in range(200):
+            hist.increment_games_played(f"bot{number}")
+        hist.save_stats()
+        size = os.path.getsize(self.journal)
+        self.play(hist, "p1", True, 50)
+        self.assertLess(os.path.getsize(self.journal) - size, 200)
+
+    def test_batch_is_one_journal_entry(self):
+        """A batch over two players appends a single entry."""
+        hist = Histogram(self.path)
+        with hist.batch():
+            self.play(hist, "p1", True, 70)
+            self.play(hist, "p2", False, 20)
+        self.assertEqual(hist.details, Histogram(self.path).details)
+        self.assertEqual(
+            len(read_journal(self.journal)[1]), 1
+        )
+
+    def test_torn_entry_is_dropped(self):
+        """A half-written entry from a crash is ignored and cut off."""
+        hist = Histogram(self.path)
+        self.play(hist, "p1", True, 90)
+        intact = os.path.getsize(self.journal)
+        with open(self.journal, "ab") as file:
+            file.write(b"\x40\x00\x00\x00torn")
+        recovered = Histogram(self.path)
+        self.assertEqual(recovered.details, hist.details)
+        self.assertEqual(os.path.getsize(self.journal), intact)
+        self.play(recovered, "p1", False, 10)
+        self.assertEqual(Histogram(self.path).details["p1"]["Games_Played"],
+                         4)
+
+    def test_headerless_journal_is_replaced(self):
+        """An empty or half-created journal loads as an empty one."""
+        for content in (b"", b"PIG"):
+            with open(self.journal, "wb") as file:
+                file.write(content)
+            hist = Histogram(self.path)
+            self.assertEqual(hist.details["p1"]["Games_Played"], 2)
+            self.assertEqual(os.path.getsize(self.journal), HEADER.size)
+            self.play(hist, "p1", True, 30)
+            self.assertEqual(Histogram(self.path).details["p1"]["Games_Played"],
+                             3)
+            os.remove(self.journal)
+
+    def test_compaction_folds_journal_into_snapshot(self):
+        """Compaction rewrites the snapshot and removes old journals."""
+        hist = Histogram(self.path, compact_bytes=300)
+        for game in range(6):
+            self.play(hist, "p1", game % 2 == 0, 10 * game)
+        hist.compact(wait=True)
+        self.assertEqual(hist.rotated_journals(), [])
+        self.assertEqual(os.path.getsize(self.journal), HEADER.size)
+        self.play(hist, "p1", True, 99)
+        reloaded = Histogram(self.path)
+        self.assertEqual(reloaded.details, hist.details)
+        self.assertEqual(reloaded.details["p1"]["Games_Played"], 9)
+
+    def test_processes_share_one_folder(self):
+        """Concurrent savers and compactions lose no update."""
+        context = multiprocessing.get_context("fork")
+        workers = [context.Process(target=play_many,
+                                   args=(self.path, f"w{number}", 40))
+                   for number in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        details = Histogram(self.path).details
+        self.assertEqual(details["shared"]["Games_Won"], 120)
+        for number in range(3):
+            self.assertEqual(details[f"w{number}"]["Games_Played"], 40)
+        self.assertEqual(details["p1"]["Games_Played"], 2)
+
+    def test_crash_before_journal_cleanup(self):
+        """A rotated journal already in the snapshot is not applied twice."""
+        hist = Histogram(self.path)
+        self.play(hist, "p1", True, 60)
+        with patch("os.remove"):
+            hist.compact(wait=True)
+        self.assertEqual(len(hist.rotated_journals()), 1)
+        reloaded = Histogram(self.path)
+        self.assertEqual(reloaded.details, hist.details)
+        self.assertEqual(reloaded.rotated_journals(), [])
 
 
 if __name__ == "__main__":
@@ -5,7 +5,10 @@ Tests decision-making logic for easy, medium, and hard difficulty levels.
 """
 
 import unittest
-from dice.intelligence import Intelligence
+from unittest.mock import patch
+import numpy as np
+from dice.intelligence import Intelligence, MidBatchState, MidState
+from dice.solver import solve
 
 
 class TestIntelligence(unittest.TestCase):
@@ -46,6 +49,25 @@ class TestIntelligence(unittest.TestCase):
             "Medium turn count should reset to 5"
             )
 
+    def test_mid_state_is_per_game(self):
+        """Test one Intelligence keeps separate state for separate games."""
+        first, second = self.ai.new_state(), self.ai.new_state()
+        self.ai.mid(turn_total=5, score=10, comp_double_one=False, state=first)
+        self.ai.mid(turn_total=5, score=20, comp_double_one=False, state=first)
+        self.assertEqual(first.turn_count, 3)
+        self.assertEqual(first.seen_scores, {10, 20})
+        self.assertEqual(second.turn_count, 5)
+        self.assertEqual(self.ai.medium_turn_count, 5)
+
+    def test_mid_state_slots(self):
+        """Test per-game state records carry no instance dictionary."""
+        state = MidState()
+        self.assertFalse(hasattr(state, "__dict__"))
+        state.seen_scores.add(7)
+        state.turn_count = 1
+        state.reset()
+        self.assertEqual((state.turn_count, state.seen_scores), (5, set()))
+
     def test_hard_decision_late_game(self):
         """Test hard AI decision logic near winning score."""
         # computer close to winning
@@ -76,6 +98,70 @@ class TestIntelligence(unittest.TestCase):
             """
         )
 
+    def test_easy_batch_matches_scalar(self):
+        """Test easy_batch agrees with easy for every turn total."""
+        totals = np.arange(0, 60)
+        expected = [self.ai.easy(int(t)) == 'y' for t in totals]
+        self.assertEqual(self.ai.easy_batch(totals).tolist(), expected)
+
+    def test_hard_batch_matches_scalar(self):
+        """Test hard_batch agrees with hard over a grid of states."""
+        totals, players, computers = np.meshgrid(
+            np.arange(0, 40), np.arange(0, 100, 3), np.arange(0, 100, 3),
+            indexing="ij"
+        )
+        totals, players, computers = (
+            totals.ravel(), players.ravel(), computers.ravel()
+        )
+        expected = [
+            self.ai.hard(int(t), int(p), int(c)) == 'y'
+            for t, p, c in zip(totals, players, computers)
+        ]
+        self.assertEqual(
+            self.ai.hard_batch(totals, players, computers).tolist(), expected
+        )
+
+    def test_mid_batch_matches_scalar(self):
+        """Test mid_batch tracks per-game state exactly like mid."""
+        rng = np.random.default_rng(4)
+        games = 200
+        scalar = [Intelligence() for _ in range(games)]
+        state = MidBatchState(games)
+        scores = np.zeros(games, dtype=np.int64)
+        for _ in range(30):
+            scores = np.minimum(scores + rng.integers(0, 3, games) * 7, 99)
+            totals = rng.integers(0, 40, games)
+            double_one = rng.random(games) < 0.05
+            expected = [
+                ai.mid(int(t), int(s), bool(d)) == 'y'
+                for ai, t, s, d in zip(scalar, totals, scores, double_one)
+            ]
+            result = self.ai.mid_batch(totals, scores, double_one, state)
+            self.assertEqual(result.tolist(), expected)
+            self.assertEqual(
+                state.turn_count.tolist(),
+                [ai.medium_turn_count for ai in scalar]
+            )
+
+    def test_optimal_batch_matches_scalar(self):
+        """Test optimal_batch agrees with optimal over a grid of states."""
+        policy = solve(20)
+        with patch("dice.intelligence.optimal_policy", return_value=policy):
+            totals, computers, players = (
+                grid.ravel() for grid in np.meshgrid(
+                    np.arange(0, 30), np.arange(20), np.arange(20),
+                    indexing="ij"
+                )
+            )
+            expected = [
+                self.ai.optimal(int(t), int(c), int(p)) == 'y'
+                for t, c, p in zip(totals, computers, players)
+            ]
+            self.assertEqual(
+                self.ai.optimal_batch(totals, computers, players).tolist(),
+                expected
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
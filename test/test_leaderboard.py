@@ -0,0 +1,109 @@
+"""Unit tests for the incremental leaderboard."""
+
+import os
+import random
+import unittest
+from unittest.mock import patch
+from test.stats_helpers import StatsTestCase
+from dice.histogram import Histogram
+from dice.leaderboard import Board, Leaderboard, board_value
+
+
+class TestLeaderboard(StatsTestCase):
+    """Test suite for Board and Leaderboard."""
+
+    def setUp(self):
+        """Create empty stats and a leaderboard path in a temporary folder."""
+        super().setUp()
+        self.board_path = os.path.join(self.folder, "leaderboard.ser")
+
+    def test_board_matches_full_sort(self):
+        """Rising values keep the board equal to a sort of everyone."""
+        board = Board(5)
+        values = {}
+        rng = random.Random(3)
+        for _ in range(500):
+            p_id = f"p{rng.randrange(40)}"
+            values[p_id] = values.get(p_id, 0) + rng.randrange(1, 20)
+            board.update(p_id, values[p_id])
+        expected = sorted(values.items(), key=lambda item: (-item[1], item[0]))
+        self.assertTrue(board.exact)
+        self.assertEqual(board.top(), expected[:5])
+
+    def test_drop_below_last_place_needs_rebuild(self):
+        """A member falling under the last place makes the board inexact."""
+        board = Board(2)
+        for p_id, value in (("a", 0.9), ("b", 0.8), ("c", 0.7)):
+            board.update(p_id, value)
+        board.update("b", 0.85)
+        self.assertTrue(board.exact)
+        board.update("a", 0.1)
+        self.assertFalse(board.exact)
+
+    def test_win_rate_needs_enough_games(self):
+        """Players with few games have no win rate rank."""
+        record = {"Games_Played": 4, "Games_Won": 4}
+        self.assertIsNone(board_value("win_rate", record))
+        record["Games_Played"] = 8
+        self.assertEqual(board_value("win_rate", record), 0.5)
+
+    def test_saves_update_rankings(self):
+        """Each histogram save re-ranks the saved players."""
+        hist = Histogram(self.path)
+        board = Leaderboard(self.board_path, size=2)
+        board.attach(hist)
+        hist.update_username("a", "Ann")
+        for game in range(6):
+            self.play(hist, "a", game < 5, 40)
+            self.play(hist, "b", game < 2, 90)
+            self.play(hist, "c", game < 4, 60)
+        self.assertEqual([row[0] for row in board.top("highscore")],
+                         ["b", "c"])
+        self.assertEqual(board.top("wins")[0], ("a", "Ann", 5))
+        self.assertEqual([row[0] for row in board.top("win_rate")],
+                         ["a", "c"])
+        for _ in range(6):
+            self.play(hist, "a", False, 10)
+        self.assertEqual([row[0] for row in board.top("win_rate")],
+                         ["c", "a"])
+        self.assertIn("Top 2 by Win rate", board.table())
+
+    def test_restart_reads_file_without_scanning(self):
+        """A new leaderboard shows the saved rankings from its file."""
+        hist = Histogram(self.path)
+        board = Leaderboard(self.board_path)
+        board.attach(hist)
+        self.play(hist, "a", True, 70)
+        restarted = Leaderboard(self.board_path)
+        restarted.attach(hist)
+        with patch.object(hist, "all_records") as scan:
+            self.assertEqual(restarted.top("highscore")[0][::2], ("a", 70))
+        scan.assert_not_called()
+
+    def test_other_process_games_count(self):
+        """A save ranks the stored totals, not this process's copy."""
+        first, second = Histogram(self.path), Histogram(self.path)
+        Leaderboard(self.board_path).attach(first)
+        Leaderboard(self.board_path).attach(second)
+        for _ in range(5):
+            self.play(second, "x", True, 30)
+        self.play(first, "x", True, 20)
+        restarted = Leaderboard(self.board_path)
+        self.assertEqual(restarted.top("wins"), [("x", "", 6)])
+        self.assertEqual(restarted.top("highscore"), [("x", "", 30)])
+        self.assertEqual(restarted.top("win_rate"), [("x", "", 1.0)])
+
+    def test_saves_merge_across_processes(self):
+        """Two leaderboards on one file keep each other's players."""
+        first, second = Histogram(self.path), Histogram(self.path)
+        for hist in (first, second):
+            Leaderboard(self.board_path).attach(hist)
+        self.play(first, "a", True, 50)
+        self.play(second, "b", True, 80)
+        restarted = Leaderboard(self.board_path)
+        self.assertEqual([row[0] for row in restarted.top("highscore")],
+                         ["b", "a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,12 +9,21 @@ import unittest
 from unittest.mock import patch, mock_open
 from io import StringIO
 
+from dice import stats_cache
 from dice.main import Main
 
 
 class TestMain(unittest.TestCase):
     """Test suite for the Main application controller."""
 
+    def setUp(self):
+        """Start each test without shared stats, so the mocks load them."""
+        stats_cache.clear()
+
+    def tearDown(self):
+        """Drop the mocked stats from the shared cache."""
+        stats_cache.clear()
+
     @patch("dice.histogram.Histogram.load_stats_file", return_value={})
     @patch("dice.player.Player.get_user_id_list", return_value=[])
     @patch("builtins.input", return_value="2")
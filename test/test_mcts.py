@@ -0,0 +1,76 @@
+"""Unit tests for the Monte Carlo tree search computer player."""
+
+import unittest
+from dice.intelligence import Intelligence
+from dice.mcts import MonteCarloSearch, SearchNode
+from dice.rng import RngStream
+
+
+class TestMonteCarloSearch(unittest.TestCase):
+    """Test suite for MonteCarloSearch."""
+
+    def setUp(self):
+        """Create a seeded, iteration-capped search."""
+        self.search = MonteCarloSearch(RngStream(3), max_iterations=400)
+
+    def test_holds_when_hold_wins(self):
+        """Holding is chosen without searching once the target is reached."""
+        self.assertFalse(self.search.decide(20, 85, 10))
+        self.assertEqual(self.search.iterations, 0)
+
+    def test_rolls_at_turn_start(self):
+        """The first roll of a turn is never skipped."""
+        self.assertTrue(self.search.decide(0, 50, 50))
+        self.assertEqual(self.search.iterations, 400)
+
+    def test_holds_large_turn_total(self):
+        """A big unbanked turn total is held."""
+        self.assertFalse(self.search.decide(60, 0, 0))
+
+    def test_tree_reused_within_turn(self):
+        """The tree survives decisions of the same turn only."""
+        self.search.decide(8, 10, 20)
+        size = len(self.search.tree)
+        self.search.decide(15, 10, 20)
+        self.assertGreater(len(self.search.tree), size)
+        self.search.decide(8, 30, 20)
+        self.assertLessEqual(len(self.search.tree), 401)
+
+    def test_seeded_search_is_reproducible(self):
+        """Capped searches with the same seed make the same decisions."""
+        other = MonteCarloSearch(RngStream(3), max_iterations=400)
+        states = [(12, 30, 40), (18, 30, 40), (5, 70, 90)]
+        self.assertEqual(
+            [self.search.decide(*state) for state in states],
+            [other.decide(*state) for state in states],
+        )
+
+    def test_time_budget(self):
+        """An uncapped search stops once its budget is spent."""
+        search = MonteCarloSearch(RngStream(1), budget_ms=5)
+        search.decide(10, 0, 0)
+        self.assertGreater(search.iterations, 0)
+
+    def test_rollout_result(self):
+        """Rollouts report a win or a loss for the mover."""
+        for _ in range(50):
+            self.assertIn(self.search.rollout(40, 60, 0), (0.0, 1.0))
+        self.assertEqual(self.search.rollout(90, 0, 15), 1.0)
+
+    def test_node_selection(self):
+        """Unvisited actions are tried first and holds need a turn total."""
+        node = SearchNode()
+        self.assertTrue(node.select(True))
+        node.update(True, 1.0)
+        self.assertFalse(node.select(True))
+        self.assertTrue(node.select(False))
+
+    def test_intelligence_monte_carlo(self):
+        """Intelligence.monte_carlo maps the decision to 'y'/'n'."""
+        ai = Intelligence()
+        self.assertEqual(ai.monte_carlo(25, 80, 0, self.search), 'n')
+        self.assertEqual(ai.monte_carlo(0, 80, 0, self.search), 'y')
+
+
+if __name__ == "__main__":
+    unittest.main()
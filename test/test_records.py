@@ -0,0 +1,95 @@
+"""Unit tests for the compact player records."""
+
+import pickle
+import tracemalloc
+import unittest
+from dice.records import PlayerRecords
+
+
+def sample(number):
+    """Return the dict record of player ``number``."""
+    return {"Username": f"name{number % 50}", "Highscore": 100 + number,
+            "Games_Played": 3 * number, "Games_Won": 2 * number,
+            "Games_Lost": number}
+
+
+class TestPlayerRecords(unittest.TestCase):
+    """Test suite for PlayerRecords and RecordView."""
+
+    def setUp(self):
+        """Create records for three players."""
+        self.plain = {f"p{number}": sample(number) for number in range(3)}
+        self.records = PlayerRecords(self.plain)
+
+    def test_behaves_like_dict_of_dicts(self):
+        """Lookups, iteration and equality match the plain dicts."""
+        self.assertEqual(self.records, self.plain)
+        self.assertEqual(list(self.records), ["p0", "p1", "p2"])
+        self.assertEqual(self.records["p1"]["Highscore"], 101)
+        self.assertEqual(list(self.records["p2"].values()),
+                         list(self.plain["p2"].values()))
+        self.assertIn("p0", self.records)
+        self.assertNotIn("p9", self.records)
+        self.assertEqual(self.records.get("p9"), None)
+
+    def test_views_write_through(self):
+        """Updating a view changes the stored row."""
+        record = self.records["p0"]
+        record["Games_Won"] = record.get("Games_Won", 0) + 1
+        record["Username"] = "Zed"
+        self.assertEqual(self.records["p0"]["Games_Won"], 1)
+        self.assertEqual(self.records["p0"]["Username"], "Zed")
+        with self.assertRaises(TypeError):
+            del record["Highscore"]
+
+    def test_setdefault_returns_live_view(self):
+        """A new record added by setdefault can be updated in place."""
+        record = self.records.setdefault("new", {"Username": "N"})
+        record["Highscore"] = 7
+        self.assertEqual(dict(self.records["new"]), {
+            "Username": "N", "Highscore": 7, "Games_Played": 0,
+            "Games_Won": 0, "Games_Lost": 0
+        })
+
+    def test_delete_moves_last_row(self):
+        """Deleting keeps every other record intact."""
+        del self.records["p0"]
+        del self.plain["p0"]
+        self.assertEqual(self.records, self.plain)
+        self.records["p3"] = sample(3)
+        self.assertEqual(self.records["p3"]["Highscore"], 103)
+
+    def test_usernames_are_interned(self):
+        """Repeated names share one table entry."""
+        records = PlayerRecords(
+            {f"p{number}": sample(number) for number in range(200)}
+        )
+        self.assertEqual(len(records.names), 51)
+
+    def test_pickle_round_trip(self):
+        """Pickling keeps every record, name and lookup table."""
+        plain = {f"p{number}": sample(number) for number in range(1000)}
+        records = pickle.loads(pickle.dumps(PlayerRecords(plain)))
+        self.assertEqual(records, plain)
+        records["p5"]["Username"] = "name7"
+        self.assertEqual(len(records.names), 51)
+
+    def test_memory_per_player(self):
+        """Players cost a fraction of the memory of the dicts."""
+        ids = [f"player{number}" for number in range(20000)]
+        tracemalloc.start()
+        plain = {p_id: sample(number) for number, p_id in enumerate(ids)}
+        dict_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        tracemalloc.start()
+        records = PlayerRecords()
+        for number, p_id in enumerate(ids):
+            records[p_id] = sample(number)
+        compact_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        self.assertEqual(len(records), len(plain))
+        self.assertLess(compact_bytes * 4, dict_bytes)
+
+
+if __name__ == "__main__":
+    unittest.main()
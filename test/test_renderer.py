@@ -0,0 +1,58 @@
+"""Unit tests for the game output renderers."""
+
+import io
+import unittest
+from unittest.mock import patch
+from dice.dice_hand import OUTCOME_TABLE
+from dice.engine import GameEngine
+from dice.renderer import (
+    BufferedRenderer, Renderer, SilentRenderer, StructuredRenderer
+)
+
+
+class TestRenderers(unittest.TestCase):
+    """Test suite for the renderer classes."""
+
+    def test_plain_renderer_prints(self):
+        """The plain renderer writes each line at once."""
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            Renderer().write("hello")
+            self.assertEqual(stdout.getvalue(), "hello\n")
+
+    def test_buffered_renderer_writes_once(self):
+        """Lines are held until flush and written in one call."""
+        renderer = BufferedRenderer()
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            renderer.write("one")
+            renderer.write("two")
+            self.assertEqual(stdout.getvalue(), "")
+            with patch.object(stdout, "write",
+                              wraps=stdout.write) as write:
+                renderer.flush()
+                write.assert_called_once()
+            self.assertEqual(stdout.getvalue(), "one\ntwo\n")
+        self.assertEqual(renderer.lines, [])
+
+    def test_silent_renderer_drops_output(self):
+        """Nothing reaches the terminal."""
+        renderer = SilentRenderer()
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            renderer.write("hidden")
+            renderer.flush()
+            self.assertEqual(stdout.getvalue(), "")
+
+    def test_structured_renderer_emits_events(self):
+        """Engine events arrive as dictionaries."""
+        received = []
+        renderer = StructuredRenderer(received.append)
+        engine = GameEngine(["A", "B"])
+        engine.listeners.append(lambda event: renderer.event(event, engine))
+        engine.apply_roll(OUTCOME_TABLE[8])
+        self.assertEqual(received, [{
+            "event": "roll", "seat": 0, "player": "A", "turn_total": 5,
+            "score": 0, "faces": [2, 3],
+        }])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""Unit tests for the seedable RngStream used by dice and games."""
+
+import pickle
+import unittest
+from dice.rng import RngStream
+from dice.dice_hand import DiceHand
+
+
+class TestRngStream(unittest.TestCase):
+    """Test suite for RngStream."""
+
+    def test_same_seed_same_rolls(self):
+        """Two streams with the same seed produce the same rolls."""
+        first = RngStream(42)
+        second = RngStream(42)
+        self.assertEqual(
+            [first.randint(1, 6) for _ in range(50)],
+            [second.randint(1, 6) for _ in range(50)],
+        )
+
+    def test_replay_from_entropy(self):
+        """A stream recreated from its entropy and spawn key replays it."""
+        child = RngStream().spawn(3)[2]
+        replayed = RngStream.replay(child.entropy, child.spawn_key)
+        self.assertEqual(
+            [child.randint(1, 6) for _ in range(50)],
+            [replayed.randint(1, 6) for _ in range(50)],
+        )
+
+    def test_spawned_streams_differ(self):
+        """Spawned child streams are independent of each other."""
+        children = RngStream(7).spawn(4)
+        sequences = {
+            tuple(child.randint(1, 6) for _ in range(30))
+            for child in children
+        }
+        self.assertEqual(len(sequences), 4)
+        self.assertEqual(len({child.spawn_key for child in children}), 4)
+
+    def test_pickle_keeps_position(self):
+        """Unpickling a stream continues from where the original was."""
+        stream = RngStream(11)
+        stream.randint(1, 6)
+        stream.generator.integers(6)
+        copy = pickle.loads(pickle.dumps(stream))
+        self.assertEqual(copy.randint(1, 100), stream.randint(1, 100))
+        self.assertEqual(
+            copy.generator.integers(100), stream.generator.integers(100)
+        )
+
+    def test_bytes_round_trip(self):
+        """A stream restored from bytes continues both generators."""
+        stream = RngStream()
+        stream.spawn(2)
+        stream.gauss(0, 1)
+        stream.generator.integers(6)
+        copy = RngStream.from_bytes(stream.to_bytes())
+        self.assertEqual(copy.entropy, stream.entropy)
+        self.assertEqual(copy.gauss(0, 1), stream.gauss(0, 1))
+        self.assertEqual(
+            copy.generator.integers(100), stream.generator.integers(100)
+        )
+        self.assertEqual(copy.spawn(1)[0].spawn_key, (2,))
+
+    def test_restore_in_place(self):
+        """Dice sharing a stream follow it when it is restored."""
+        stream = RngStream(9)
+        hand = DiceHand(stream)
+        saved = stream.to_bytes()
+        rolls = [hand.roll() for _ in range(10)]
+        stream.restore(saved)
+        self.assertEqual([hand.roll() for _ in range(10)], rolls)
+
+    def test_dice_hand_reproducible(self):
+        """Dice hands seeded alike roll and batch-roll the same values."""
+        first = DiceHand(RngStream(3))
+        second = DiceHand(RngStream(3))
+        self.assertEqual(
+            [first.roll() for _ in range(20)],
+            [second.roll() for _ in range(20)],
+        )
+        self.assertEqual(
+            first.roll_batch(100)["face_values"].tolist(),
+            second.roll_batch(100)["face_values"].tolist(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
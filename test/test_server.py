@@ -0,0 +1,153 @@
+"""Unit tests for the asyncio game server."""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from dice.engine import Action
+from dice.rng import RngStream
+from dice.server import GameServer, ProtocolError, Session
+
+
+class Client:
+    """Local stand-in for a remote player speaking the line protocol."""
+
+    def __init__(self, reader, writer):
+        """Wrap an open connection."""
+        self.reader = reader
+        self.writer = writer
+
+    async def send(self, **message):
+        """Send one command and return the decoded reply."""
+        self.writer.write(json.dumps(message).encode() + b"\n")
+        await self.writer.drain()
+        return json.loads(await self.reader.readline())
+
+    async def close(self):
+        """Close the connection."""
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+class TestSession(unittest.TestCase):
+    """Test suite for Session."""
+
+    def test_computer_turn_hands_back(self):
+        """A computer turn always ends with the human to move or a winner."""
+        session = Session(RngStream(2))
+        session.new_match({"mode": "pvc", "level": "hard"})
+        session.engine.reset(first=1)
+        session.play_computer_turn()
+        engine = session.engine
+        self.assertTrue(engine.current == 0 or engine.winner == 1)
+
+    def test_rejects_out_of_turn_moves(self):
+        """Humans cannot act for the computer or before a match."""
+        session = Session(RngStream(2))
+        with self.assertRaises(ProtocolError):
+            session.human_action(Action.ROLL)
+        session.new_match({"mode": "pvc", "level": "easy"})
+        session.engine.reset(first=1)
+        with self.assertRaises(ProtocolError):
+            session.human_action(Action.ROLL)
+
+    def test_unknown_level(self):
+        """Unknown AI levels are reported as protocol errors."""
+        with self.assertRaises(ProtocolError):
+            Session(RngStream(2)).new_match({"mode": "pvc", "level": "x"})
+
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    """Test suite for GameServer over real local sockets."""
+
+    async def asyncSetUp(self):
+        """Start a seeded server on a free TCP port."""
+        self.server = GameServer(seed=5, idle_timeout=0.5)
+        listener = await self.server.start_tcp()
+        self.port = listener.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        """Stop the server."""
+        await self.server.close()
+
+    async def connect(self):
+        """Open a client connection to the server."""
+        return Client(*await asyncio.open_connection("127.0.0.1", self.port))
+
+    async def play_out(self, client):
+        """Roll to 20 then hold until the match ends; return final state."""
+        reply = await client.send(cmd="new", mode="pvc", level="mid")
+        state = reply["state"]
+        while state["winner"] is None:
+            if "hold" in state["actions"] and state["turn_total"] >= 20:
+                reply = await client.send(cmd="hold")
+            else:
+                reply = await client.send(cmd="roll")
+            state = reply["state"]
+        await client.send(cmd="quit")
+        await client.close()
+        return state
+
+    async def test_concurrent_matches_finish(self):
+        """Many simultaneous sessions each play to a winner."""
+        clients = [await self.connect() for _ in range(20)]
+        states = await asyncio.gather(*(self.play_out(c) for c in clients))
+        for state in states:
+            self.assertGreaterEqual(max(state["scores"]), 100)
+        self.assertEqual(len(self.server.sessions), 0)
+
+    async def test_pvp_hot_seat(self):
+        """Both PvP seats are played from one connection."""
+        client = await self.connect()
+        reply = await client.send(cmd="new", mode="pvp", names=["Ann", "Bob"])
+        self.assertEqual(reply["state"]["players"], ["Ann", "Bob"])
+        self.assertEqual(reply["events"][0]["event"], "restart")
+        while reply["state"]["current"] == 0:
+            reply = await client.send(cmd="roll")
+            if "hold" in reply["state"]["actions"]:
+                reply = await client.send(cmd="hold")
+        self.assertEqual(reply["state"]["turn_total"], 0)
+        await client.close()
+
+    async def test_errors_keep_connection(self):
+        """Bad commands get an error reply and the session continues."""
+        client = await self.connect()
+        self.assertIn("error", await client.send(cmd="roll"))
+        self.assertIn("error", await client.send(cmd="dance"))
+        self.assertIn("error", await client.send(cmd="new", names=5))
+        self.assertIn("error", await client.send(cmd="new", names=[["A"]]))
+        self.assertIn("error", await client.send(cmd="new", level=["hard"]))
+        self.assertIn("error", await client.send(cmd=["state"]))
+        reply = await client.send(cmd="state")
+        self.assertIsNone(reply["state"])
+        await client.close()
+
+    async def test_idle_timeout(self):
+        """Silent clients are told and disconnected."""
+        client = await self.connect()
+        reply = json.loads(await client.reader.readline())
+        self.assertEqual(reply, {"error": "idle timeout"})
+        self.assertEqual(await client.reader.readline(), b"")
+        await client.close()
+
+
+@unittest.skipUnless(hasattr(asyncio, "start_unix_server"), "needs Unix")
+class TestUnixSocket(unittest.IsolatedAsyncioTestCase):
+    """Test suite for serving on a Unix socket."""
+
+    async def test_unix_socket(self):
+        """The same protocol works over a Unix socket."""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "pig.sock")
+            server = GameServer(seed=1)
+            await server.start_unix(path)
+            client = Client(*await asyncio.open_unix_connection(path))
+            reply = await client.send(cmd="new", mode="pvc", level="easy")
+            self.assertEqual(reply["state"]["players"][1], "Jarvis AI")
+            await client.close()
+            await server.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""Unit tests for the headless AI-vs-AI simulation engine."""
+
+import unittest
+from unittest.mock import MagicMock
+from dice.dice_hand import OUTCOME_TABLE, DiceHand
+from dice.engine import Action, GameEngine, Phase
+from dice.rng import RngStream
+from dice.simulation import (
+    MatchupResult, make_decider, play_game, play_turn, run_tournament,
+    simulate
+)
+
+
+def hand_rolling(*pairs):
+    """Return a mock DiceHand that rolls the given (left, right) pairs."""
+    hand = MagicMock()
+    hand.evaluate_roll.side_effect = [
+        OUTCOME_TABLE[left * 6 + right - 7] for left, right in pairs
+    ]
+    return hand
+
+
+class TestSimulation(unittest.TestCase):
+    """Test suite for the simulation module."""
+
+    def test_play_turn_holds(self):
+        """A normal roll is banked when the decider holds."""
+        hand = hand_rolling((2, 5))
+        self.assertEqual(play_turn(hand, lambda *_: False, 10, 0), 17)
+
+    def test_play_turn_forced_reroll(self):
+        """A pair is rolled again without asking the decider."""
+        decide = MagicMock(return_value=False)
+        hand = hand_rolling((4, 4), (3, 2))
+        self.assertEqual(play_turn(hand, decide, 0, 0), 13)
+        decide.assert_called_once_with(13, 0, 0)
+
+    def test_play_turn_bust_and_snake_eyes(self):
+        """A single one keeps the score, snake eyes reset it."""
+        self.assertEqual(
+            play_turn(hand_rolling((3, 5), (1, 6)), lambda *_: True, 40, 0),
+            40
+        )
+        self.assertEqual(
+            play_turn(hand_rolling((1, 1)), lambda *_: True, 40, 0), 0
+        )
+
+    def test_play_game_reaches_target(self):
+        """A game ends once a seat banks at least 100 points."""
+        hand = hand_rolling(*[(6, 5)] * 19)
+        winner, turns, scores = play_game(
+            hand, (lambda *_: False, lambda *_: False), first=1
+        )
+        self.assertEqual(winner, 1)
+        self.assertEqual(turns, 19)
+        self.assertEqual(scores, [99, 110])
+
+    def test_play_game_matches_engine(self):
+        """The simulator and GameEngine give the same game for the same dice."""
+        winner, turns, scores = play_game(
+            DiceHand(RngStream(8)),
+            (make_decider("hard"), make_decider("optimal"))
+        )
+        engine = GameEngine(["hard", "optimal"], DiceHand(RngStream(8)))
+        deciders = (make_decider("hard"), make_decider("optimal"))
+        engine.reset()
+        engine_turns = 1
+        while engine.winner is None:
+            seat = engine.current
+            if engine.phase == Phase.TURN_OVER:
+                engine.next_turn()
+                engine_turns += 1
+            elif engine.phase == Phase.MAY_HOLD and not deciders[seat](
+                    engine.turn_total, engine.scores[seat],
+                    engine.scores[1 - seat]):
+                engine.hold()
+            else:
+                engine.step(Action.ROLL)
+        self.assertEqual((winner, turns, scores),
+                         (engine.winner, engine_turns, list(engine.scores)))
+
+    def test_mcts_level_leaves_dice_stream_alone(self):
+        """The MCTS decider spawns its own stream from the caller's."""
+        stream = RngStream(3)
+        decide = make_decider("mcts", stream)
+        self.assertFalse(decide(30, 80, 0))
+        self.assertEqual(stream.random(), RngStream(3).random())
+
+    def test_unknown_level(self):
+        """Unknown AI levels are rejected."""
+        with self.assertRaises(ValueError):
+            make_decider("impossible")
+
+    def test_simulate_reproducible_across_workers(self):
+        """The same seed gives the same counts for any worker count."""
+        single = simulate(("easy", "hard"), 300, workers=1, seed=8,
+                          chunk_size=100)
+        pooled = simulate(("easy", "hard"), 300, workers=2, seed=8,
+                          chunk_size=100)
+        self.assertEqual(single.games, 300)
+        self.assertEqual(single.wins, pooled.wins)
+        self.assertEqual(single.turns, pooled.turns)
+        self.assertEqual(sum(single.wins), 300)
+
+    def test_result_statistics(self):
+        """Rates, intervals and averages are derived from the counters."""
+        result = MatchupResult(("easy", "mid"))
+        result.games, result.wins, result.turns = 100, [60, 40], 2500
+        result.first_mover_wins, result.seconds = 55, 2.0
+        low, high = result.confidence_interval(0)
+        self.assertLess(low, 0.6)
+        self.assertGreater(high, 0.6)
+        self.assertEqual(result.mean_game_length, 25)
+        self.assertEqual(result.first_mover_win_rate, 0.55)
+        self.assertEqual(result.games_per_second, 50)
+        self.assertIn("easy vs mid", result.report())
+
+    def test_record_score_distribution(self):
+        """Recorded games fill the final score buckets of both seats."""
+        result = MatchupResult(("easy", "mid"))
+        result.record(1, 0, 20, [42, 104])
+        result.record(0, 0, 30, [100, 7])
+        self.assertEqual(result.mean_score(0), 71)
+        self.assertEqual(result.score_distribution(0)[4], 0.5)
+        self.assertEqual(result.score_distribution(0)[-1], 0.5)
+        self.assertEqual(result.score_distribution(1)[0], 0.5)
+        other = MatchupResult(("easy", "mid"))
+        other.merge(result)
+        self.assertEqual(other.score_counts, result.score_counts)
+        self.assertIn("100+", other.report())
+
+    def test_run_tournament_pairs_every_level(self):
+        """Every pair of levels plays one matchup."""
+        results = run_tournament(["easy", "mid", "hard"], 20, seed=1)
+        self.assertEqual(
+            [result.levels for result in results],
+            [("easy", "mid"), ("easy", "hard"), ("mid", "hard")]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""Unit tests for binary snapshots of games in progress."""
+
+import unittest
+from dice.engine import GameEngine, Phase
+from dice.intelligence import MidState
+from dice.rng import RngStream
+from dice.snapshot import dumps, loads
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test suite for dumps and loads."""
+
+    def test_round_trip(self):
+        """Every field of a game in progress survives a round trip."""
+        engine = GameEngine(["Åsa", "Jarvis AI", "Bob"])
+        engine.scores[0], engine.scores[2] = 42, 77
+        engine.current, engine.turn_total = 2, 18
+        engine.phase = Phase.MAY_HOLD
+        state = MidState()
+        state.turn_count = 3
+        state.seen_scores = {10, 35}
+        rng = RngStream(5).to_bytes()
+        data = dumps(engine, [None, "2", None], ["asa1", None, "bob7"],
+                     [None, state, None], rng)
+        saved = loads(data)
+        self.assertEqual(saved.players, ["Åsa", "Jarvis AI", "Bob"])
+        self.assertEqual(saved.scores, [42, 0, 77])
+        self.assertEqual(saved.levels, [None, "2", None])
+        self.assertEqual(saved.user_ids, ["asa1", None, "bob7"])
+        self.assertEqual((saved.current, saved.turn_total), (2, 18))
+        self.assertEqual(saved.phase, Phase.MAY_HOLD)
+        self.assertIsNone(saved.winner)
+        self.assertEqual(saved.ai_states[1].turn_count, 3)
+        self.assertEqual(saved.ai_states[1].seen_scores, {10, 35})
+        self.assertEqual(saved.rng_state, rng)
+        self.assertLess(len(data) - len(rng), 100)
+
+    def test_negative_turn_count(self):
+        """A medium-level counter below zero is saved as is."""
+        state = MidState()
+        state.turn_count = -3
+        data = dumps(GameEngine(["A", "B"]), [None, "2"], [None, None],
+                     [None, state], b"rng")
+        self.assertEqual(loads(data).ai_states[1].turn_count, -3)
+
+    def test_rejects_truncated_data(self):
+        """Every cut-off snapshot raises ValueError."""
+        state = MidState()
+        state.seen_scores = {12}
+        data = dumps(GameEngine(["Ann", "Bob"]), [None, "2"], ["a1", None],
+                     [None, state], b"rng")
+        for size in range(len(data)):
+            with self.assertRaises(ValueError):
+                loads(data[:size])
+
+    def test_rejects_other_data(self):
+        """Bytes that are not a snapshot are refused."""
+        with self.assertRaises(ValueError):
+            loads(b"PIGL\x01\x00")
+
+
+if __name__ == "__main__":
+    unittest.main()
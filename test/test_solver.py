@@ -0,0 +1,110 @@
+"""
+Unit tests for the Two-Dice Pig value-iteration solver.
+
+A small target score keeps the solve fast while exercising every rule.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+from dice.dice_hand import OUTCOME_TABLE, Outcome
+from dice.intelligence import Intelligence
+from dice.solver import load_or_solve, solve, OptimalPolicy
+
+TARGET = 20
+
+
+class TestSolver(unittest.TestCase):
+    """Test suite for solve() and OptimalPolicy."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Solve the small game once for all tests."""
+        cls.policy = solve(TARGET)
+
+    def win(self, score, opponent, turn_total):
+        """Return the solved win probability, counting banked wins as 1."""
+        return self.policy.chance_to_win(score, opponent, turn_total)
+
+    def roll_value(self, score, opponent, turn_total):
+        """Recompute the value of rolling once from the solved tables."""
+        value = 0.0
+        rerolls = 0
+        for entry in OUTCOME_TABLE:
+            outcome = entry["outcome"]
+            new_total = turn_total + entry["total"]
+            if outcome == Outcome.SNAKE_EYES:
+                value += 1 - self.win(opponent, 0, 0)
+            elif outcome == Outcome.BUST:
+                value += 1 - self.win(opponent, score, 0)
+            elif outcome != Outcome.REROLL:
+                value += self.win(score, opponent, new_total)
+            elif score + turn_total >= TARGET:
+                # A forced reroll past the target repeats the same value.
+                rerolls += 1
+            else:
+                value += self.roll_value(score, opponent, new_total)
+        return value / (len(OUTCOME_TABLE) - rerolls)
+
+    def test_tables_shape_and_range(self):
+        """Tables cover every state and hold probabilities."""
+        self.assertEqual(
+            self.policy.win_probability.shape, (TARGET, TARGET, TARGET + 12)
+        )
+        self.assertGreaterEqual(self.policy.win_probability.min(), 0.0)
+        self.assertLessEqual(self.policy.win_probability.max(), 1.0)
+
+    def test_first_mover_advantage(self):
+        """The player who starts has better than even chances."""
+        self.assertGreater(self.win(0, 0, 0), 0.5)
+
+    def test_bellman_consistency(self):
+        """Every state's value is the best of rolling and holding."""
+        for score in range(0, TARGET, 3):
+            for opponent in range(0, TARGET, 4):
+                for turn_total in range(1, TARGET - score):
+                    rolled = self.roll_value(score, opponent, turn_total)
+                    held = 1 - self.win(opponent, score + turn_total, 0)
+                    self.assertAlmostEqual(
+                        self.win(score, opponent, turn_total),
+                        max(rolled, held), places=5
+                    )
+                    if self.policy.should_roll(score, opponent, turn_total):
+                        self.assertGreaterEqual(rolled, held - 1e-6)
+
+    def test_holds_when_hold_wins(self):
+        """Holding is chosen once the turn total reaches the target."""
+        self.assertFalse(self.policy.should_roll(15, 10, 5))
+        self.assertFalse(self.policy.should_roll(0, 0, TARGET + 4))
+        self.assertEqual(self.win(15, 10, 5), 1.0)
+
+    def test_intelligence_optimal(self):
+        """Intelligence.optimal answers from the policy table."""
+        with patch("dice.intelligence.optimal_policy",
+                   return_value=self.policy):
+            ai = Intelligence()
+            expected = self.policy.should_roll(3, 7, 9)
+            self.assertEqual(ai.optimal(9, 3, 7), 'y' if expected else 'n')
+            self.assertEqual(ai.optimal(6, 14, 0), 'n')
+            self.assertIsInstance(self.policy, OptimalPolicy)
+
+    def test_load_or_solve_persists(self):
+        """Solved tables are stored once and memory-mapped afterwards."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "policy.bin")
+            with patch("dice.solver.solve", return_value=self.policy) as fake:
+                first = load_or_solve(path, TARGET)
+                second = load_or_solve(path, TARGET)
+            fake.assert_called_once_with(TARGET)
+            self.assertTrue(os.path.exists(path))
+            self.assertFalse(second.policy.flags.writeable)
+            np.testing.assert_array_equal(first.policy, self.policy.policy)
+            np.testing.assert_array_equal(
+                second.win_probability, self.policy.win_probability
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Unit tests for the process-wide stats cache."""
+
+import os
+import unittest
+from unittest.mock import patch
+from test.stats_helpers import StatsTestCase
+from dice import stats_cache
+from dice.histogram import Histogram
+
+
+class TestStatsCache(StatsTestCase):
+    """Test suite for the shared histogram and leaderboard."""
+
+    def setUp(self):
+        """Create a stats file in a temporary folder."""
+        stats_cache.clear()
+        self.addCleanup(stats_cache.clear)
+        super().setUp()
+        self.board_path = os.path.join(self.folder, "leaderboard.ser")
+
+    def test_one_instance_per_file(self):
+        """Consumers share one histogram that is loaded once."""
+        first = stats_cache.histogram(self.path)
+        first.update_username("p1", "Ann")
+        with patch.object(Histogram, "load_stats_file") as load:
+            second = stats_cache.histogram(self.path)
+        load.assert_not_called()
+        self.assertIs(first, second)
+        self.assertEqual(second.get_username("p1"), "Ann")
+
+    def test_reload_after_other_process_saves(self):
+        """A save through another instance makes the cache reload."""
+        shared = stats_cache.histogram(self.path)
+        shared.increment_games_played("p1")
+        shared.save_stats()
+        other = Histogram(self.path)
+        other.increment_games_won("p1")
+        other.save_stats()
+        self.assertTrue(shared.refresh())
+        self.assertEqual(shared.details["p1"]["Games_Won"], 1)
+        self.assertFalse(shared.refresh())
+
+    def test_own_saves_do_not_reload(self):
+        """Saving and compacting through the cache keeps it current."""
+        shared = stats_cache.histogram(self.path)
+        for game in range(3):
+            shared.increment_games_played(f"p{game}")
+            shared.save_stats()
+        shared.compact(wait=True)
+        self.assertFalse(shared.refresh())
+
+    def test_unsaved_changes_are_kept(self):
+        """The cache is not reloaded over changes not yet saved."""
+        shared = stats_cache.histogram(self.path)
+        shared.increment_games_played("p1")
+        other = Histogram(self.path)
+        other.increment_games_played("p2")
+        other.save_stats()
+        self.assertFalse(shared.refresh())
+        self.assertIn("p1", shared.details)
+
+    def test_leaderboard_follows_shared_histogram(self):
+        """The shared leaderboard is attached once to the shared stats."""
+        board = stats_cache.leaderboard(self.board_path, self.path)
+        self.assertIs(stats_cache.leaderboard(self.board_path, self.path),
+                      board)
+        stats = stats_cache.histogram(self.path)
+        self.assertEqual(stats.listeners, [board.update])
+        stats.check_highscore("p1", 64)
+        stats.save_stats()
+        self.assertEqual(board.top("highscore")[0][::2], ("p1", 64))
+
+
+if __name__ == "__main__":
+    unittest.main()
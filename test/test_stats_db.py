@@ -0,0 +1,110 @@
+"""Unit tests for the SQLite player stats store."""
+
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from dice.stats_db import (
+    SqliteHistogram, SqlitePlayer, connect, migrate
+)
+
+
+class TestStatsDb(unittest.TestCase):
+    """Test suite for SqliteHistogram, SqlitePlayer and migrate."""
+
+    def setUp(self):
+        """Create a database path in a temporary folder."""
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder)
+        self.path = os.path.join(self.folder, "stats.db")
+
+    def test_schema_uses_wal_and_indexes(self):
+        """The database is in WAL mode with the lookup indexes."""
+        connection = connect(self.path)
+        mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+        indexes = {row[1] for row in connection.execute(
+            "PRAGMA index_list(players)")}
+        connection.close()
+        self.assertEqual(mode, "wal")
+        self.assertTrue({"players_username", "players_highscore",
+                         "players_games_won"} <= indexes)
+
+    def test_match_saved_and_reloaded(self):
+        """Saved updates are visible to a new histogram."""
+        hist = SqliteHistogram(self.path)
+        hist.update_username("p1", "Ann")
+        hist.increment_games_played("p1")
+        hist.increment_games_won("p1")
+        hist.check_highscore("p1", 104)
+        hist.save_stats()
+        other = SqliteHistogram(self.path)
+        self.assertEqual(other.get_username("p1"), "Ann")
+        self.assertEqual(other.load_stats_file()["p1"], {
+            "Username": "Ann", "Highscore": 104, "Games_Played": 1,
+            "Games_Won": 1, "Games_Lost": 0
+        })
+
+    def test_counters_merge_across_writers(self):
+        """Two writers on one record both keep their games."""
+        first = SqliteHistogram(self.path)
+        second = SqliteHistogram(self.path)
+        for hist, score in ((first, 30), (second, 70)):
+            hist.increment_games_played("p1")
+            hist.increment_games_lost("p1")
+            hist.check_highscore("p1", score)
+        first.save_stats()
+        second.save_stats()
+        record = SqliteHistogram(self.path).load_stats_file()["p1"]
+        self.assertEqual(record["Games_Played"], 2)
+        self.assertEqual(record["Games_Lost"], 2)
+        self.assertEqual(record["Highscore"], 70)
+
+    def test_failed_batch_writes_nothing(self):
+        """A batch that raises leaves the database untouched."""
+        hist = SqliteHistogram(self.path)
+        with self.assertRaises(KeyError), hist.batch():
+            hist.increment_games_played("p1")
+            hist.get_username("missing")
+        self.assertEqual(hist.load_stats_file(), {})
+        self.assertNotIn("p1", hist.details)
+
+    def test_top_players(self):
+        """Players are ranked by an indexed column."""
+        hist = SqliteHistogram(self.path)
+        for p_id, won in (("a", 3), ("b", 9), ("c", 5)):
+            hist.record_results(p_id, won, 1, 10 * won)
+        hist.save_stats()
+        self.assertEqual([p_id for p_id, _ in hist.top("games_won", 2)],
+                         ["b", "c"])
+        with self.assertRaises(ValueError):
+            hist.top("username")
+
+    def test_player_ids_live_in_database(self):
+        """Registered IDs are shared through the database."""
+        player = SqlitePlayer(self.path)
+        player.set_id("X1")
+        ids = SqlitePlayer(self.path).get_user_id_list()
+        self.assertIn("X1", ids)
+        self.assertNotIn("Y2", ids)
+        self.assertEqual(list(ids), ["X1"])
+        self.assertEqual(len(ids), 1)
+
+    def test_migrate_from_pickles(self):
+        """Migration copies every record and every registered ID."""
+        stats_path = os.path.join(self.folder, "history.ser")
+        ids_path = os.path.join(self.folder, "user_id.ser")
+        with open(stats_path, "wb") as file:
+            pickle.dump({"p1": {"Username": "Ann", "Highscore": 40,
+                                "Games_Played": 2, "Games_Won": 1,
+                                "Games_Lost": 1}}, file)
+        with open(ids_path, "wb") as file:
+            pickle.dump({"p1", "p2"}, file)
+        self.assertEqual(migrate(self.path, stats_path, ids_path), 2)
+        stats = SqliteHistogram(self.path).load_stats_file()
+        self.assertEqual(stats["p1"]["Games_Won"], 1)
+        self.assertEqual(stats["p2"]["Username"], "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""Unit tests for the memory-mapped AI table store."""
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from dice.table_store import HEADER, load_tables, save_tables
+
+
+class TestTableStore(unittest.TestCase):
+    """Test suite for save_tables() and load_tables()."""
+
+    def setUp(self):
+        """Write a small table file into a temporary directory."""
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.path = os.path.join(self.tmp, "tables.bin")
+        self.arrays = {
+            "policy": np.arange(24, dtype=np.uint8).reshape(2, 3, 4),
+            "win_probability": np.linspace(0, 1, 30, dtype=np.float32),
+        }
+        save_tables(self.path, 100, 1234, self.arrays)
+
+    def test_round_trip(self):
+        """Stored arrays load back with the same dtype, shape and values."""
+        tables = load_tables(self.path, 100, 1234)
+        self.assertEqual(set(tables), set(self.arrays))
+        for name, array in self.arrays.items():
+            self.assertEqual(tables[name].dtype, array.dtype)
+            np.testing.assert_array_equal(tables[name], array)
+
+    def test_tables_are_read_only(self):
+        """Mapped arrays cannot be modified in place."""
+        tables = load_tables(self.path, 100, 1234)
+        with self.assertRaises(ValueError):
+            tables["policy"][0, 0, 0] = 1
+
+    def test_stale_parameters(self):
+        """Tables built for another target or rule set are rejected."""
+        self.assertIsNone(load_tables(self.path, 50, 1234))
+        self.assertIsNone(load_tables(self.path, 100, 4321))
+
+    def flip_byte(self, offset, whence=os.SEEK_SET):
+        """Invert one byte of the table file."""
+        with open(self.path, "r+b") as f:
+            f.seek(offset, whence)
+            byte = f.read(1)
+            f.seek(offset, whence)
+            f.write(bytes([byte[0] ^ 0xFF]))
+
+    def test_checksum_detects_damage(self):
+        """A corrupted payload is rejected when verification is requested."""
+        self.flip_byte(-1, os.SEEK_END)
+        self.assertIsNone(load_tables(self.path, 100, 1234, verify=True))
+        self.assertIsNotNone(load_tables(self.path, 100, 1234))
+
+    def test_damaged_index(self):
+        """A corrupted header or entry table is rejected on every load."""
+        for offset in (HEADER.size - 1, HEADER.size + 20):
+            self.flip_byte(offset)
+            self.assertIsNone(load_tables(self.path, 100, 1234))
+            self.flip_byte(offset)
+        with open(self.path, "r+b") as f:
+            f.truncate(HEADER.size + 3)
+        self.assertIsNone(load_tables(self.path, 100, 1234))
+
+    def test_missing_file(self):
+        """A missing or empty file is reported as absent."""
+        self.assertIsNone(load_tables(self.path + ".missing", 100, 1234))
+        with open(self.path, "wb"):
+            pass
+        self.assertIsNone(load_tables(self.path, 100, 1234))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""Unit tests for the tournament scheduler."""
+
+import unittest
+from itertools import chain
+from unittest.mock import MagicMock, call, patch
+from dice.simulation import MatchupResult
+from dice.tournament import (
+    BYE, ROUND_ROBIN, SWISS, Entrant, Standing, Tournament,
+    round_robin_rounds, swiss_pairings
+)
+
+
+def field(*levels):
+    """Return one entrant with a user ID per level."""
+    return [Entrant(f"{level}-{number}", level, f"id-{number}")
+            for number, level in enumerate(levels)]
+
+
+class TestTournament(unittest.TestCase):
+    """Test suite for pairings, standings and saving."""
+
+    def test_round_robin_meets_everyone_once(self):
+        """Every pair appears exactly once and nobody plays twice a round."""
+        for count in (4, 5):
+            rounds = round_robin_rounds(count)
+            pairs = [frozenset(pair) for pair in chain(*rounds)]
+            self.assertEqual(len(pairs), count * (count - 1) // 2)
+            self.assertEqual(len(set(pairs)), len(pairs))
+            for pairings in rounds:
+                seats = list(chain(*pairings))
+                self.assertEqual(len(seats), len(set(seats)))
+
+    def test_swiss_avoids_rematches_and_repeat_byes(self):
+        """Swiss pairs new opponents and gives the bye to someone new."""
+        standings = [Standing(entrant)
+                     for entrant in field("easy", "mid", "hard")]
+        standings[0].opponents.update({1, BYE})
+        standings[1].opponents.add(0)
+        pairings, bye = swiss_pairings(standings)
+        self.assertNotEqual(bye, 0)
+        self.assertEqual(len(pairings), 1)
+        self.assertNotEqual(set(pairings[0]), {0, 1})
+
+    def test_record_scores_match(self):
+        """The match winner gets a point and both get their games."""
+        tournament = Tournament(field("easy", "hard"))
+        result = MatchupResult(("easy", "hard"))
+        result.wins = [3, 7]
+        result.high_scores = [90, 110]
+        tournament.record((0, 1), result)
+        loser, winner = tournament.standings
+        self.assertEqual((winner.points, winner.wins), (1, 1))
+        self.assertEqual((loser.games_won, loser.games_lost), (3, 7))
+        self.assertEqual(winner.high_score, 110)
+        self.assertIs(tournament.ranking()[0], winner)
+
+    def test_seeded_tournament_is_reproducible(self):
+        """The same seed gives the same table and streams every match."""
+        tables = []
+        for _ in range(2):
+            tournament = Tournament(field("easy", "mid", "hard"),
+                                    ROUND_ROBIN, 10, seed=5)
+            reports = list(tournament.play())
+            self.assertEqual(len(reports), 3)
+            tables.append(tournament.table())
+        self.assertEqual(tables[0], tables[1])
+
+    @patch("dice.tournament.MATCH_CHUNK", 3)
+    def test_chunked_pool_matches_serial_play(self):
+        """Chunked matches on a pool give the serial table for a seed."""
+        tables = []
+        for workers in (1, 2):
+            tournament = Tournament(field("easy", "mid", "hard"),
+                                    ROUND_ROBIN, 10, seed=5)
+            reports = list(tournament.play(workers))
+            self.assertEqual([report.result.games for report in reports],
+                             [10, 10, 10])
+            tables.append(tournament.table())
+        self.assertEqual(tables[0], tables[1])
+
+    def test_swiss_round_count(self):
+        """Swiss plays enough rounds to separate the field by default."""
+        tournament = Tournament(field("easy", "mid", "hard", "easy", "mid"),
+                                SWISS, 4, seed=2)
+        self.assertEqual(tournament.rounds, 3)
+        reports = list(tournament.play())
+        self.assertEqual({report.round for report in reports}, {1, 2, 3})
+
+    def test_save_writes_histogram_once(self):
+        """Saving updates each entrant once and saves the stats once."""
+        tournament = Tournament(field("easy", "hard"), games_per_match=6,
+                                seed=1)
+        list(tournament.play())
+        histogram = MagicMock()
+        tournament.save(histogram)
+        first, second = tournament.standings
+        histogram.record_results.assert_has_calls([
+            call("id-0", first.games_won, first.games_lost,
+                 first.high_score),
+            call("id-1", second.games_won, second.games_lost,
+                 second.high_score),
+        ])
+        histogram.save_stats.assert_called_once()
+
+    def test_rejects_bad_setup(self):
+        """Unknown formats, levels and tiny fields are refused."""
+        with self.assertRaises(ValueError):
+            Tournament(field("easy", "hard"), "knockout")
+        with self.assertRaises(ValueError):
+            Tournament(field("easy"))
+        with self.assertRaises(ValueError):
+            Tournament([Entrant("x", "genius"), Entrant("y", "easy")])
+        with self.assertRaises(ValueError):
+            Tournament(field("easy", "hard"), games_per_match=0)
+
+
+if __name__ == "__main__":
+    unittest.main()